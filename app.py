@@ -1,10 +1,7 @@
 import streamlit as st
 import firebase_admin
-from firebase_admin import credentials, firestore
+from firebase_admin import credentials
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import numpy as np
 from datetime import datetime, timedelta
 import re
@@ -13,6 +10,19 @@ import streamlit.components.v1 as components
 import os
 import json
 import base64
+from concurrent.futures import ThreadPoolExecutor
+
+from charts import CHART_SPECS, bar_chart, radar_chart, section_html, spec_chart
+from column_groups import COLUMN_GROUPS, PAGE_COLUMNS, groups_for
+from dataset_store import DatasetStore
+from firebase_client import get_firestore_client
+from resilience import CircuitBreaker, RetryPolicy
+from response_listener import ResponseListener
+from response_sync import WATERMARK_FIELDS, ResponseSync
+from snapshot_store import SnapshotStore
+from static_assets import absolute_asset_url, asset_exists, asset_path, asset_url, read_asset
+from survey_aggregates import compute_aggregates
+from survey_schema import normalize_responses
 
 # Load environment variables from .env file for local development
 try:
@@ -21,6 +31,11 @@ try:
 except ImportError:
     pass  # dotenv not installed, continue without it
 
+# The dataset stores hand every session a shallow view of one shared frame,
+# which needs Copy-on-Write (always on from pandas 3.0)
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
 # Page configuration
 st.set_page_config(
     page_title="SheSpeaks Pulse",
@@ -64,7 +79,7 @@ if not firebase_admin._apps:
 
         if service_account_info:
             cred = credentials.Certificate(service_account_info)
-            firebase_admin.initialize_app(cred)
+            get_firestore_client(cred)
         else:
             raise RuntimeError("Missing Firebase Admin credentials")
             
@@ -94,415 +109,195 @@ if not firebase_admin._apps:
         """)
         st.stop()
 
-# Firestore DB
-db = firestore.client()
+# Firestore DB, shared by every session and pre-warmed in the background
+db = get_firestore_client()
 
-# Modern Professional CSS with bright colors, animations, and gradients
-st.markdown("""
-<style>
-    /* Modern Professional Theme */
-    .main {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-    }
-    
-    /* Navbar Styling */
-    .navbar {
-        background: rgba(255, 255, 255, 0.98);
-        backdrop-filter: blur(20px);
-        border-bottom: 2px solid #e91e63;
-        padding: 1.5rem 0;
-        margin-bottom: 3rem;
-        box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-        animation: slideDown 0.8s ease-out;
-    }
-    
-    @keyframes slideDown {
-        from { transform: translateY(-100%); opacity: 0; }
-        to { transform: translateY(0); opacity: 1; }
-    }
-    
-    .nav-item {
-        display: inline-block;
-        margin: 0 0.8rem;
-        padding: 0.8rem 1.5rem;
-        border-radius: 50px;
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-        text-decoration: none;
-        color: #333;
-        font-weight: 600;
-        font-size: 0.95rem;
-        position: relative;
-        overflow: hidden;
-        animation: fadeInUp 0.6s ease-out;
-    }
-    
-    @keyframes fadeInUp {
-        from { transform: translateY(30px); opacity: 0; }
-        to { transform: translateY(0); opacity: 1; }
-    }
-    
-    .nav-item:hover {
-        background: linear-gradient(45deg, #e91e63, #ff6b9d);
-        color: white;
-        transform: translateY(-3px) scale(1.05);
-        box-shadow: 0 8px 25px rgba(233, 30, 99, 0.4);
-    }
-    
-    .nav-item.active {
-        background: linear-gradient(45deg, #e91e63, #ff6b9d);
-        color: white;
-        box-shadow: 0 8px 25px rgba(233, 30, 99, 0.4);
-        animation: pulse 2s infinite;
-    }
-    
-    @keyframes pulse {
-        0% { box-shadow: 0 8px 25px rgba(233, 30, 99, 0.4); }
-        50% { box-shadow: 0 8px 25px rgba(233, 30, 99, 0.6); }
-        100% { box-shadow: 0 8px 25px rgba(233, 30, 99, 0.4); }
-    }
-    
-    /* Card Styling */
-    .metric-card {
-        background: linear-gradient(135deg, rgba(255, 255, 255, 0.95), rgba(255, 255, 255, 0.9));
-        border-radius: 25px;
-        padding: 2rem;
-        box-shadow: 0 15px 35px rgba(0,0,0,0.1);
-        backdrop-filter: blur(10px);
-        border: 1px solid rgba(255, 255, 255, 0.2);
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-        position: relative;
-        overflow: hidden;
-        animation: fadeInScale 0.8s ease-out;
-    }
-    
-    @keyframes fadeInScale {
-        from { transform: scale(0.9); opacity: 0; }
-        to { transform: scale(1); opacity: 1; }
-    }
-    
-    .metric-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 4px;
-        background: linear-gradient(90deg, #e91e63, #ff6b9d, #9c27b0, #673ab7);
-        animation: gradientShift 3s ease-in-out infinite;
-    }
-    
-    @keyframes gradientShift {
-        0% { background-position: 0% 50%; }
-        50% { background-position: 100% 50%; }
-        100% { background-position: 0% 50%; }
-    }
-    
-    .metric-card:hover {
-        transform: translateY(-8px) scale(1.02);
-        box-shadow: 0 25px 50px rgba(0,0,0,0.15);
-    }
-    
-    .metric-card:hover::before {
-        animation: gradientShift 1s ease-in-out infinite;
-    }
-    
-    /* Custom Streamlit Elements */
-    .stButton > button {
-        border-radius: 50px;
-        background: linear-gradient(45deg, #e91e63, #ff6b9d);
-        border: none;
-        color: white;
-        font-weight: 700;
-        padding: 0.8rem 2.5rem;
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-        font-size: 1rem;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .stButton > button::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, rgba(255,255,255,0.2), transparent);
-        transition: left 0.5s;
-    }
-    
-    .stButton > button:hover::before {
-        left: 100%;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-3px) scale(1.05);
-        box-shadow: 0 12px 30px rgba(233, 30, 99, 0.5);
-        background: linear-gradient(45deg, #d81b60, #e91e63);
-    }
-    
-    /* Hide Streamlit elements */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    
-    /* Custom scrollbar */
-    ::-webkit-scrollbar {
-        width: 12px;
-    }
-    
-    ::-webkit-scrollbar-track {
-        background: rgba(255,255,255,0.1);
-        border-radius: 10px;
-    }
-    
-    ::-webkit-scrollbar-thumb {
-        background: linear-gradient(45deg, #e91e63, #ff6b9d);
-        border-radius: 10px;
-        border: 2px solid rgba(255,255,255,0.1);
-    }
-    
-    ::-webkit-scrollbar-thumb:hover {
-        background: linear-gradient(45deg, #d81b60, #e91e63);
-    }
-    
-    /* Custom headers */
-    .hero-title {
-        background: linear-gradient(45deg, #e91e63, #ff6b9d, #9c27b0, #673ab7, #3f51b5);
-        background-size: 300% 300%;
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        font-weight: 800;
-        text-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        animation: gradientFlow 3s ease-in-out infinite, slideInLeft 0.8s ease-out;
-    }
-    
-    @keyframes gradientFlow {
-        0% { background-position: 0% 50%; }
-        50% { background-position: 100% 50%; }
-        100% { background-position: 0% 50%; }
-    }
-    
-    .section-title {
-        color: #2c3e50;
-        font-weight: 700;
-        font-size: 1.8rem;
-        margin-bottom: 1rem;
-        position: relative;
-        padding-left: 1rem;
-        animation: slideInLeft 0.8s ease-out;
-    }
-    
-    @keyframes slideInLeft {
-        from { transform: translateX(-30px); opacity: 0; }
-        to { transform: translateX(0); opacity: 1; }
-    }
-    
-    .section-title::before {
-        content: '';
-        position: absolute;
-        left: 0;
-        top: 50%;
-        transform: translateY(-50%);
-        width: 4px;
-        height: 2rem;
-        background: linear-gradient(45deg, #e91e63, #ff6b9d);
-        border-radius: 2px;
-        animation: expandHeight 0.6s ease-out;
-    }
-    
-    @keyframes expandHeight {
-        from { height: 0; }
-        to { height: 2rem; }
-    }
-    
-    /* Filter styling */
-    .stSelectbox > div > div {
-        border-radius: 15px;
-        border: 2px solid #e0e0e0;
-        transition: all 0.3s ease;
-        background: linear-gradient(135deg, rgba(255,255,255,0.9), rgba(255,255,255,0.8));
-    }
-    
-    .stSelectbox > div > div:hover {
-        border-color: #e91e63;
-        box-shadow: 0 0 0 3px rgba(233, 30, 99, 0.1);
-        transform: translateY(-2px);
-    }
-    
-    /* Slider styling */
-    .stSlider > div > div > div > div {
-        background: linear-gradient(45deg, #e91e63, #ff6b9d);
-    }
-    
-    /* Metric styling */
-    .metric-value {
-        font-size: 2.5rem;
-        font-weight: 800;
-        background: linear-gradient(45deg, #e91e63, #ff6b9d, #9c27b0);
-        background-size: 200% 200%;
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        animation: gradientPulse 3s ease-in-out infinite;
-    }
-    
-    @keyframes gradientPulse {
-        0% { background-position: 0% 50%; }
-        50% { background-position: 100% 50%; }
-        100% { background-position: 0% 50%; }
-    }
-    
-    .metric-label {
-        color: #34495e;
-        font-weight: 600;
-        font-size: 1rem;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        text-shadow: 0 1px 2px rgba(0,0,0,0.1);
-    }
-    
-    /* Quote card styling */
-    .quote-card {
-        background: linear-gradient(135deg, rgba(255,255,255,0.95), rgba(255,255,255,0.9));
-        border-radius: 25px;
-        padding: 2.5rem;
-        box-shadow: 0 15px 35px rgba(0,0,0,0.1);
-        border-left: 6px solid #e91e63;
-        position: relative;
-        overflow: hidden;
-        animation: fadeInUp 1s ease-out;
-        transition: all 0.4s ease;
-    }
-    
-    .quote-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 20px 40px rgba(0,0,0,0.15);
-    }
-    
-    .quote-card::before {
-        content: '"';
-        position: absolute;
-        top: -10px;
-        left: 20px;
-        font-size: 8rem;
-        color: rgba(233, 30, 99, 0.1);
-        font-family: serif;
-        animation: float 3s ease-in-out infinite;
-    }
-    
-    @keyframes float {
-        0%, 100% { transform: translateY(0px); }
-        50% { transform: translateY(-10px); }
-    }
-    
-    /* Enhanced text colors */
-    .text-primary { color: #e91e63; }
-    .text-secondary { color: #ff6b9d; }
-    .text-accent { color: #9c27b0; }
-    .text-dark { color: #2c3e50; }
-    .text-light { color: #7f8c8d; }
-    
-    /* Animated background elements */
-    .animated-bg {
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .animated-bg::after {
-        content: '';
-        position: absolute;
-        top: -50%;
-        left: -50%;
-        width: 200%;
-        height: 200%;
-        background: linear-gradient(45deg, transparent, rgba(233, 30, 99, 0.05), transparent);
-        animation: rotate 20s linear infinite;
-        pointer-events: none;
-    }
-    
-    @keyframes rotate {
-        from { transform: rotate(0deg); }
-        to { transform: rotate(360deg); }
-    }
-    
-    /* Chart container animations */
-    .chart-container {
-        animation: fadeInScale 1s ease-out;
-        transition: all 0.3s ease;
-    }
-    
-    .chart-container:hover {
-        transform: scale(1.02);
-    }
-    
-    /* Loading animation */
-    .loading {
-        display: inline-block;
-        width: 20px;
-        height: 20px;
-        border: 3px solid rgba(233, 30, 99, 0.3);
-        border-radius: 50%;
-        border-top-color: #e91e63;
-        animation: spin 1s ease-in-out infinite;
-    }
-    
-    @keyframes spin {
-        to { transform: rotate(360deg); }
-    }
-    
-    /* Success/Error messages */
-    .success-message {
-        background: linear-gradient(45deg, #27ae60, #2ecc71);
-        color: white;
-        padding: 1rem;
-        border-radius: 15px;
-        animation: slideInRight 0.5s ease-out;
-    }
-    
-    @keyframes slideInRight {
-        from { transform: translateX(100%); opacity: 0; }
-        to { transform: translateX(0); opacity: 1; }
-    }
-    
-    .error-message {
-        background: linear-gradient(45deg, #e74c3c, #c0392b);
-        color: white;
-        padding: 1rem;
-        border-radius: 15px;
-        animation: shake 0.5s ease-out;
-    }
-    
-    @keyframes shake {
-        0%, 100% { transform: translateX(0); }
-        25% { transform: translateX(-5px); }
-        75% { transform: translateX(5px); }
-    }
-</style>
-""", unsafe_allow_html=True)
+# First Streamlit release whose app/static route sends each file's real
+# Content-Type. Earlier ones send stylesheets and videos as text/plain with
+# nosniff, which browsers refuse to apply or play.
+TYPED_STATIC_ROUTE_VERSION = (1, 57)
+
+def static_route_usable():
+    """Whether the browser can load the stylesheet and video from app/static"""
+    version = tuple(int(part) for part in st.__version__.split('.')[:2])
+    return st.get_option("server.enableStaticServing") and version >= TYPED_STATIC_ROUTE_VERSION
+
+def load_theme():
+    """Link the dashboard stylesheet, or inline it when the static route cannot serve it"""
+    if static_route_usable():
+        # A short tag per rerun; the browser fetches and caches the file itself
+        href = asset_url("dashboard.css")
+        st.markdown(f'<link rel="stylesheet" href="{href}">', unsafe_allow_html=True)
+    else:
+        st.markdown(f"<style>\n{read_asset('dashboard.css')}</style>", unsafe_allow_html=True)
+
+# Modern Professional CSS with bright colors, animations, and gradients (static/dashboard.css)
+load_theme()
+
+# Polling fallback: several column groups refreshing together share one delta
+SYNC_MAX_AGE = 10
+
+@st.cache_resource
+def get_snapshot_store():
+    """Local on-disk snapshot of the synced responses"""
+    return SnapshotStore()
+
+@st.cache_resource
+def get_retry_policy():
+    """Retries and circuit breaker shared by every Firestore read of the dashboard"""
+    # Short deadline: a page should fall back to the snapshot rather than hang
+    return RetryPolicy(deadline=10, breaker=CircuitBreaker())
+
+@st.cache_resource
+def get_response_sync():
+    """Process-wide incremental sync of the responses, warm-started from the local snapshot
+
+    One sync serves every column group: each group's store requires its
+    fields, which are downloaded once, and then the watermarks and delta
+    queries are shared instead of repeated per group.
+    """
+    response_sync = ResponseSync(db.collection("responses"), normalize=normalize_responses,
+                                 fields=[], retry_policy=get_retry_policy())
+    snapshot = get_snapshot_store().load()
+    if snapshot is not None:
+        response_sync.seed(snapshot.df, snapshot.high_water_marks, snapshot.version, snapshot.fields)
+    return response_sync
 
-@st.cache_data(ttl=300)
-def fetch_responses():
-    """Fetch all responses from Firebase"""
+def group_frame(df, group):
+    """The columns of one column group (with the id and timestamps) of the synced responses"""
+    wanted = ['id', *WATERMARK_FIELDS, *COLUMN_GROUPS[group]]
+    return df[[column for column in dict.fromkeys(wanted) if column in df.columns]]
+
+def refresh_responses(response_sync, listener, snapshot_store, group):
+    """Bring a column group up to date and persist the responses to the local snapshot
+
+    Runs on the loader threads, so it only touches the objects it is given.
+    """
+    response_sync.require(COLUMN_GROUPS[group])
+    # While the listener is healthy it has already applied every change, so
+    # the sync only runs to catch up once or to download newly required
+    # fields; otherwise fall back to polling for the delta.
+    if response_sync.last_synced_at is None or response_sync.pending_fields or not listener.is_healthy():
+        response_sync.sync(max_age=SYNC_MAX_AGE)
+        listener.start()
+    df, high_water_marks, version, fields = response_sync.state()
+    if snapshot_store.saved_version != version:
+        snapshot_store.save(df, high_water_marks, version, fields)
+    return group_frame(df, group), version
+
+@st.cache_resource
+def get_response_listener():
+    """Real-time listener that pushes new and edited responses into the shared sync"""
+    return ResponseListener(db.collection("responses"))
+
+@st.cache_resource
+def get_dataset_store(group):
+    """One column group of the dataset, shared by every session in this process"""
+    response_sync = get_response_sync()
+    listener = get_response_listener()
+    snapshot_store = get_snapshot_store()
+
+    def fallback():
+        # While Firestore is down on a cold start, serve the local snapshot the sync was seeded from
+        if response_sync.df.empty or not response_sync.covers(COLUMN_GROUPS[group]):
+            return None
+        return group_frame(response_sync.df, group), response_sync.version
+
+    dataset_store = DatasetStore(lambda: refresh_responses(response_sync, listener, snapshot_store, group),
+                                 fallback=fallback)
+    # Publish pushed changes on the next page load instead of waiting for the refresh interval
+    listener.subscribe(response_sync, dataset_store.invalidate)
+    return dataset_store
+
+@st.cache_resource
+def get_loader_pool():
+    """Background threads that load column groups while a page renders"""
+    return ThreadPoolExecutor(max_workers=len(COLUMN_GROUPS), thread_name_prefix="dataset-loader")
+
+@st.cache_resource(max_entries=2)
+def _joined_groups(_frames, groups, versions):
+    """Join column groups on the document id, keeping the rows of the first group"""
+    df = _frames[0]
+    for group, frame in zip(groups[1:], _frames[1:]):
+        if 'id' not in df.columns or 'id' not in frame.columns:
+            continue
+        columns = [column for column in COLUMN_GROUPS[group] if column in frame.columns]
+        df = df.merge(frame[['id'] + columns], on='id', how='left')
+    df.attrs['dataset_version'] = versions
+    return df
+
+def start_loading(page):
+    """Start loading the column groups a page needs and return a function that waits for them
+
+    The groups load in the background, so a page can render its static parts
+    first and only block where it needs the responses.
+    """
+    groups = groups_for(PAGE_COLUMNS[page])
+    try:
+        pool = get_loader_pool()
+        futures = [pool.submit(get_dataset_store(group).get) for group in groups]
+    except Exception as e:
+        st.error(f"Error fetching data: {e}")
+        futures = []
+    loaded = []
+
+    def load():
+        if not loaded:
+            df = _wait_for_groups(groups, futures)
+            show_data_freshness(df)
+            loaded.append(df)
+        return loaded[0]
+
+    return load
+
+def _wait_for_groups(groups, futures):
+    """Collect the loaded column groups into one frame"""
+    if not futures:
+        return pd.DataFrame()
     try:
-        docs = db.collection("responses").stream()
-        data = []
-        for doc in docs:
-            entry = doc.to_dict()
-            entry["id"] = doc.id
-            # Add timestamp if not present
-            if "createdAt" not in entry:
-                entry["createdAt"] = datetime.now()
-            data.append(entry)
-        return pd.DataFrame(data)
+        with st.spinner("Loading responses..."):
+            frames = [future.result() for future in futures]
+        if len(frames) == 1:
+            return frames[0]
+        versions = tuple(frame.attrs.get('dataset_version') for frame in frames)
+        df = _joined_groups(frames, tuple(groups), versions).copy(deep=False)
+        # The join is only as fresh as its stalest group
+        as_of = [frame.attrs.get('as_of') for frame in frames]
+        df.attrs['as_of'] = None if None in as_of else min(as_of)
+        return df
     except Exception as e:
         st.error(f"Error fetching data: {e}")
         return pd.DataFrame()
 
+def show_data_freshness(df):
+    """Small "as of" line telling viewers how fresh the page's data is"""
+    if 'dataset_version' not in df.attrs:
+        return
+    as_of = df.attrs.get('as_of')
+    if as_of is None:
+        text = "🕒 Showing saved data while the live responses are unavailable"
+    else:
+        text = f"🕒 Data as of {as_of:%d %b, %H:%M:%S}"
+    st.markdown(f'<p class="text-light m-0" style="text-align: right; font-size: 0.85rem;">{text}</p>', unsafe_allow_html=True)
+
+@st.cache_resource(max_entries=8)
+def _cached_aggregates(_df, dataset_version):
+    return compute_aggregates(_df)
+
+def get_aggregates(df):
+    """Precomputed page metrics, recomputed only when the dataset version changes"""
+    return _cached_aggregates(df, df.attrs.get('dataset_version'))
+
+def render_chart(column, value_counts):
+    """Section of the registered chart for ``column``: heading and chart, or heading and empty state"""
+    spec = CHART_SPECS[column]
+    counts = value_counts[column]
+    if len(counts) == 0:
+        st.markdown(section_html(spec, empty=True), unsafe_allow_html=True)
+        return
+    st.markdown(section_html(spec), unsafe_allow_html=True)
+    st.plotly_chart(spec_chart(spec, counts), use_container_width=True)
+
 def create_navbar(current_page):
     """Create modern navbar with routing using Streamlit buttons"""
     pages = [
@@ -523,35 +318,54 @@ def create_navbar(current_page):
             if page_id == current_page:
                 # Active page - show as selected
                 st.markdown(f"""
-                <div style="text-align: center; padding: 0.8rem; background: linear-gradient(45deg, #e91e63, #ff6b9d); 
-                border-radius: 50px; color: white; font-weight: 700; box-shadow: 0 8px 25px rgba(233, 30, 99, 0.4); font-size: 0.95rem;">
+                <div class="tc bg-pink c-white fw-7" style="padding: 0.8rem; border-radius: 50px; box-shadow: 0 8px 25px rgba(233, 30, 99, 0.4); font-size: 0.95rem;">
                     {page_name}
                 </div>
                 """, unsafe_allow_html=True)
             else:
-                # Inactive page - show as button
-                if st.button(page_name, key=f"nav_{page_id}", help=f"Go to {page_name}"):
-                    st.query_params["page"] = page_id
-                    st.rerun()
+                # Inactive page - show as button; the click reruns only the dashboard fragment
+                st.button(page_name, key=f"nav_{page_id}", help=f"Go to {page_name}",
+                          on_click=go_to_page, args=(page_id,))
+
+def go_to_page(page_id):
+    """Navbar callback: switch page before the rerun the click triggers"""
+    st.query_params["page"] = page_id
+
+# Intro video on the overview page, in static/ (or, as before, the project root)
+INTRO_VIDEO = "shespeaks.mp4"
+
+def show_intro_video():
+    """The intro video, streamed by the browser straight from the static route when possible"""
+    # st.context.url only exists from Streamlit 1.45
+    app_url = getattr(st.context, "url", None)
+    if static_route_usable() and asset_exists(INTRO_VIDEO) and app_url:
+        # A full URL is passed through as is: the browser fetches the file in
+        # ranges and caches it, and no video bytes go through Python
+        st.video(absolute_asset_url(app_url, INTRO_VIDEO))
+    elif asset_exists(INTRO_VIDEO) or os.path.isfile(INTRO_VIDEO):
+        # Streamlit loads the file into its media store on every rerun
+        st.video(asset_path(INTRO_VIDEO) if asset_exists(INTRO_VIDEO) else INTRO_VIDEO)
+    else:
+        st.info(f"Add '{INTRO_VIDEO}' to the static/ folder to display the intro video.")
 
-def overview_page(df):
+def overview_page(load):
     """Enhanced Overview page with Gen Z vibes and professional dashboard features"""
     
     # Hero Section with Gen Z messaging
     st.markdown("""
-    <div class="animated-bg" style="text-align: center; margin-bottom: 3rem; padding: 3rem; border-radius: 25px; color: #2c3e50; box-shadow: 0 20px 40px rgba(0,0,0,0.1);">
-        <h1 class="hero-title" style="font-size: 4.5rem; margin-bottom: 1rem; text-shadow: 2px 2px 4px rgba(0,0,0,0.1);">🌸 SheSpeaks Pulse</h1>
-        <p style="font-size: 1.5rem; font-weight: 600; margin-bottom: 0.5rem; color: #34495e;">✨ Amplifying Women's Voices in Tech ✨</p>
-        <p style="font-size: 1.2rem; margin-bottom: 1rem; color: #7f8c8d;">Real-time insights from the amazing women shaping the future of technology</p>
-        <div style="display: flex; justify-content: center; gap: 2rem; margin-top: 1.5rem; flex-wrap: wrap;">
-            <div style="background: linear-gradient(45deg, #e91e63, #ff6b9d); color: white; padding: 0.5rem 1rem; border-radius: 20px; box-shadow: 0 4px 15px rgba(233, 30, 99, 0.3);">
-                <span style="font-size: 1.1rem;">🚀 Let's speak</span>
+    <div class="animated-bg tc mb-3 p-3 r-25 c-ink sh-lg">
+        <h1 class="hero-title mb-1" style="font-size: 4.5rem; text-shadow: 2px 2px 4px rgba(0,0,0,0.1);">🌸 SheSpeaks Pulse</h1>
+        <p class="fs-15 fw-6 mb-05 c-slate">✨ Amplifying Women's Voices in Tech ✨</p>
+        <p class="fs-12 mb-1 c-muted">Real-time insights from the amazing women shaping the future of technology</p>
+        <div class="flex flex-wrap" style="justify-content: center; gap: 2rem; margin-top: 1.5rem;">
+            <div class="bg-pink c-white p-05-1 r-20 sh-pink">
+                <span class="fs-11">🚀 Let's speak</span>
             </div>
-            <div style="background: linear-gradient(45deg, #e91e63, #ff6b9d); color: white; padding: 0.5rem 1rem; border-radius: 20px; box-shadow: 0 4px 15px rgba(233, 30, 99, 0.3);">
-                <span style="font-size: 1.1rem;">👂 Let's listen</span>
+            <div class="bg-pink c-white p-05-1 r-20 sh-pink">
+                <span class="fs-11">👂 Let's listen</span>
             </div>
-            <div style="background: linear-gradient(45deg, #e91e63, #ff6b9d); color: white; padding: 0.5rem 1rem; border-radius: 20px; box-shadow: 0 4px 15px rgba(233, 30, 99, 0.3);">
-                <span style="font-size: 1.1rem;">💫 Let's change</span>
+            <div class="bg-pink c-white p-05-1 r-20 sh-pink">
+                <span class="fs-11">💫 Let's change</span>
             </div>
         </div>
     </div>
@@ -561,11 +375,7 @@ def overview_page(df):
     st.markdown('<h2 class="section-title">🎬 SheSpeaks Vision</h2>', unsafe_allow_html=True)
     video_left, video_center, video_right = st.columns([1, 3, 1])
     with video_center:
-        try:
-            with open("shespeaks.mp4", "rb") as f:
-                st.video(f.read())
-        except Exception:
-            st.info("Add 'shespeaks.mp4' to the project root to display the intro video.")
+        show_intro_video()
 
     with st.expander("Read the vision"):
         st.markdown(
@@ -602,14 +412,15 @@ def overview_page(df):
             unsafe_allow_html=True,
         )
 
+    df = load()
     if df.empty:
         st.markdown("""
-        <div class="metric-card animated-bg" style="text-align: center; padding: 4rem; background: linear-gradient(135deg, #ffecd2 0%, #fcb69f 100%); border: 3px solid #ff6b9d;">
-            <div style="font-size: 4rem; margin-bottom: 1rem;">📭</div>
-            <h2 class="text-dark" style="margin-bottom: 1rem; font-size: 2rem;">No Responses Yet</h2>
-            <p class="text-light" style="font-size: 1.2rem; margin-bottom: 1rem;">✨ The dashboard is ready to shine once responses start coming in! ✨</p>
-            <p class="text-light" style="font-size: 1rem; margin-bottom: 1.5rem;">Share the survey link to start collecting insights and making waves! 🌊</p>
-            <div style="font-size: 2rem; margin-top: 1rem;">💫 🌟 ✨ 🎀</div>
+        <div class="metric-card animated-bg tc p-4 bg-peach b-rose">
+            <div class="fs-4 mb-1">📭</div>
+            <h2 class="text-dark mb-1 fs-2">No Responses Yet</h2>
+            <p class="text-light fs-12 mb-1">✨ The dashboard is ready to shine once responses start coming in! ✨</p>
+            <p class="text-light fs-1" style="margin-bottom: 1.5rem;">Share the survey link to start collecting insights and making waves! 🌊</p>
+            <div class="fs-2 mt-1">💫 🌟 ✨ 🎀</div>
         </div>
         """, unsafe_allow_html=True)
         return
@@ -617,27 +428,29 @@ def overview_page(df):
     # About section
     st.markdown('<h2 class="section-title">🌸 ACM-W ABESEC Chapter | Advancing Women in Computing</h2>', unsafe_allow_html=True)
     st.markdown("""
-    <div class="metric-card animated-bg" style="padding: 1.5rem;">
-      <p class="text-dark" style="margin: 0; font-size: 1.05rem;">
+    <div class="metric-card animated-bg p-15">
+      <p class="text-dark m-0 fs-105">
         The ACM-W ABESEC Chapter is a dynamic and inclusive community dedicated to supporting and advancing women in computing at ABES Engineering College. As part of the global ACM-W network, the chapter focuses on fostering technical excellence, leadership, and meaningful societal impact.
       </p>
-      <p class="text-dark" style="margin: 0.5rem 0 0 0; font-size: 1.05rem;">
+      <p class="text-dark fs-105" style="margin: 0.5rem 0 0 0;">
         Driven by the vision to build a future where every woman in computing feels confident, capable, and celebrated; the chapter empowers members to drive meaningful change and shape tomorrow's technology.
       </p>
-      <p class="text-dark" style="margin: 0.5rem 0 0 0; font-size: 1.05rem;">
+      <p class="text-dark fs-105" style="margin: 0.5rem 0 0 0;">
         Through a blend of mentorship, community outreach, and skill development, the chapter creates opportunities for women to grow both professionally and personally. From organizing technical workshops, speaker sessions, and coding events to leading community service initiatives, the chapter encourages members to lead with purpose and contribute to a more inclusive and socially responsible tech ecosystem.
       </p>
-      <ul style="margin: 0.75rem 0 0 1rem; color: #2c3e50;">
+      <ul class="c-ink" style="margin: 0.75rem 0 0 1rem;">
         <li><strong>Empowerment</strong>: Creating a support system through peer mentorship, leadership opportunities, and visibility for women in computing.</li>
         <li><strong>Education</strong>: Delivering practical learning experiences through technical training, industry interaction, and hands-on sessions.</li>
         <li><strong>Community Engagement</strong>: Using technology to give back through outreach, awareness drives, and service-based projects that solve real-world challenges.</li>
       </ul>
-      <p class="text-dark" style="margin: 0.75rem 0 0 0; font-size: 1.05rem;">
+      <p class="text-dark fs-105" style="margin: 0.75rem 0 0 0;">
         The ACM-W ABESEC Chapter believes that when women lead with knowledge and empathy, they not only elevate their own careers but also shape a better future for all.
       </p>
     </div>
     """, unsafe_allow_html=True)
     
+    aggregates = get_aggregates(df)
+    
     # Key metrics
     st.markdown('<h2 class="section-title">📊 Key Insights at a Glance</h2>', unsafe_allow_html=True)
     
@@ -645,7 +458,7 @@ def overview_page(df):
     
     with col1:
         # Total Responses with Gen Z flair
-        response_count = len(df)
+        response_count = aggregates['total_responses']
         response_emoji = "🔥" if response_count > 100 else "✨" if response_count > 50 else "🌟"
         response_message = "Absolutely crushing it!" if response_count > 100 else "Making waves!" if response_count > 50 else "Getting started!"
         
@@ -653,22 +466,14 @@ def overview_page(df):
         <div class="metric-card animated-bg">
             <div class="metric-label">{response_emoji} Total Responses</div>
             <div class="metric-value">{response_count}</div>
-            <div class="text-light" style="font-size: 0.9rem; margin-top: 0.5rem;">{response_message}</div>
-            <div class="text-light" style="font-size: 0.8rem; margin-top: 0.3rem;">Voices heard & amplified</div>
+            <div class="text-light fs-09 mt-05">{response_message}</div>
+            <div class="text-light fs-08 mt-03">Voices heard & amplified</div>
         </div>
         """, unsafe_allow_html=True)
     
     with col2:
         # Enhanced Mood Score with context
-        mood_questions = ['boys-club', 'equal-chances', 'safe-supported', 'held-back', 'women-mentors']
-        mood_scores = []
-        for q in mood_questions:
-            if q in df.columns:
-                numeric_values = pd.to_numeric(df[q], errors='coerce')
-                if not numeric_values.isna().all():
-                    mood_scores.append(numeric_values.mean())
-        
-        avg_mood = np.mean(mood_scores) if mood_scores else 0
+        avg_mood = aggregates['avg_mood']
         mood_emoji = "😊" if avg_mood >= 3.5 else "😐" if avg_mood >= 2.5 else "😔"
         mood_message = "Feeling the vibes!" if avg_mood >= 3.5 else "Room for growth!" if avg_mood >= 2.5 else "Need support!"
         
@@ -676,42 +481,27 @@ def overview_page(df):
         <div class="metric-card animated-bg">
             <div class="metric-label">{mood_emoji} Community Mood</div>
             <div class="metric-value">{avg_mood:.1f}/5</div>
-            <div class="text-light" style="font-size: 0.9rem; margin-top: 0.5rem;">{mood_message}</div>
-            <div class="text-light" style="font-size: 0.8rem; margin-top: 0.3rem;">Average sentiment score</div>
+            <div class="text-light fs-09 mt-05">{mood_message}</div>
+            <div class="text-light fs-08 mt-03">Average sentiment score</div>
         </div>
         """, unsafe_allow_html=True)
     
     with col3:
         # Top Request with better presentation
-        top_request = "N/A"
-        if 'help' in df.columns and not df['help'].isna().all():
-            help_responses = []
-            for response in df['help'].dropna():
-                if isinstance(response, list):
-                    help_responses.extend(response)
-                elif isinstance(response, str):
-                    help_responses.extend(response.split(','))
-            
-            if help_responses:
-                help_counts = Counter(help_responses)
-                top_request = help_counts.most_common(1)[0][0] if help_counts else "N/A"
+        top_request = aggregates['top_help'] or "N/A"
         
         st.markdown(f"""
         <div class="metric-card animated-bg">
             <div class="metric-label">🔥 Top Community Ask</div>
-            <div style="font-size: 1.1rem; font-weight: 700; color: #2c3e50; margin: 0.5rem 0; line-height: 1.3;">{top_request[:25]}{'...' if len(top_request) > 25 else ''}</div>
-            <div class="text-light" style="font-size: 0.9rem;">Most requested change</div>
-            <div class="text-light" style="font-size: 0.8rem; margin-top: 0.3rem;">What the community wants</div>
+            <div class="fs-11 fw-7 c-ink" style="margin: 0.5rem 0; line-height: 1.3;">{top_request[:25]}{'...' if len(top_request) > 25 else ''}</div>
+            <div class="text-light fs-09">Most requested change</div>
+            <div class="text-light fs-08 mt-03">What the community wants</div>
         </div>
         """, unsafe_allow_html=True)
     
     with col4:
         # Enhanced Judged Percentage with action items
-        judged_pct = 0
-        if 'judged' in df.columns and not df['judged'].isna().all():
-            judged_responses = df['judged'].dropna()
-            if len(judged_responses) > 0:
-                judged_pct = len(judged_responses[judged_responses.isin(['multiple', 'sometimes'])]) / len(judged_responses) * 100
+        judged_pct = aggregates['judged_pct']
         
         judged_emoji = "⚠️" if judged_pct > 50 else "💪" if judged_pct > 25 else "✨"
         judged_message = "Action needed!" if judged_pct > 50 else "Room to improve!" if judged_pct > 25 else "Great vibes!"
@@ -720,8 +510,8 @@ def overview_page(df):
         <div class="metric-card animated-bg">
             <div class="metric-label">{judged_emoji} Felt Judged</div>
             <div class="metric-value">{judged_pct:.1f}%</div>
-            <div class="text-light" style="font-size: 0.9rem; margin-top: 0.5rem;">{judged_message}</div>
-            <div class="text-light" style="font-size: 0.8rem; margin-top: 0.3rem;">Need support & allyship</div>
+            <div class="text-light fs-09 mt-05">{judged_message}</div>
+            <div class="text-light fs-08 mt-03">Need support & allyship</div>
         </div>
         """, unsafe_allow_html=True)
     
@@ -739,285 +529,107 @@ def overview_page(df):
     st.markdown('<h2 class="section-title">💡 Key Insights</h2>', unsafe_allow_html=True)
     
     # Add Gen Z Insights Section
-    insights = create_genz_insights(df)
+    insights = create_genz_insights(aggregates)
     if insights:
         # Display concise insights
         for i, insight in enumerate(insights, 1):
             st.markdown(f"""
-            <div style="background: linear-gradient(135deg, rgba(255,255,255,0.9), rgba(255,255,255,0.8)); 
-            padding: 1rem; border-radius: 12px; margin-bottom: 0.5rem; border-left: 4px solid #e91e63; 
-            box-shadow: 0 4px 15px rgba(0,0,0,0.1);">
-                <div style="display: flex; align-items: center; gap: 0.5rem;">
-                    <span style="font-size: 1.2rem;">#{i}</span>
-                    <span style="font-size: 1rem; color: #2c3e50; font-weight: 500;">{insight}</span>
+            <div class="p-1 mb-05" style="background: linear-gradient(135deg, rgba(255,255,255,0.9), rgba(255,255,255,0.8)); border-radius: 12px; border-left: 4px solid #e91e63; box-shadow: 0 4px 15px rgba(0,0,0,0.1);">
+                <div class="flex items-center gap-05">
+                    <span class="fs-12">#{i}</span>
+                    <span class="fs-1 c-ink fw-5">{insight}</span>
                 </div>
             </div>
             """, unsafe_allow_html=True)
     # End minimal overview content
 
-def who_are_you_page(df):
+def who_are_you_page(load):
     """Section 1: Who Are You? - Basic demographics"""
     st.markdown("""
-    <div class="animated-bg" style="text-align: center; margin-bottom: 3rem;">
-        <h1 class="hero-title" style="font-size: 3.5rem;">👋 Who Are You?</h1>
-        <p class="text-dark" style="font-size: 1.2rem; font-weight: 500;">Getting to know our amazing community</p>
-        <p class="text-light" style="font-size: 1rem; margin-top: 1rem;">Understanding the diverse backgrounds and experiences of women in tech helps us create more inclusive and supportive environments. Let's explore the demographics of our community!</p>
+    <div class="animated-bg tc mb-3">
+        <h1 class="hero-title fs-35">👋 Who Are You?</h1>
+        <p class="text-dark fs-12 fw-5">Getting to know our amazing community</p>
+        <p class="text-light fs-1 mt-1">Understanding the diverse backgrounds and experiences of women in tech helps us create more inclusive and supportive environments. Let's explore the demographics of our community!</p>
     </div>
     """, unsafe_allow_html=True)
     
+    df = load()
     if df.empty:
         st.markdown("""
-        <div class="metric-card animated-bg" style="text-align: center; padding: 4rem;">
-            <div style="font-size: 3rem; margin-bottom: 1rem;">📭</div>
-            <h2 class="text-dark" style="margin-bottom: 1rem;">No Responses Yet</h2>
-            <p class="text-light" style="font-size: 1.1rem;">The dashboard will populate once responses start coming in!</p>
+        <div class="metric-card animated-bg tc p-4">
+            <div class="fs-3 mb-1">📭</div>
+            <h2 class="text-dark mb-1">No Responses Yet</h2>
+            <p class="text-light fs-11">The dashboard will populate once responses start coming in!</p>
         </div>
         """, unsafe_allow_html=True)
         return
     
+    value_counts = get_aggregates(df)['value_counts']
+    
     # Year Distribution
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown('<h2 class="section-title">🎓 Year-wise Breakdown</h2>', unsafe_allow_html=True)
-        if 'year' in df.columns and not df['year'].isna().all():
-            year_counts = df['year'].dropna().value_counts()
-            if len(year_counts) > 0:
-                fig = px.bar(x=year_counts.index, y=year_counts.values,
-                            title="📊 Student Distribution by Academic Year",
-                            color_discrete_sequence=['#e91e63'])
-                fig.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)', 
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(size=14), 
-                    margin=dict(l=20, r=20, t=40, b=20),
-                    xaxis_title="Academic Year",
-                    yaxis_title="Number of Students"
-                )
-                st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-                st.plotly_chart(fig, use_container_width=True)
-                st.markdown('</div>', unsafe_allow_html=True)
-            else:
-                st.markdown("""
-                <div class="metric-card animated-bg" style="text-align: center; padding: 2rem;">
-                    <div style="font-size: 2rem; margin-bottom: 1rem;">📊</div>
-                    <p class="text-light">No year data available yet</p>
-                </div>
-                """, unsafe_allow_html=True)
-        else:
-            st.markdown("""
-            <div class="metric-card animated-bg" style="text-align: center; padding: 2rem;">
-                <div style="font-size: 2rem; margin-bottom: 1rem;">📊</div>
-                <p class="text-light">No year data available yet</p>
-            </div>
-            """, unsafe_allow_html=True)
+        render_chart('year', value_counts)
     
     with col2:
-        st.markdown('<h2 class="section-title">📚 Course Analysis</h2>', unsafe_allow_html=True)
-        if 'course' in df.columns and not df['course'].isna().all():
-            course_counts = df['course'].dropna().value_counts().head(10)
-            if len(course_counts) > 0:
-                fig = px.bar(x=course_counts.values, y=course_counts.index, orientation='h',
-                            title="📚 Top 10 Courses by Student Count",
-                            color_discrete_sequence=['#ff6b9d'])
-                fig.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)', 
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(size=14), 
-                    margin=dict(l=20, r=20, t=40, b=20),
-                    xaxis_title="Number of Students",
-                    yaxis_title="Course/Program"
-                )
-                st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-                st.plotly_chart(fig, use_container_width=True)
-                st.markdown('</div>', unsafe_allow_html=True)
-            else:
-                st.markdown("""
-                <div class="metric-card animated-bg" style="text-align: center; padding: 2rem;">
-                    <div style="font-size: 2rem; margin-bottom: 1rem;">📚</div>
-                    <p class="text-light">No course data available yet</p>
-                </div>
-                """, unsafe_allow_html=True)
-        else:
-            st.markdown("""
-            <div class="metric-card animated-bg" style="text-align: center; padding: 2rem;">
-                <div style="font-size: 2rem; margin-bottom: 1rem;">📚</div>
-                <p class="text-light">No course data available yet</p>
-            </div>
-            """, unsafe_allow_html=True)
+        render_chart('course', value_counts)
     
     # Ever felt judged in tech spaces?
-    st.markdown('<h2 class="section-title">🤔 Ever Felt Judged in Tech Spaces?</h2>', unsafe_allow_html=True)
-    if 'judged' in df.columns and not df['judged'].isna().all():
-        judged_counts = df['judged'].dropna().value_counts()
-        if len(judged_counts) > 0:
-            fig = px.pie(values=judged_counts.values, names=judged_counts.index,
-                        title="🤔 Experience of Judgment in Tech Spaces",
-                        color_discrete_sequence=['#e91e63', '#ff6b9d', '#9c27b0', '#673ab7'])
-            fig.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)', 
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(size=14), 
-                margin=dict(l=20, r=20, t=40, b=20)
-            )
-            st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-            st.plotly_chart(fig, use_container_width=True)
-            st.markdown('</div>', unsafe_allow_html=True)
-        else:
-            st.markdown("""
-            <div class="metric-card animated-bg" style="text-align: center; padding: 2rem;">
-                <div style="font-size: 2rem; margin-bottom: 1rem;">🤔</div>
-                <p class="text-light">No judgment data available yet</p>
-            </div>
-            """, unsafe_allow_html=True)
-    else:
-        st.markdown("""
-        <div class="metric-card animated-bg" style="text-align: center; padding: 2rem;">
-            <div style="font-size: 2rem; margin-bottom: 1rem;">🤔</div>
-            <p class="text-light">No judgment data available yet</p>
-        </div>
-        """, unsafe_allow_html=True)
+    render_chart('judged', value_counts)
 
-def real_talk_page(df):
+def real_talk_page(load):
     """Section 2: Real Talk - Group dynamics and experiences"""
     st.markdown("""
-    <div class="animated-bg" style="text-align: center; margin-bottom: 3rem;">
-        <h1 class="hero-title" style="font-size: 3.5rem;">💬 Real Talk</h1>
-        <p class="text-dark" style="font-size: 1.2rem; font-weight: 500;">The real deal about group projects & gender dynamics</p>
-        <p class="text-light" style="font-size: 1rem; margin-top: 1rem;">Group projects and collaborative work are fundamental to tech education and careers. Understanding how women navigate these spaces helps us identify barriers and create better support systems.</p>
+    <div class="animated-bg tc mb-3">
+        <h1 class="hero-title fs-35">💬 Real Talk</h1>
+        <p class="text-dark fs-12 fw-5">The real deal about group projects & gender dynamics</p>
+        <p class="text-light fs-1 mt-1">Group projects and collaborative work are fundamental to tech education and careers. Understanding how women navigate these spaces helps us identify barriers and create better support systems.</p>
     </div>
     """, unsafe_allow_html=True)
     
+    df = load()
     if df.empty:
         st.markdown("""
-        <div class="metric-card animated-bg" style="text-align: center; padding: 4rem;">
-            <div style="font-size: 3rem; margin-bottom: 1rem;">📭</div>
-            <h2 class="text-dark" style="margin-bottom: 1rem;">No Responses Yet</h2>
-            <p class="text-light" style="font-size: 1.1rem;">The dashboard will populate once responses start coming in!</p>
+        <div class="metric-card animated-bg tc p-4">
+            <div class="fs-3 mb-1">📭</div>
+            <h2 class="text-dark mb-1">No Responses Yet</h2>
+            <p class="text-light fs-11">The dashboard will populate once responses start coming in!</p>
         </div>
         """, unsafe_allow_html=True)
         return
     
+    value_counts = get_aggregates(df)['value_counts']
+    
     # Voice in group projects
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown('<h2 class="section-title">🎙️ Voice in Group Projects</h2>', unsafe_allow_html=True)
-        if 'voice' in df.columns and not df['voice'].isna().all():
-            voice_counts = df['voice'].dropna().value_counts()
-            if len(voice_counts) > 0:
-                fig = px.bar(x=voice_counts.index, y=voice_counts.values,
-                            title="🎙️ Comfort Level Speaking Up in Group Projects",
-                            color_discrete_sequence=['#e91e63'])
-                fig.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)', 
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(size=14), 
-                    margin=dict(l=20, r=20, t=40, b=20),
-                    xaxis_title="Response Category",
-                    yaxis_title="Number of Students"
-                )
-                st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-                st.plotly_chart(fig, use_container_width=True)
-                st.markdown('</div>', unsafe_allow_html=True)
-            else:
-                st.markdown("""
-                <div class="metric-card animated-bg" style="text-align: center; padding: 2rem;">
-                    <div style="font-size: 2rem; margin-bottom: 1rem;">🎙️</div>
-                    <p class="text-light">No voice data available yet</p>
-                </div>
-                """, unsafe_allow_html=True)
-        else:
-            st.markdown("""
-            <div class="metric-card animated-bg" style="text-align: center; padding: 2rem;">
-                <div style="font-size: 2rem; margin-bottom: 1rem;">🎙️</div>
-                <p class="text-light">No voice data available yet</p>
-            </div>
-            """, unsafe_allow_html=True)
+        render_chart('voice', value_counts)
     
     with col2:
-        st.markdown('<h2 class="section-title">🚶‍♀️ Stepped Back from Tech?</h2>', unsafe_allow_html=True)
-        if 'stepped-back' in df.columns and not df['stepped-back'].isna().all():
-            stepped_counts = df['stepped-back'].dropna().value_counts()
-            if len(stepped_counts) > 0:
-                fig = px.pie(values=stepped_counts.values, names=stepped_counts.index,
-                            title="🚶‍♀️ Experience of Stepping Back from Tech Opportunities",
-                            color_discrete_sequence=['#ff6b9d', '#e91e63', '#9c27b0', '#673ab7'])
-                fig.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)', 
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(size=14), 
-                    margin=dict(l=20, r=20, t=40, b=20)
-                )
-                st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-                st.plotly_chart(fig, use_container_width=True)
-                st.markdown('</div>', unsafe_allow_html=True)
-            else:
-                st.markdown("""
-                <div class="metric-card animated-bg" style="text-align: center; padding: 2rem;">
-                    <div style="font-size: 2rem; margin-bottom: 1rem;">🚶‍♀️</div>
-                    <p class="text-light">No stepped back data available yet</p>
-                </div>
-                """, unsafe_allow_html=True)
-        else:
-            st.markdown("""
-            <div class="metric-card animated-bg" style="text-align: center; padding: 2rem;">
-                <div style="font-size: 2rem; margin-bottom: 1rem;">🚶‍♀️</div>
-                <p class="text-light">No stepped back data available yet</p>
-            </div>
-            """, unsafe_allow_html=True)
+        render_chart('stepped-back', value_counts)
     
     # Hostel curfews impact
-    st.markdown('<h2 class="section-title">🕒 Hostel Curfews Impacting Participation?</h2>', unsafe_allow_html=True)
-    if 'curfews' in df.columns and not df['curfews'].isna().all():
-        curfew_counts = df['curfews'].dropna().value_counts()
-        if len(curfew_counts) > 0:
-            fig = px.bar(x=curfew_counts.index, y=curfew_counts.values,
-                        title="🕒 Impact of Hostel Curfews on Tech Participation",
-                        color_discrete_sequence=['#9c27b0'])
-            fig.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)', 
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(size=14), 
-                margin=dict(l=20, r=20, t=40, b=20),
-                xaxis_title="Response Category",
-                yaxis_title="Number of Students"
-            )
-            st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-            st.plotly_chart(fig, use_container_width=True)
-            st.markdown('</div>', unsafe_allow_html=True)
-        else:
-            st.markdown("""
-            <div class="metric-card animated-bg" style="text-align: center; padding: 2rem;">
-                <div style="font-size: 2rem; margin-bottom: 1rem;">🕒</div>
-                <p class="text-light">No curfew data available yet</p>
-            </div>
-            """, unsafe_allow_html=True)
-    else:
-        st.markdown("""
-        <div class="metric-card animated-bg" style="text-align: center; padding: 2rem;">
-            <div style="font-size: 2rem; margin-bottom: 1rem;">🕒</div>
-            <p class="text-light">No curfew data available yet</p>
-        </div>
-        """, unsafe_allow_html=True)
+    render_chart('curfews', value_counts)
     
     # Correlation Analysis
     st.markdown('<h2 class="section-title">🔗 Correlation Analysis</h2>', unsafe_allow_html=True)
     if all(col in df.columns for col in ['year', 'curfews', 'judged']) and not df[['year', 'curfews']].isna().all().all():
         # Do final year students report more curfew frustration?
-        final_year_data = df[df['year'] == 'Final']['curfews'].dropna()
-        other_years_data = df[df['year'] != 'Final']['curfews'].dropna()
+        aggregates = get_aggregates(df)
+        final_year_curfews = aggregates['final_year_curfews']
+        other_years_curfews = aggregates['other_years_curfews']
         
-        if len(final_year_data) > 0 or len(other_years_data) > 0:
+        if len(final_year_curfews) > 0 or len(other_years_curfews) > 0:
             col1, col2 = st.columns(2)
             with col1:
                 st.markdown("""
                 <div class="metric-card animated-bg">
-                    <h3 class="text-primary" style="margin-bottom: 1rem;">Final Year Students - Curfew Impact</h3>
+                    <h3 class="text-primary mb-1">Final Year Students - Curfew Impact</h3>
                 </div>
                 """, unsafe_allow_html=True)
-                if len(final_year_data) > 0:
-                    final_year_curfews = final_year_data.value_counts()
+                if len(final_year_curfews) > 0:
                     st.write(final_year_curfews)
                 else:
                     st.markdown('<p class="text-light">No final year data available</p>', unsafe_allow_html=True)
@@ -1025,45 +637,45 @@ def real_talk_page(df):
             with col2:
                 st.markdown("""
                 <div class="metric-card animated-bg">
-                    <h3 class="text-primary" style="margin-bottom: 1rem;">Other Years - Curfew Impact</h3>
+                    <h3 class="text-primary mb-1">Other Years - Curfew Impact</h3>
                 </div>
                 """, unsafe_allow_html=True)
-                if len(other_years_data) > 0:
-                    other_years_curfews = other_years_data.value_counts()
+                if len(other_years_curfews) > 0:
                     st.write(other_years_curfews)
                 else:
                     st.markdown('<p class="text-light">No other years data available</p>', unsafe_allow_html=True)
         else:
             st.markdown("""
-            <div class="metric-card animated-bg" style="text-align: center; padding: 2rem;">
-                <div style="font-size: 2rem; margin-bottom: 1rem;">🔗</div>
+            <div class="metric-card animated-bg tc p-2">
+                <div class="fs-2 mb-1">🔗</div>
                 <p class="text-light">No correlation data available yet</p>
             </div>
             """, unsafe_allow_html=True)
     else:
         st.markdown("""
-        <div class="metric-card animated-bg" style="text-align: center; padding: 2rem;">
-            <div style="font-size: 2rem; margin-bottom: 1rem;">🔗</div>
+        <div class="metric-card animated-bg tc p-2">
+            <div class="fs-2 mb-1">🔗</div>
             <p class="text-light">No correlation data available yet</p>
         </div>
         """, unsafe_allow_html=True)
 
-def mood_check_page(df):
+def mood_check_page(load):
     """Section 3: Mood Check - 5-point scale analysis"""
     st.markdown("""
-    <div class="animated-bg" style="text-align: center; margin-bottom: 3rem;">
-        <h1 class="hero-title" style="font-size: 3.5rem;">😊 Mood Check</h1>
-        <p class="text-dark" style="font-size: 1.2rem; font-weight: 500;">How are we really feeling about tech spaces?</p>
-        <p class="text-light" style="font-size: 1rem; margin-top: 1rem;">Sentiment analysis helps us understand the emotional landscape of women in tech. These insights guide us in creating more supportive and inclusive environments where everyone can thrive.</p>
+    <div class="animated-bg tc mb-3">
+        <h1 class="hero-title fs-35">😊 Mood Check</h1>
+        <p class="text-dark fs-12 fw-5">How are we really feeling about tech spaces?</p>
+        <p class="text-light fs-1 mt-1">Sentiment analysis helps us understand the emotional landscape of women in tech. These insights guide us in creating more supportive and inclusive environments where everyone can thrive.</p>
     </div>
     """, unsafe_allow_html=True)
     
+    df = load()
     if df.empty:
         st.markdown("""
-        <div class="metric-card animated-bg" style="text-align: center; padding: 4rem;">
-            <div style="font-size: 3rem; margin-bottom: 1rem;">📭</div>
-            <h2 class="text-dark" style="margin-bottom: 1rem;">No Responses Yet</h2>
-            <p class="text-light" style="font-size: 1.1rem;">The dashboard will populate once responses start coming in!</p>
+        <div class="metric-card animated-bg tc p-4">
+            <div class="fs-3 mb-1">📭</div>
+            <h2 class="text-dark mb-1">No Responses Yet</h2>
+            <p class="text-light fs-11">The dashboard will populate once responses start coming in!</p>
         </div>
         """, unsafe_allow_html=True)
         return
@@ -1077,68 +689,26 @@ def mood_check_page(df):
         'women-mentors': 'Wish for more women mentors'
     }
     
-    available_questions = {k: v for k, v in scale_questions.items() if k in df.columns}
+    aggregates = get_aggregates(df)
+    available_questions = {k: v for k, v in scale_questions.items() if k in aggregates['mood_questions']}
     
     if available_questions:
-        # Calculate averages
-        averages = []
-        question_names = []
-        for question, name in available_questions.items():
-            numeric_values = pd.to_numeric(df[question], errors='coerce')
-            avg = numeric_values.mean() if not numeric_values.isna().all() else 0
-            averages.append(avg)
-            question_names.append(name)
+        # Averages come precomputed; questions without numeric answers count as 0
+        averages = [aggregates['mood_means'].get(question, 0) for question in available_questions]
+        question_names = list(available_questions.values())
         
         # Check if we have meaningful data
         if any(avg > 0 for avg in averages):
             # Radar Chart
             st.markdown('<h2 class="section-title">📊 Overall Sentiment Radar</h2>', unsafe_allow_html=True)
-            fig = go.Figure()
-            fig.add_trace(go.Scatterpolar(
-                r=averages,
-                theta=question_names,
-                fill='toself',
-                name='Average Response',
-                line_color='#e91e63',
-                fillcolor='rgba(233, 30, 99, 0.3)'
-            ))
-            fig.update_layout(
-                polar=dict(
-                    radialaxis=dict(
-                        visible=True,
-                        range=[0, 5],
-                        tickfont=dict(size=12)
-                    ),
-                    angularaxis=dict(
-                        tickfont=dict(size=11)
-                    )
-                ),
-                showlegend=False,
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(size=14),
-                margin=dict(l=20, r=20, t=40, b=20)
-            )
-            st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+            fig = radar_chart(averages, question_names, '#e91e63', 'rgba(233, 30, 99, 0.3)')
             st.plotly_chart(fig, use_container_width=True)
-            st.markdown('</div>', unsafe_allow_html=True)
             
             # Individual Score Bars
             st.markdown('<h2 class="section-title">📈 Individual Question Scores</h2>', unsafe_allow_html=True)
-            fig = px.bar(x=question_names, y=averages,
-                        title="📊 Average Scores by Question (1-5 Scale)",
-                        color_discrete_sequence=['#ff6b9d'])
-            fig.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)', 
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(size=14), 
-                margin=dict(l=20, r=20, t=40, b=20),
-                xaxis_title="Survey Questions",
-                yaxis_title="Average Score (1-5 Scale)"
-            )
-            st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+            fig = bar_chart(question_names, averages, "📊 Average Scores by Question (1-5 Scale)", '#ff6b9d',
+                            "Survey Questions", "Average Score (1-5 Scale)")
             st.plotly_chart(fig, use_container_width=True)
-            st.markdown('</div>', unsafe_allow_html=True)
             
             # Overall sentiment index
             overall_sentiment = np.mean(averages)
@@ -1146,45 +716,46 @@ def mood_check_page(df):
             col1, col2, col3 = st.columns([1, 2, 1])
             with col2:
                 st.markdown(f"""
-                <div class="metric-card animated-bg" style="text-align: center;">
+                <div class="metric-card animated-bg tc">
                     <div class="metric-value">{overall_sentiment:.2f}/5</div>
-                    <div class="text-dark" style="font-size: 1.2rem; margin-top: 0.5rem;">Average Mood Score</div>
-                    <div class="text-light" style="font-size: 1rem; margin-top: 0.5rem;">{'😊' if overall_sentiment >= 3 else '😔'}</div>
+                    <div class="text-dark fs-12 mt-05">Average Mood Score</div>
+                    <div class="text-light fs-1 mt-05">{'😊' if overall_sentiment >= 3 else '😔'}</div>
                 </div>
                 """, unsafe_allow_html=True)
         else:
             st.markdown("""
-            <div class="metric-card animated-bg" style="text-align: center; padding: 4rem;">
-                <div style="font-size: 3rem; margin-bottom: 1rem;">😊</div>
-                <h2 class="text-dark" style="margin-bottom: 1rem;">No Mood Data Yet</h2>
-                <p class="text-light" style="font-size: 1.1rem;">5-point scale responses will appear here once available!</p>
+            <div class="metric-card animated-bg tc p-4">
+                <div class="fs-3 mb-1">😊</div>
+                <h2 class="text-dark mb-1">No Mood Data Yet</h2>
+                <p class="text-light fs-11">5-point scale responses will appear here once available!</p>
             </div>
             """, unsafe_allow_html=True)
     else:
         st.markdown("""
-        <div class="metric-card animated-bg" style="text-align: center; padding: 4rem;">
-            <div style="font-size: 3rem; margin-bottom: 1rem;">😊</div>
-            <h2 class="text-dark" style="margin-bottom: 1rem;">No Mood Data Yet</h2>
-            <p class="text-light" style="font-size: 1.1rem;">5-point scale responses will appear here once available!</p>
+        <div class="metric-card animated-bg tc p-4">
+            <div class="fs-3 mb-1">😊</div>
+            <h2 class="text-dark mb-1">No Mood Data Yet</h2>
+            <p class="text-light fs-11">5-point scale responses will appear here once available!</p>
         </div>
         """, unsafe_allow_html=True)
 
-def say_it_page(df):
+def say_it_page(load):
     """Section 4: Tea Spill - Text analysis with Gen Z vibes"""
     st.markdown("""
-    <div class="animated-bg" style="text-align: center; margin-bottom: 3rem; padding: 3rem; border-radius: 25px; color: #2c3e50; box-shadow: 0 20px 40px rgba(0,0,0,0.1);">
-        <h1 class="hero-title" style="font-size: 3.5rem;">☕ Tea Spill</h1>
-        <p style="font-size: 1.3rem; font-weight: 600; margin-bottom: 0.5rem; color: #34495e;">✨ Unfiltered Voices & Real Talk ✨</p>
-        <p style="font-size: 1.1rem; margin-bottom: 1rem; color: #7f8c8d;">Raw insights, honest feedback, and the real stories behind the data</p>
+    <div class="animated-bg tc mb-3 p-3 r-25 c-ink sh-lg">
+        <h1 class="hero-title fs-35">☕ Tea Spill</h1>
+        <p class="fs-13 fw-6 mb-05 c-slate">✨ Unfiltered Voices & Real Talk ✨</p>
+        <p class="fs-11 mb-1 c-muted">Raw insights, honest feedback, and the real stories behind the data</p>
     </div>
     """, unsafe_allow_html=True)
     
+    df = load()
     if df.empty:
         st.markdown("""
-        <div class="metric-card animated-bg" style="text-align: center; padding: 4rem;">
-            <div style="font-size: 3rem; margin-bottom: 1rem;">📭</div>
-            <h2 class="text-dark" style="margin-bottom: 1rem;">No Responses Yet</h2>
-            <p class="text-light" style="font-size: 1.1rem;">The dashboard will populate once responses start coming in!</p>
+        <div class="metric-card animated-bg tc p-4">
+            <div class="fs-3 mb-1">📭</div>
+            <h2 class="text-dark mb-1">No Responses Yet</h2>
+            <p class="text-light fs-11">The dashboard will populate once responses start coming in!</p>
         </div>
         """, unsafe_allow_html=True)
         return
@@ -1233,26 +804,15 @@ def say_it_page(df):
                 col1, col2 = st.columns([2, 1])
 
                 with col1:
-                    fig = px.bar(x=list(top_words.values()), y=list(top_words.keys()), orientation='h',
-                                title="✨ Most Common Words in Desired Changes",
-                                color_discrete_sequence=['#ff6b9d'])
-                    fig.update_layout(
-                        plot_bgcolor='rgba(0,0,0,0)', 
-                        paper_bgcolor='rgba(0,0,0,0)',
-                        font=dict(size=14), 
-                        margin=dict(l=20, r=20, t=40, b=20),
-                        xaxis_title="Word Frequency",
-                        yaxis_title="Common Words"
-                    )
-                    st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+                    fig = bar_chart(list(top_words.values()), list(top_words.keys()), "✨ Most Common Words in Desired Changes", '#ff6b9d',
+                                    "Word Frequency", "Common Words", orientation='h')
                     st.plotly_chart(fig, use_container_width=True)
-                    st.markdown('</div>', unsafe_allow_html=True)
                 
                 with col2:
                     # Analysis insights
                     st.markdown("""
-                    <div class="metric-card animated-bg" style="padding: 1.5rem;">
-                        <h3 style="color: #ff6b9d; margin-bottom: 1rem;">🔍 Change Analysis</h3>
+                    <div class="metric-card animated-bg p-15">
+                        <h3 class="c-rose mb-1">🔍 Change Analysis</h3>
                     """, unsafe_allow_html=True)
                     
                     # Calculate insights
@@ -1272,29 +832,29 @@ def say_it_page(df):
                     education_count = sum(count for word, count in top_words.items() if word in education_words)
                     
                     st.markdown(f"""
-                    <div style="margin-bottom: 1rem;">
-                        <div style="font-weight: 600; color: #2c3e50;">📊 Total Responses</div>
-                        <div style="color: #7f8c8d;">{total_responses} students</div>
+                    <div class="mb-1">
+                        <div class="fw-6 c-ink">📊 Total Responses</div>
+                        <div class="c-muted">{total_responses} students</div>
                     </div>
-                    <div style="margin-bottom: 1rem;">
-                        <div style="font-weight: 600; color: #2c3e50;">🔥 Top Request</div>
-                        <div style="color: #7f8c8d;">"{most_common_word}" ({most_common_count} mentions)</div>
+                    <div class="mb-1">
+                        <div class="fw-6 c-ink">🔥 Top Request</div>
+                        <div class="c-muted">"{most_common_word}" ({most_common_count} mentions)</div>
                     </div>
-                    <div style="margin-bottom: 1rem;">
-                        <div style="font-weight: 600; color: #2c3e50;">🌍 Culture/Environment</div>
-                        <div style="color: #7f8c8d;">{culture_count} mentions</div>
+                    <div class="mb-1">
+                        <div class="fw-6 c-ink">🌍 Culture/Environment</div>
+                        <div class="c-muted">{culture_count} mentions</div>
                     </div>
-                    <div style="margin-bottom: 1rem;">
-                        <div style="font-weight: 600; color: #2c3e50;">🤝 Support Systems</div>
-                        <div style="color: #7f8c8d;">{support_count} mentions</div>
+                    <div class="mb-1">
+                        <div class="fw-6 c-ink">🤝 Support Systems</div>
+                        <div class="c-muted">{support_count} mentions</div>
                     </div>
-                    <div style="margin-bottom: 1rem;">
-                        <div style="font-weight: 600; color: #2c3e50;">📋 Policy Changes</div>
-                        <div style="color: #7f8c8d;">{policy_count} mentions</div>
+                    <div class="mb-1">
+                        <div class="fw-6 c-ink">📋 Policy Changes</div>
+                        <div class="c-muted">{policy_count} mentions</div>
                     </div>
-                    <div style="margin-bottom: 1rem;">
-                        <div style="font-weight: 600; color: #2c3e50;">📚 Education</div>
-                        <div style="color: #7f8c8d;">{education_count} mentions</div>
+                    <div class="mb-1">
+                        <div class="fw-6 c-ink">📚 Education</div>
+                        <div class="c-muted">{education_count} mentions</div>
                     </div>
                     </div>
                     """, unsafe_allow_html=True)
@@ -1310,65 +870,65 @@ def say_it_page(df):
                 with col1:
                     if culture_count > 0:
                         st.markdown(f"""
-                        <div class="metric-card animated-bg" style="text-align: center; padding: 1.5rem;">
-                            <div style="font-size: 2rem; margin-bottom: 0.5rem;">🌍</div>
-                            <div style="font-weight: 600; color: #ff6b9d;">Culture Shift</div>
-                            <div style="color: #7f8c8d; font-size: 0.9rem;">{culture_count} mentions</div>
-                            <div style="color: #2c3e50; font-size: 0.8rem; margin-top: 0.5rem;">Focus on inclusive environment</div>
+                        <div class="metric-card animated-bg tc p-15">
+                            <div class="fs-2 mb-05">🌍</div>
+                            <div class="fw-6 c-rose">Culture Shift</div>
+                            <div class="c-muted fs-09">{culture_count} mentions</div>
+                            <div class="c-ink fs-08 mt-05">Focus on inclusive environment</div>
                         </div>
                         """, unsafe_allow_html=True)
                 
                 with col2:
                     if support_count > 0:
                         st.markdown(f"""
-                        <div class="metric-card animated-bg" style="text-align: center; padding: 1.5rem;">
-                            <div style="font-size: 2rem; margin-bottom: 0.5rem;">🤝</div>
-                            <div style="font-weight: 600; color: #ff6b9d;">Support Systems</div>
-                            <div style="color: #7f8c8d; font-size: 0.9rem;">{support_count} mentions</div>
-                            <div style="color: #2c3e50; font-size: 0.8rem; margin-top: 0.5rem;">Build mentorship programs</div>
+                        <div class="metric-card animated-bg tc p-15">
+                            <div class="fs-2 mb-05">🤝</div>
+                            <div class="fw-6 c-rose">Support Systems</div>
+                            <div class="c-muted fs-09">{support_count} mentions</div>
+                            <div class="c-ink fs-08 mt-05">Build mentorship programs</div>
                         </div>
                         """, unsafe_allow_html=True)
                 
                 with col3:
                     if policy_count > 0:
                         st.markdown(f"""
-                        <div class="metric-card animated-bg" style="text-align: center; padding: 1.5rem;">
-                            <div style="font-size: 2rem; margin-bottom: 0.5rem;">📋</div>
-                            <div style="font-weight: 600; color: #ff6b9d;">Policy Review</div>
-                            <div style="color: #7f8c8d; font-size: 0.9rem;">{policy_count} mentions</div>
-                            <div style="color: #2c3e50; font-size: 0.8rem; margin-top: 0.5rem;">Revisit restrictive policies</div>
+                        <div class="metric-card animated-bg tc p-15">
+                            <div class="fs-2 mb-05">📋</div>
+                            <div class="fw-6 c-rose">Policy Review</div>
+                            <div class="c-muted fs-09">{policy_count} mentions</div>
+                            <div class="c-ink fs-08 mt-05">Revisit restrictive policies</div>
                         </div>
                         """, unsafe_allow_html=True)
                 
                 with col4:
                     if education_count > 0:
                         st.markdown(f"""
-                        <div class="metric-card animated-bg" style="text-align: center; padding: 1.5rem;">
-                            <div style="font-size: 2rem; margin-bottom: 0.5rem;">📚</div>
-                            <div style="font-weight: 600; color: #ff6b9d;">Education Focus</div>
-                            <div style="color: #7f8c8d; font-size: 0.9rem;">{education_count} mentions</div>
-                            <div style="color: #2c3e50; font-size: 0.8rem; margin-top: 0.5rem;">Enhance learning opportunities</div>
+                        <div class="metric-card animated-bg tc p-15">
+                            <div class="fs-2 mb-05">📚</div>
+                            <div class="fw-6 c-rose">Education Focus</div>
+                            <div class="c-muted fs-09">{education_count} mentions</div>
+                            <div class="c-ink fs-08 mt-05">Enhance learning opportunities</div>
                         </div>
                         """, unsafe_allow_html=True)
             else:
                 st.markdown("""
-                <div class="metric-card animated-bg" style="text-align: center; padding: 2rem;">
-                    <div style="font-size: 2rem; margin-bottom: 1rem;">✨</div>
+                <div class="metric-card animated-bg tc p-2">
+                    <div class="fs-2 mb-1">✨</div>
                     <p class="text-light">No meaningful change data available yet</p>
                 </div>
                 """, unsafe_allow_html=True)
             
         else:
             st.markdown("""
-            <div class="metric-card animated-bg" style="text-align: center; padding: 2rem;">
-                <div style="font-size: 2rem; margin-bottom: 1rem;">✨</div>
+            <div class="metric-card animated-bg tc p-2">
+                <div class="fs-2 mb-1">✨</div>
                 <p class="text-light">No change data available yet</p>
             </div>
             """, unsafe_allow_html=True)
     else:
         st.markdown("""
-        <div class="metric-card animated-bg" style="text-align: center; padding: 2rem;">
-            <div style="font-size: 2rem; margin-bottom: 1rem;">✨</div>
+        <div class="metric-card animated-bg tc p-2">
+            <div class="fs-2 mb-1">✨</div>
             <p class="text-light">No change data available yet</p>
         </div>
         """, unsafe_allow_html=True)
@@ -1388,10 +948,10 @@ def say_it_page(df):
         
         with col1:
             st.markdown(f"""
-            <div class="metric-card animated-bg" style="text-align: center; padding: 1.5rem;">
-                <div style="font-size: 2rem; margin-bottom: 0.5rem;">📊</div>
-                <div style="font-weight: 600; color: #e91e63;">Total Responses</div>
-                <div style="color: #7f8c8d; font-size: 0.9rem; margin-top: 0.5rem;">
+            <div class="metric-card animated-bg tc p-15">
+                <div class="fs-2 mb-05">📊</div>
+                <div class="fw-6 c-pink">Total Responses</div>
+                <div class="c-muted fs-09 mt-05">
                     {total_responses} students
                 </div>
             </div>
@@ -1399,10 +959,10 @@ def say_it_page(df):
         
         with col2:
             st.markdown(f"""
-            <div class="metric-card animated-bg" style="text-align: center; padding: 1.5rem;">
-                <div style="font-size: 2rem; margin-bottom: 0.5rem;">🤐</div>
-                <div style="font-weight: 600; color: #e91e63;">Reporting Barriers</div>
-                <div style="color: #7f8c8d; font-size: 0.9rem; margin-top: 0.5rem;">
+            <div class="metric-card animated-bg tc p-15">
+                <div class="fs-2 mb-05">🤐</div>
+                <div class="fw-6 c-pink">Reporting Barriers</div>
+                <div class="c-muted fs-09 mt-05">
                     {len(reporting_data)} responses
                 </div>
             </div>
@@ -1410,10 +970,10 @@ def say_it_page(df):
         
         with col3:
             st.markdown(f"""
-            <div class="metric-card animated-bg" style="text-align: center; padding: 1.5rem;">
-                <div style="font-size: 2rem; margin-bottom: 0.5rem;">✨</div>
-                <div style="font-weight: 600; color: #e91e63;">Desired Changes</div>
-                <div style="color: #7f8c8d; font-size: 0.9rem; margin-top: 0.5rem;">
+            <div class="metric-card animated-bg tc p-15">
+                <div class="fs-2 mb-05">✨</div>
+                <div class="fw-6 c-pink">Desired Changes</div>
+                <div class="c-muted fs-09 mt-05">
                     {len(change_data)} responses
                 </div>
             </div>
@@ -1438,10 +998,10 @@ def say_it_page(df):
             
             for i, insight in enumerate(insights):
                 st.markdown(f"""
-                <div class="metric-card animated-bg" style="padding: 1rem; margin-bottom: 1rem;">
-                    <div style="display: flex; align-items: center;">
-                        <div style="font-size: 1.5rem; margin-right: 1rem;">💭</div>
-                        <div style="color: #2c3e50; font-weight: 500;">{insight}</div>
+                <div class="metric-card animated-bg p-1 mb-1">
+                    <div class="flex items-center">
+                        <div class="fs-15 mr-1">💭</div>
+                        <div class="c-ink fw-5">{insight}</div>
                     </div>
                 </div>
                 """, unsafe_allow_html=True)
@@ -1493,35 +1053,35 @@ def say_it_page(df):
         
         with col1:
             st.markdown("""
-            <div class="metric-card animated-bg" style="padding: 1.5rem;">
-                <h4 style="color: #e91e63; margin-bottom: 1rem;">📈 Response Patterns</h4>
+            <div class="metric-card animated-bg p-15">
+                <h4 class="c-pink mb-1">📈 Response Patterns</h4>
             """, unsafe_allow_html=True)
             
             st.markdown(f"""
-            <div style="margin-bottom: 1rem;">
-                <div style="font-weight: 600; color: #2c3e50;">Total Students</div>
-                <div style="color: #7f8c8d;">{total_responses}</div>
+            <div class="mb-1">
+                <div class="fw-6 c-ink">Total Students</div>
+                <div class="c-muted">{total_responses}</div>
             </div>
-            <div style="margin-bottom: 1rem;">
-                <div style="font-weight: 600; color: #2c3e50;">Reporting Barriers</div>
-                <div style="color: #7f8c8d;">{reporting_responses} responses ({(reporting_responses/total_responses*100):.1f}%)</div>
+            <div class="mb-1">
+                <div class="fw-6 c-ink">Reporting Barriers</div>
+                <div class="c-muted">{reporting_responses} responses ({(reporting_responses/total_responses*100):.1f}%)</div>
             </div>
-            <div style="margin-bottom: 1rem;">
-                <div style="font-weight: 600; color: #2c3e50;">Change Suggestions</div>
-                <div style="color: #7f8c8d;">{change_responses} responses ({(change_responses/total_responses*100):.1f}%)</div>
+            <div class="mb-1">
+                <div class="fw-6 c-ink">Change Suggestions</div>
+                <div class="c-muted">{change_responses} responses ({(change_responses/total_responses*100):.1f}%)</div>
             </div>
             """, unsafe_allow_html=True)
         
         with col2:
             st.markdown("""
-            <div class="metric-card animated-bg" style="padding: 1.5rem;">
-                <h4 style="color: #e91e63; margin-bottom: 1rem;">💭 Key Insights</h4>
+            <div class="metric-card animated-bg p-15">
+                <h4 class="c-pink mb-1">💭 Key Insights</h4>
             """, unsafe_allow_html=True)
             
             for insight in summary_insights:
                 st.markdown(f"""
-                <div style="margin-bottom: 0.5rem; padding: 0.5rem; background: rgba(255, 107, 157, 0.1); border-radius: 5px;">
-                    <div style="color: #2c3e50; font-size: 0.9rem;">{insight}</div>
+                <div class="mb-05 p-05 bg-rose-10 r-5">
+                    <div class="c-ink fs-09">{insight}</div>
                 </div>
                 """, unsafe_allow_html=True)
         
@@ -1706,15 +1266,15 @@ def say_it_page(df):
         if tea_recommendations:
             st.markdown('<h3 class="section-title">🚀 Time to Take Action!</h3>', unsafe_allow_html=True)
             st.markdown(f"""
-            <div class="metric-card animated-bg" style="padding: 2rem;">
-                <h4 style="color: #e91e63; margin-bottom: 1rem;">🎯 The Real Tea: What's Holding Students Back</h4>
-                <p style="color: #2c3e50; margin-bottom: 1rem;">
+            <div class="metric-card animated-bg p-2">
+                <h4 class="c-pink mb-1">🎯 The Real Tea: What's Holding Students Back</h4>
+                <p class="c-ink mb-1">
                     Based on the unfiltered truth from <strong>{total_responses} students</strong>, here's what we need to fix:
                 </p>
-                <div style="display:flex; gap:0.5rem; flex-wrap:wrap;">
-                    <span style="background:#e91e63; color:#fff; padding:0.25rem 0.6rem; border-radius:999px; font-weight:700;">Critical {urgent_count}</span>
-                    <span style="background:#ff6b9d; color:#fff; padding:0.25rem 0.6rem; border-radius:999px; font-weight:700;">Important {important_count}</span>
-                    <span style="background:#9c27b0; color:#fff; padding:0.25rem 0.6rem; border-radius:999px; font-weight:700;">Next steps {next_count}</span>
+                <div class="flex gap-05 flex-wrap">
+                    <span class="c-white p-025-06 r-pill fw-7" style="background:#e91e63;">Critical {urgent_count}</span>
+                    <span class="c-white p-025-06 r-pill fw-7" style="background:#ff6b9d;">Important {important_count}</span>
+                    <span class="c-white p-025-06 r-pill fw-7" style="background:#9c27b0;">Next steps {next_count}</span>
                 </div>
             </div>
             """, unsafe_allow_html=True)
@@ -1722,18 +1282,18 @@ def say_it_page(df):
                 urgency_color = "#e91e63" if rec["urgency"] == "high" else "#ff6b9d" if rec["urgency"] == "medium" else "#9c27b0"
                 urgency_bg = "rgba(233, 30, 99, 0.1)" if rec["urgency"] == "high" else "rgba(255, 107, 157, 0.1)" if rec["urgency"] == "medium" else "rgba(156, 39, 176, 0.1)"
                 st.markdown(f"""
-                <div class="metric-card animated-bg" style="padding: 1.5rem; margin-bottom: 1.5rem; border-left: 4px solid {urgency_color};">
-                    <div style="display: flex; align-items: center; margin-bottom: 0.5rem;">
-                        <div style="font-size: 2rem; margin-right: 1rem;">{rec["icon"]}</div>
+                <div class="metric-card animated-bg p-15" style="margin-bottom: 1.5rem; border-left: 4px solid {urgency_color};">
+                    <div class="flex items-center mb-05">
+                        <div class="fs-2 mr-1">{rec["icon"]}</div>
                         <div>
-                            <div style="font-weight: 700; color: {urgency_color}; font-size: 1.1rem;">{rec["priority"]}</div>
-                            <div style="font-weight: 600; color: #2c3e50; font-size: 1.2rem;">{rec["title"]}</div>
+                            <div class="fw-7 fs-11" style="color: {urgency_color};">{rec["priority"]}</div>
+                            <div class="fw-6 c-ink fs-12">{rec["title"]}</div>
                         </div>
                     </div>
-                    <div style="color: #2c3e50; font-size: 1rem; margin-bottom: 0.5rem;">
+                    <div class="c-ink fs-1 mb-05">
                         <strong>Action:</strong> {rec["action"]}
                     </div>
-                    <div style="color: #7f8c8d; font-size: 0.9rem; background: {urgency_bg}; padding: 0.5rem; border-radius: 5px;">
+                    <div class="c-muted fs-09 p-05 r-5" style="background: {urgency_bg};">
                         {rec["description"]}
                     </div>
                 </div>
@@ -1741,44 +1301,40 @@ def say_it_page(df):
         else:
             st.info("Collect more responses to generate action items.")
 
-def quick_picks_page(df):
+def quick_picks_page(load):
     """Section 5: Vibes Check - Multi-select analysis with Gen Z flair"""
     st.markdown("""
-    <div class="animated-bg" style="text-align: center; margin-bottom: 3rem; padding: 3rem; border-radius: 25px; color: #2c3e50; box-shadow: 0 20px 40px rgba(0,0,0,0.1);">
-        <h1 class="hero-title" style="font-size: 3.5rem;">🎯 Vibes Check</h1>
-        <p style="font-size: 1.3rem; font-weight: 600; margin-bottom: 0.5rem; color: #34495e;">✨ Community Priorities & Support Needs ✨</p>
-        <p style="font-size: 1.1rem; margin-bottom: 1rem; color: #7f8c8d;">What would help girls in tech? Let's see what the community really wants!</p>
+    <div class="animated-bg tc mb-3 p-3 r-25 c-ink sh-lg">
+        <h1 class="hero-title fs-35">🎯 Vibes Check</h1>
+        <p class="fs-13 fw-6 mb-05 c-slate">✨ Community Priorities & Support Needs ✨</p>
+        <p class="fs-11 mb-1 c-muted">What would help girls in tech? Let's see what the community really wants!</p>
     </div>
     """, unsafe_allow_html=True)
     
+    df = load()
     if df.empty:
         st.markdown("""
-        <div class="metric-card animated-bg" style="text-align: center; padding: 4rem;">
-            <div style="font-size: 3rem; margin-bottom: 1rem;">📭</div>
-            <h2 class="text-dark" style="margin-bottom: 1rem;">No Responses Yet</h2>
-            <p class="text-light" style="font-size: 1.1rem;">The dashboard will populate once responses start coming in!</p>
+        <div class="metric-card animated-bg tc p-4">
+            <div class="fs-3 mb-1">📭</div>
+            <h2 class="text-dark mb-1">No Responses Yet</h2>
+            <p class="text-light fs-11">The dashboard will populate once responses start coming in!</p>
         </div>
         """, unsafe_allow_html=True)
         return
     
+    aggregates = get_aggregates(df)
+    help_counts = aggregates['help_counts']
+    help_percentages = aggregates['help_percentages']
+    
     # What would help girls in tech? (compact ranking)
     st.markdown('<h2 class="section-title">🚀 What Would Help Girls in Tech?</h2>', unsafe_allow_html=True)
     if 'help' in df.columns and not df['help'].isna().all():
-        help_responses = []
-        for response in df['help'].dropna():
-            if isinstance(response, list):
-                help_responses.extend(response)
-            elif isinstance(response, str):
-                help_responses.extend(response.split(','))
-        
-        if help_responses:
-            help_counts = Counter(help_responses)
-            total_responses = len(df)
-            ranked = sorted(((label, (count/total_responses)*100) for label, count in help_counts.items()), key=lambda x: x[1], reverse=True)
+        if len(help_counts) > 0:
+            total_responses = aggregates['total_responses']
 
             # Compact top 5 ranking list
             st.markdown("Top priorities (by share of responses):")
-            for i, (label, pct) in enumerate(ranked[:5], 1):
+            for i, (label, pct) in enumerate(help_percentages.head(5).items(), 1):
                 st.markdown(f"{i}. {label} — {pct:.1f}%")
             
             # All options breakdown (compute percentages)
@@ -1791,40 +1347,40 @@ def quick_picks_page(df):
                 'anonymous-reporting': 'Anonymous reporting system',
                 'not-sure': 'Not sure yet'
             }
-            all_percentages = {key: (help_counts.get(key, 0) / total_responses) * 100 for key in all_options_display.keys()}
-            sorted_all_options = sorted(all_percentages.items(), key=lambda x: x[1], reverse=True)
+            all_percentages = help_percentages.reindex(list(all_options_display.keys()), fill_value=0)
+            sorted_all_options = list(all_percentages.sort_values(ascending=False, kind='stable').items())
             
             col1, col2 = st.columns(2)
             
             with col1:
                 st.markdown("""
-                <div class="metric-card animated-bg" style="padding: 1.5rem;">
-                    <h4 style="color: #e91e63; margin-bottom: 1rem;">🏆 Top 3 Priorities</h4>
+                <div class="metric-card animated-bg p-15">
+                    <h4 class="c-pink mb-1">🏆 Top 3 Priorities</h4>
                 """, unsafe_allow_html=True)
                 
                 for i, (option_key, percentage) in enumerate(sorted_all_options[:3]):
                     option_name = all_options_display[option_key]
                     count = help_counts.get(option_key, 0)
                     st.markdown(f"""
-                    <div style="margin-bottom: 1rem; padding: 1rem; background: linear-gradient(45deg, #e91e63, #ff6b9d); border-radius: 10px; color: white;">
-                        <div style="font-size: 1.2rem; font-weight: 700; margin-bottom: 0.5rem;">#{i+1} {option_name}</div>
-                        <div style="font-size: 1rem;">{count} students ({percentage:.1f}%)</div>
+                    <div class="mb-1 p-1 bg-pink r-10 c-white">
+                        <div class="fs-12 fw-7 mb-05">#{i+1} {option_name}</div>
+                        <div class="fs-1">{count} students ({percentage:.1f}%)</div>
                     </div>
                     """, unsafe_allow_html=True)
             
             with col2:
                 st.markdown("""
-                <div class="metric-card animated-bg" style="padding: 1.5rem;">
-                    <h4 style="color: #e91e63; margin-bottom: 1rem;">📊 Other Options</h4>
+                <div class="metric-card animated-bg p-15">
+                    <h4 class="c-pink mb-1">📊 Other Options</h4>
                 """, unsafe_allow_html=True)
                 
                 for option_key, percentage in sorted_all_options[3:]:
                     option_name = all_options_display[option_key]
                     count = help_counts.get(option_key, 0)
                     st.markdown(f"""
-                    <div style="margin-bottom: 1rem; padding: 1rem; background: rgba(233, 30, 99, 0.1); border-radius: 10px;">
-                        <div style="font-weight: 600; color: #2c3e50; margin-bottom: 0.5rem;">{option_name}</div>
-                        <div style="color: #7f8c8d;">{count} students ({percentage:.1f}%)</div>
+                    <div class="mb-1 p-1 bg-pink-10 r-10">
+                        <div class="fw-6 c-ink mb-05">{option_name}</div>
+                        <div class="c-muted">{count} students ({percentage:.1f}%)</div>
                     </div>
                     """, unsafe_allow_html=True)
             
@@ -1837,12 +1393,12 @@ def quick_picks_page(df):
                 
                 with col1:
                     st.markdown("""
-                    <div class="metric-card animated-bg" style="padding: 1.5rem;">
-                        <h4 style="color: #e91e63; margin-bottom: 1rem;">🗣️ Voice Comfort vs Priorities</h4>
+                    <div class="metric-card animated-bg p-15">
+                        <h4 class="c-pink mb-1">🗣️ Voice Comfort vs Priorities</h4>
                     """, unsafe_allow_html=True)
                     
-                    # Group by voice comfort and analyze help priorities
-                    voice_groups = df.groupby('voice')['help'].apply(lambda x: [item for sublist in x.dropna() for item in (sublist if isinstance(sublist, list) else sublist.split(','))]).to_dict()
+                    # Respondents per voice comfort level and help option (precomputed cross-tab)
+                    help_by_voice = aggregates['help_by_voice']
                     
                     voice_labels = {
                         'heard': 'Voice Heard',
@@ -1851,23 +1407,22 @@ def quick_picks_page(df):
                         'depends': 'Depends on Situation'
                     }
                     
-                    for voice_level, help_items in voice_groups.items():
-                        if help_items:
-                            help_counter = Counter(help_items)
-                            top_help = help_counter.most_common(1)[0] if help_counter else ("N/A", 0)
-                            top_help_name = all_options_display.get(top_help[0], top_help[0])
+                    for voice_level, option_counts in help_by_voice.iterrows():
+                        if option_counts.sum() > 0:
+                            top_help = option_counts.idxmax()
+                            top_help_name = all_options_display.get(top_help, top_help)
                             voice_label = voice_labels.get(voice_level, voice_level)
                             st.markdown(f"""
-                            <div style="margin-bottom: 1rem; padding: 0.5rem; background: rgba(233, 30, 99, 0.1); border-radius: 5px;">
-                                <div style="font-weight: 600; color: #2c3e50;">{voice_label}</div>
-                                <div style="color: #7f8c8d; font-size: 0.9rem;">Top need: {top_help_name}</div>
+                            <div class="mb-1 p-05 bg-pink-10 r-5">
+                                <div class="fw-6 c-ink">{voice_label}</div>
+                                <div class="c-muted fs-09">Top need: {top_help_name}</div>
                             </div>
                             """, unsafe_allow_html=True)
                 
                 with col2:
                     st.markdown("""
-                    <div class="metric-card animated-bg" style="padding: 1.5rem;">
-                        <h4 style="color: #e91e63; margin-bottom: 1rem;">🔍 What This Data Reveals</h4>
+                    <div class="metric-card animated-bg p-15">
+                        <h4 class="c-pink mb-1">🔍 What This Data Reveals</h4>
                     """, unsafe_allow_html=True)
                     
                     # Generate deeper insights based on data patterns
@@ -1912,28 +1467,28 @@ def quick_picks_page(df):
                             insights.append("📋 <strong>Trust Issues:</strong> Students want transparent selection processes, indicating current opacity")
                     
                     # Overall pattern analysis
-                    total_selected = sum(help_counts.values())
+                    total_selected = help_counts.sum()
                     avg_selections = total_selected / total_responses if total_responses > 0 else 0
                     if avg_selections > 1.5:
                         insights.append("📊 <strong>Multiple Needs:</strong> Students have diverse needs, suggesting systemic issues across multiple areas")
                     
                     for insight in insights:
                         st.markdown(f"""
-                        <div style="margin-bottom: 0.5rem; padding: 0.5rem; background: rgba(255, 107, 157, 0.1); border-radius: 5px;">
-                            <div style="color: #2c3e50; font-size: 0.9rem;">{insight}</div>
+                        <div class="mb-05 p-05 bg-rose-10 r-5">
+                            <div class="c-ink fs-09">{insight}</div>
                         </div>
                         """, unsafe_allow_html=True)
         else:
             st.markdown("""
-            <div class="metric-card animated-bg" style="text-align: center; padding: 2rem;">
-                <div style="font-size: 2rem; margin-bottom: 1rem;">🚀</div>
+            <div class="metric-card animated-bg tc p-2">
+                <div class="fs-2 mb-1">🚀</div>
                 <p class="text-light">No help data available yet</p>
             </div>
             """, unsafe_allow_html=True)
     else:
         st.markdown("""
-        <div class="metric-card animated-bg" style="text-align: center; padding: 2rem;">
-            <div style="font-size: 2rem; margin-bottom: 1rem;">🚀</div>
+        <div class="metric-card animated-bg tc p-2">
+            <div class="fs-2 mb-1">🚀</div>
             <p class="text-light">No help data available yet</p>
         </div>
         """, unsafe_allow_html=True)
@@ -1942,18 +1497,10 @@ def quick_picks_page(df):
     if 'help' in df.columns and not df['help'].isna().all():
         st.markdown('<h2 class="section-title">💡 Key Takeaways</h2>', unsafe_allow_html=True)
         
-        total_responses = len(df)
-        help_responses = []
-        for response in df['help'].dropna():
-            if isinstance(response, list):
-                help_responses.extend(response)
-            elif isinstance(response, str):
-                help_responses.extend(response.split(','))
+        total_responses = aggregates['total_responses']
         
-        if help_responses:
-            help_counts = Counter(help_responses)
-            help_percentages = {item: (count / total_responses) * 100 for item, count in help_counts.items()}
-            sorted_help = dict(sorted(help_percentages.items(), key=lambda x: x[1], reverse=True))
+        if len(help_counts) > 0:
+            sorted_help = help_percentages.to_dict()
             
             # Generate insights
             top_3_priorities = list(sorted_help.keys())[:3]
@@ -1969,10 +1516,10 @@ def quick_picks_page(df):
             
             with col1:
                 st.markdown(f"""
-                <div class="metric-card animated-bg" style="text-align: center; padding: 1.5rem;">
-                    <div style="font-size: 2rem; margin-bottom: 0.5rem;">🎯</div>
-                    <div style="font-weight: 600; color: #e91e63;">Community Focus</div>
-                    <div style="color: #7f8c8d; font-size: 0.9rem; margin-top: 0.5rem;">
+                <div class="metric-card animated-bg tc p-15">
+                    <div class="fs-2 mb-05">🎯</div>
+                    <div class="fw-6 c-pink">Community Focus</div>
+                    <div class="c-muted fs-09 mt-05">
                         {'Clear priority identified' if has_clear_winner else 'Diverse needs across community'}
                     </div>
                 </div>
@@ -1980,21 +1527,21 @@ def quick_picks_page(df):
             
             with col2:
                 st.markdown(f"""
-                <div class="metric-card animated-bg" style="text-align: center; padding: 1.5rem;">
-                    <div style="font-size: 2rem; margin-bottom: 0.5rem;">📊</div>
-                    <div style="font-weight: 600; color: #e91e63;">Response Rate</div>
-                    <div style="color: #7f8c8d; font-size: 0.9rem; margin-top: 0.5rem;">
-                        {len(df['help'].dropna())} out of {total_responses} students
+                <div class="metric-card animated-bg tc p-15">
+                    <div class="fs-2 mb-05">📊</div>
+                    <div class="fw-6 c-pink">Response Rate</div>
+                    <div class="c-muted fs-09 mt-05">
+                        {aggregates['help_answered']} out of {total_responses} students
                     </div>
                 </div>
                 """, unsafe_allow_html=True)
             
             with col3:
                 st.markdown(f"""
-                <div class="metric-card animated-bg" style="text-align: center; padding: 1.5rem;">
-                    <div style="font-size: 2rem; margin-bottom: 0.5rem;">💭</div>
-                    <div style="font-weight: 600; color: #e91e63;">Need Diversity</div>
-                    <div style="color: #7f8c8d; font-size: 0.9rem; margin-top: 0.5rem;">
+                <div class="metric-card animated-bg tc p-15">
+                    <div class="fs-2 mb-05">💭</div>
+                    <div class="fw-6 c-pink">Need Diversity</div>
+                    <div class="c-muted fs-09 mt-05">
                         {len(sorted_help)} different support categories identified
                     </div>
                 </div>
@@ -2007,7 +1554,7 @@ def quick_picks_page(df):
             survey_insights = []
             
             # Calculate response patterns
-            total_selected = sum(help_counts.values())
+            total_selected = help_counts.sum()
             avg_selections = total_selected / total_responses if total_responses > 0 else 0
             
             # Analyze response patterns
@@ -2068,27 +1615,27 @@ def quick_picks_page(df):
             
             with col1:
                 st.markdown("""
-                <div class="metric-card animated-bg" style="padding: 1.5rem;">
-                    <h4 style="color: #e91e63; margin-bottom: 1rem;">🎯 What This Reveals</h4>
+                <div class="metric-card animated-bg p-15">
+                    <h4 class="c-pink mb-1">🎯 What This Reveals</h4>
                 """, unsafe_allow_html=True)
                 
                 for i, insight in enumerate(survey_insights[:len(survey_insights)//2]):
                     st.markdown(f"""
-                    <div style="margin-bottom: 0.5rem; padding: 0.5rem; background: rgba(233, 30, 99, 0.1); border-radius: 5px;">
-                        <div style="color: #2c3e50; font-size: 0.9rem;">{insight}</div>
+                    <div class="mb-05 p-05 bg-pink-10 r-5">
+                        <div class="c-ink fs-09">{insight}</div>
                     </div>
                     """, unsafe_allow_html=True)
             
             with col2:
                 st.markdown("""
-                <div class="metric-card animated-bg" style="padding: 1.5rem;">
-                    <h4 style="color: #e91e63; margin-bottom: 1rem;">💡 Cultural Insights</h4>
+                <div class="metric-card animated-bg p-15">
+                    <h4 class="c-pink mb-1">💡 Cultural Insights</h4>
                 """, unsafe_allow_html=True)
                 
                 for i, insight in enumerate(survey_insights[len(survey_insights)//2:]):
                     st.markdown(f"""
-                    <div style="margin-bottom: 0.5rem; padding: 0.5rem; background: rgba(255, 107, 157, 0.1); border-radius: 5px;">
-                        <div style="color: #2c3e50; font-size: 0.9rem;">{insight}</div>
+                    <div class="mb-05 p-05 bg-rose-10 r-5">
+                        <div class="c-ink fs-09">{insight}</div>
                     </div>
                     """, unsafe_allow_html=True)
             
@@ -2222,12 +1769,12 @@ def quick_picks_page(df):
             
             # Display summary
             st.markdown(f"""
-            <div class="metric-card animated-bg" style="padding: 2rem;">
-                <h4 style="color: #e91e63; margin-bottom: 1rem;">🎯 The Tea: What {total_responses} Students Want</h4>
-                <p style="color: #2c3e50; margin-bottom: 1rem;">
+            <div class="metric-card animated-bg p-2">
+                <h4 class="c-pink mb-1">🎯 The Tea: What {total_responses} Students Want</h4>
+                <p class="c-ink mb-1">
                     Based on the real talk from <strong>{total_responses} students</strong>, here's what needs to happen:
                 </p>
-                <div style="background: linear-gradient(45deg, #e91e63, #ff6b9d); padding: 1rem; border-radius: 10px; color: white;">
+                <div class="bg-pink p-1 r-10 c-white">
                     <strong>🔥 {priority_count} URGENT Actions Needed!</strong>
                 </div>
             </div>
@@ -2239,40 +1786,41 @@ def quick_picks_page(df):
                 urgency_bg = "rgba(233, 30, 99, 0.1)" if rec["urgency"] == "high" else "rgba(255, 107, 157, 0.1)" if rec["urgency"] == "medium" else "rgba(156, 39, 176, 0.1)"
                 
                 st.markdown(f"""
-                <div class="metric-card animated-bg" style="padding: 1.5rem; margin-bottom: 1.5rem; border-left: 4px solid {urgency_color};">
-                    <div style="display: flex; align-items: center; margin-bottom: 0.5rem;">
-                        <div style="font-size: 2rem; margin-right: 1rem;">{rec["icon"]}</div>
+                <div class="metric-card animated-bg p-15" style="margin-bottom: 1.5rem; border-left: 4px solid {urgency_color};">
+                    <div class="flex items-center mb-05">
+                        <div class="fs-2 mr-1">{rec["icon"]}</div>
                         <div>
-                            <div style="font-weight: 700; color: {urgency_color}; font-size: 1.1rem;">{rec["priority"]}</div>
-                            <div style="font-weight: 600; color: #2c3e50; font-size: 1.2rem;">{rec["title"]}</div>
+                            <div class="fw-7 fs-11" style="color: {urgency_color};">{rec["priority"]}</div>
+                            <div class="fw-6 c-ink fs-12">{rec["title"]}</div>
                         </div>
                     </div>
-                    <div style="color: #2c3e50; font-size: 1rem; margin-bottom: 0.5rem;">
+                    <div class="c-ink fs-1 mb-05">
                         <strong>Action:</strong> {rec["action"]}
                     </div>
-                    <div style="color: #7f8c8d; font-size: 0.9rem; background: {urgency_bg}; padding: 0.5rem; border-radius: 5px;">
+                    <div class="c-muted fs-09 p-05 r-5" style="background: {urgency_bg};">
                         {rec["description"]}
                     </div>
                 </div>
                 """, unsafe_allow_html=True)
 
-def parting_words_page(df):
+def parting_words_page(load):
     """Section 6: Parting Words - Gen Z Vibes ✨"""
     st.markdown("""
-    <div style="text-align: center; margin-bottom: 3rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 50%, #f093fb 100%); padding: 2rem; border-radius: 20px; color: white; box-shadow: 0 20px 40px rgba(102, 126, 234, 0.3);">
-        <h1 style="font-size: 3.5rem; margin-bottom: 0.5rem; font-weight: 800; text-shadow: 2px 2px 4px rgba(0,0,0,0.3);">💝 Parting Words</h1>
-        <p style="font-size: 1.3rem; margin-bottom: 0; opacity: 0.95; font-weight: 500;">✨ Messages to inspire the next generation ✨</p>
-        <div style="margin-top: 1rem; font-size: 1rem; opacity: 0.8;">Because every voice matters 💫</div>
+    <div class="tc mb-3 p-2 r-20 c-white" style="background: linear-gradient(135deg, #667eea 0%, #764ba2 50%, #f093fb 100%); box-shadow: 0 20px 40px rgba(102, 126, 234, 0.3);">
+        <h1 class="fs-35 mb-05" style="font-weight: 800; text-shadow: 2px 2px 4px rgba(0,0,0,0.3);">💝 Parting Words</h1>
+        <p class="fs-13 fw-5" style="margin-bottom: 0; opacity: 0.95;">✨ Messages to inspire the next generation ✨</p>
+        <div class="mt-1 fs-1" style="opacity: 0.8;">Because every voice matters 💫</div>
     </div>
     """, unsafe_allow_html=True)
     
+    df = load()
     if df.empty:
         st.markdown("""
-        <div style="text-align: center; padding: 4rem; background: linear-gradient(135deg, #ffecd2 0%, #fcb69f 100%); border-radius: 20px; border: 3px solid #ff6b9d; box-shadow: 0 15px 35px rgba(255, 107, 157, 0.2);">
-            <div style="font-size: 4rem; margin-bottom: 1rem;">📭</div>
-            <h2 style="color: #2c3e50; margin-bottom: 1rem; font-weight: 700; font-size: 2rem;">No Responses Yet</h2>
-            <p style="color: #34495e; font-size: 1.2rem; font-weight: 500;">The dashboard will populate once responses start coming in! 🚀</p>
-            <div style="margin-top: 2rem; font-size: 1.5rem;">✨ 💫 🌟</div>
+        <div class="tc p-4 bg-peach r-20 b-rose sh-rose">
+            <div class="fs-4 mb-1">📭</div>
+            <h2 class="c-ink mb-1 fw-7 fs-2">No Responses Yet</h2>
+            <p class="c-slate fs-12 fw-5">The dashboard will populate once responses start coming in! 🚀</p>
+            <div class="fs-15" style="margin-top: 2rem;">✨ 💫 🌟</div>
         </div>
         """, unsafe_allow_html=True)
         return
@@ -2319,26 +1867,26 @@ def parting_words_page(df):
                 
             else:
                 st.markdown("""
-                <div style="text-align: center; padding: 3rem; background: linear-gradient(135deg, #ffecd2 0%, #fcb69f 100%); border-radius: 20px; border: 3px solid #ff6b9d; box-shadow: 0 15px 35px rgba(255, 107, 157, 0.2);">
-                    <div style="font-size: 3rem; margin-bottom: 1rem;">💌</div>
-                    <p style="color: #2c3e50; font-size: 1.15rem; font-weight: 600; margin-bottom: 0.5rem;">ACM-W ABESEC desires to spread computing to remote areas</p>
-                    <p style="color: #7f8c8d; font-size: 1rem;">Reaching more women in remote regions, empowering them with computing as a tool, acknowledging their efforts, and sharing the warmth of this community through initiatives like <strong>#HourOfCode</strong>.</p>
+                <div class="tc p-3 bg-peach r-20 b-rose sh-rose">
+                    <div class="fs-3 mb-1">💌</div>
+                    <p class="c-ink fw-6 mb-05" style="font-size: 1.15rem;">ACM-W ABESEC desires to spread computing to remote areas</p>
+                    <p class="c-muted fs-1">Reaching more women in remote regions, empowering them with computing as a tool, acknowledging their efforts, and sharing the warmth of this community through initiatives like <strong>#HourOfCode</strong>.</p>
                 </div>
                 """, unsafe_allow_html=True)
         else:
             st.markdown("""
-            <div style="text-align: center; padding: 3rem; background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%); border-radius: 20px; border: 3px solid #ff6b9d; box-shadow: 0 15px 35px rgba(255, 107, 157, 0.2);">
-                <div style="font-size: 3rem; margin-bottom: 1rem;">💌</div>
-                <p style="color: #2c3e50; font-size: 1.2rem; font-weight: 600; margin-bottom: 0.5rem;">No advice messages available yet</p>
-                <p style="color: #7f8c8d; font-size: 1rem;">🌟 Stay tuned for wisdom! 🌟</p>
+            <div class="tc p-3 r-20 b-rose sh-rose" style="background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%);">
+                <div class="fs-3 mb-1">💌</div>
+                <p class="c-ink fs-12 fw-6 mb-05">No advice messages available yet</p>
+                <p class="c-muted fs-1">🌟 Stay tuned for wisdom! 🌟</p>
             </div>
             """, unsafe_allow_html=True)
     else:
         st.markdown("""
-        <div style="text-align: center; padding: 3rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 20px; border: 3px solid #ff6b9d; box-shadow: 0 15px 35px rgba(255, 107, 157, 0.2); color: white;">
-            <div style="font-size: 3rem; margin-bottom: 1rem;">💌</div>
-            <p style="font-size: 1.2rem; font-weight: 600; margin-bottom: 0.5rem;">No advice messages available yet</p>
-            <p style="font-size: 1rem; opacity: 0.9;">💫 The wisdom is coming! 💫</p>
+        <div class="tc p-3 r-20 b-rose sh-rose c-white" style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);">
+            <div class="fs-3 mb-1">💌</div>
+            <p class="fs-12 fw-6 mb-05">No advice messages available yet</p>
+            <p class="fs-1" style="opacity: 0.9;">💫 The wisdom is coming! 💫</p>
         </div>
         """, unsafe_allow_html=True)
 
@@ -2410,64 +1958,36 @@ def get_genz_messages():
         ]
     }
 
-def create_professional_metrics(df):
+def create_professional_metrics(aggregates):
     """Create professional dashboard metrics with Gen Z flair"""
     metrics = {}
     
     # Basic counts
-    metrics['total_responses'] = len(df)
-    metrics['unique_courses'] = len(df['course'].dropna().unique()) if 'course' in df.columns else 0
-    metrics['unique_years'] = len(df['year'].dropna().unique()) if 'year' in df.columns else 0
+    metrics['total_responses'] = aggregates['total_responses']
+    metrics['unique_courses'] = aggregates['unique_courses']
+    metrics['unique_years'] = aggregates['unique_years']
     
     # Response rate (if we had total population)
     metrics['response_rate'] = "N/A"  # Would need total population data
     
     # Sentiment analysis
-    mood_questions = ['boys-club', 'equal-chances', 'safe-supported', 'held-back', 'women-mentors']
-    mood_scores = []
-    for q in mood_questions:
-        if q in df.columns:
-            numeric_values = pd.to_numeric(df[q], errors='coerce')
-            if not numeric_values.isna().all():
-                mood_scores.append(numeric_values.mean())
-    
-    metrics['avg_sentiment'] = np.mean(mood_scores) if mood_scores else 0
+    metrics['avg_sentiment'] = aggregates['avg_mood']
     metrics['sentiment_trend'] = "Stable"  # Would need historical data
     
     # Issues identification
-    if 'judged' in df.columns and not df['judged'].isna().all():
-        judged_responses = df['judged'].dropna()
-        if len(judged_responses) > 0:
-            metrics['judged_percentage'] = len(judged_responses[judged_responses.isin(['multiple', 'sometimes'])]) / len(judged_responses) * 100
-        else:
-            metrics['judged_percentage'] = 0
-    else:
-        metrics['judged_percentage'] = 0
+    metrics['judged_percentage'] = aggregates['judged_pct']
     
     # Top concerns
-    if 'help' in df.columns and not df['help'].isna().all():
-        help_responses = []
-        for response in df['help'].dropna():
-            if isinstance(response, list):
-                help_responses.extend(response)
-            elif isinstance(response, str):
-                help_responses.extend(response.split(','))
-        
-        if help_responses:
-            help_counts = Counter(help_responses)
-            metrics['top_concern'] = help_counts.most_common(1)[0][0] if help_counts else "N/A"
-        else:
-            metrics['top_concern'] = "N/A"
-    else:
-        metrics['top_concern'] = "N/A"
+    metrics['top_concern'] = aggregates['top_help'] or "N/A"
     
     return metrics
 
-def create_genz_insights(df):
-    """Generate comprehensive Gen Z style insights from the data"""
+def create_genz_insights(aggregates):
+    """Generate comprehensive Gen Z style insights from the precomputed aggregates"""
     insights = []
     
-    total_responses = len(df)
+    total_responses = aggregates['total_responses']
+    value_counts = aggregates['value_counts']
     
     # Response volume insights
     if total_responses > 100:
@@ -2480,15 +2000,7 @@ def create_genz_insights(df):
         insights.append("💫 Every voice matters - the journey has begun!")
     
     # Sentiment insights
-    mood_questions = ['boys-club', 'equal-chances', 'safe-supported', 'held-back', 'women-mentors']
-    mood_scores = []
-    for q in mood_questions:
-        if q in df.columns:
-            numeric_values = pd.to_numeric(df[q], errors='coerce')
-            if not numeric_values.isna().all():
-                mood_scores.append(numeric_values.mean())
-    
-    avg_mood = np.mean(mood_scores) if mood_scores else 0
+    avg_mood = aggregates['avg_mood']
     
     if avg_mood >= 3.5:
         insights.append("😊 The community is feeling positive and supported!")
@@ -2498,8 +2010,8 @@ def create_genz_insights(df):
         insights.append("💪 Time to build stronger support systems!")
     
     # Course diversity insights
-    if 'course' in df.columns and not df['course'].isna().all():
-        unique_courses = len(df['course'].dropna().unique())
+    if aggregates['unique_courses'] > 0:
+        unique_courses = aggregates['unique_courses']
         if unique_courses > 10:
             insights.append("📚 Amazing diversity across 10+ different courses!")
         elif unique_courses > 5:
@@ -2508,16 +2020,14 @@ def create_genz_insights(df):
             insights.append("🌟 Building representation across different fields!")
     
     # Year distribution insights
-    if 'year' in df.columns and not df['year'].isna().all():
-        year_counts = df['year'].dropna().value_counts()
-        if len(year_counts) > 0:
-            most_common_year = year_counts.index[0]
-            insights.append(f"🎓 {most_common_year} students are leading the charge!")
+    year_counts = value_counts['year']
+    if len(year_counts) > 0:
+        most_common_year = year_counts.index[0]
+        insights.append(f"🎓 {most_common_year} students are leading the charge!")
     
     # Judgment insights
-    if 'judged' in df.columns and not df['judged'].isna().all():
-        judged_responses = df['judged'].dropna()
-        judged_pct = len(judged_responses[judged_responses.isin(['multiple', 'sometimes'])]) / len(judged_responses) * 100
+    if len(value_counts['judged']) > 0:
+        judged_pct = aggregates['judged_pct']
         if judged_pct > 50:
             insights.append("⚠️ High judgment rates detected - urgent need for allyship and support!")
         elif judged_pct > 25:
@@ -2526,55 +2036,41 @@ def create_genz_insights(df):
             insights.append("💪 Low judgment rates - great progress in building inclusive environments!")
     
     # Voice insights
-    if 'voice' in df.columns and not df['voice'].isna().all():
-        voice_counts = df['voice'].dropna().value_counts()
+    voice_counts = value_counts['voice']
+    if len(voice_counts) > 0:
         if 'comfortable' in voice_counts.index and voice_counts['comfortable'] > voice_counts.sum() * 0.5:
             insights.append("🎙️ Most students feel comfortable speaking up - positive group dynamics!")
         elif 'uncomfortable' in voice_counts.index and voice_counts['uncomfortable'] > voice_counts.sum() * 0.3:
             insights.append("🤐 Many students feel uncomfortable speaking up - need safer spaces!")
     
     # Help priorities insights
-    if 'help' in df.columns and not df['help'].isna().all():
-        help_responses = []
-        for response in df['help'].dropna():
-            if isinstance(response, list):
-                help_responses.extend(response)
-            elif isinstance(response, str):
-                help_responses.extend(response.split(','))
-        
-        if help_responses:
-            help_counts = Counter(help_responses)
-            top_help = help_counts.most_common(1)[0][0] if help_counts else ""
-            if 'mentor' in top_help.lower():
-                insights.append("👩‍🏫 Mentorship is the top priority - women want role models and guidance!")
-            elif 'support' in top_help.lower():
-                insights.append("🤝 Support systems are key - community and allyship matter most!")
-            elif 'opportunity' in top_help.lower():
-                insights.append("🚀 Opportunities are in demand - women want chances to grow and excel!")
+    if aggregates['top_help']:
+        top_help = aggregates['top_help']
+        if 'mentor' in top_help.lower():
+            insights.append("👩‍🏫 Mentorship is the top priority - women want role models and guidance!")
+        elif 'support' in top_help.lower():
+            insights.append("🤝 Support systems are key - community and allyship matter most!")
+        elif 'opportunity' in top_help.lower():
+            insights.append("🚀 Opportunities are in demand - women want chances to grow and excel!")
     
     # Activity insights
-    if 'createdAt' in df.columns and not df['createdAt'].isna().all():
-        try:
-            df['date'] = pd.to_datetime(df['createdAt']).dt.date
-            recent_activity = df['date'].value_counts().sort_index().tail(3)
-            if recent_activity.sum() > 10:
-                insights.append("📈 High recent engagement - community is actively participating and growing!")
-            elif recent_activity.sum() > 5:
-                insights.append("📊 Steady participation - consistent engagement shows sustained interest!")
-        except:
-            pass
+    recent_activity = aggregates['recent_activity']
+    if recent_activity > 10:
+        insights.append("📈 High recent engagement - community is actively participating and growing!")
+    elif recent_activity > 5:
+        insights.append("📊 Steady participation - consistent engagement shows sustained interest!")
     
     # Gender dynamics insights
-    if 'stepped-back' in df.columns and not df['stepped-back'].isna().all():
-        stepped_counts = df['stepped-back'].dropna().value_counts()
+    stepped_counts = value_counts['stepped-back']
+    if len(stepped_counts) > 0:
         if 'yes' in stepped_counts.index and stepped_counts['yes'] > stepped_counts.sum() * 0.3:
             insights.append("🚶‍♀️ Many women have stepped back from opportunities - need to address barriers!")
         elif 'no' in stepped_counts.index and stepped_counts['no'] > stepped_counts.sum() * 0.7:
             insights.append("💪 Most women are staying engaged - great resilience and determination!")
     
     # Curfew impact insights
-    if 'curfews' in df.columns and not df['curfews'].isna().all():
-        curfew_counts = df['curfews'].dropna().value_counts()
+    curfew_counts = value_counts['curfews']
+    if len(curfew_counts) > 0:
         if 'yes' in curfew_counts.index and curfew_counts['yes'] > curfew_counts.sum() * 0.4:
             insights.append("🕒 Curfews are significantly impacting participation - need flexible solutions!")
         elif 'no' in curfew_counts.index and curfew_counts['no'] > curfew_counts.sum() * 0.6:
@@ -2582,35 +2078,44 @@ def create_genz_insights(df):
     
     return insights
 
+# Page routes; the columns each page needs are declared in column_groups.PAGE_COLUMNS
+PAGES = {
+    "overview": overview_page,
+    "who-are-you": who_are_you_page,
+    "real-talk": real_talk_page,
+    "mood-check": mood_check_page,
+    "say-it": say_it_page,
+    "quick-picks": quick_picks_page,
+    "parting-words": parting_words_page,
+}
+
 # Main app logic
-def main():
+@st.fragment
+def dashboard():
+    """Navbar and current page
+
+    A fragment: navbar clicks rerun only this function, not the page setup,
+    CSS and Firebase initialization above it.
+    """
     # Get current page from URL parameters
     current_page = st.query_params.get("page", "overview")
     
     # Create navbar
     create_navbar(current_page)
     
-    # Fetch data
-    df = fetch_responses()
-    
-    # Route to appropriate page
-    if current_page == "overview":
-        overview_page(df)
-    elif current_page == "who-are-you":
-        who_are_you_page(df)
-    elif current_page == "real-talk":
-        real_talk_page(df)
-    elif current_page == "mood-check":
-        mood_check_page(df)
-    elif current_page == "say-it":
-        say_it_page(df)
-    elif current_page == "quick-picks":
-        quick_picks_page(df)
-    elif current_page == "parting-words":
-        parting_words_page(df)
-    else:
+    # Unknown pages fall back to the overview
+    page = current_page if current_page in PAGES else "overview"
+    
+    # Start loading this page's data in the background; the page renders its
+    # static sections right away and waits for the data where it needs it
+    load = start_loading(page)
+    
+    if page != current_page:
         st.error(f"Unknown page: {current_page}")
-        overview_page(df)
+    PAGES[page](load)
+
+def main():
+    dashboard()
 
 if __name__ == "__main__":
     main()
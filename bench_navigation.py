@@ -0,0 +1,50 @@
+"""Navbar click latency: full script rerun vs dashboard fragment rerun
+
+Run with the same Firebase configuration as the dashboard:
+
+    python bench_navigation.py [runs]
+
+"Full rerun" runs app.py from the top for every page switch (what a navbar
+click cost before the navbar and pages moved into the dashboard fragment).
+"Fragment rerun" only runs dashboard(), like a navbar click does now: the
+module, its CSS and the Firebase initialization have run once already.
+Caches are warmed before timing, so both measure steady-state reruns.
+"""
+import statistics
+import sys
+import time
+
+from streamlit.testing.v1 import AppTest
+
+PAGES = ["overview", "who-are-you", "real-talk", "mood-check", "say-it", "quick-picks", "parting-words"]
+
+
+def time_runs(at: AppTest, runs: int) -> dict:
+    """Median seconds of a rerun per page, switching pages like the navbar does"""
+    timings = {page: [] for page in PAGES}
+    for i in range(runs + 1):
+        for page in PAGES:
+            at.query_params["page"] = page
+            started = time.perf_counter()
+            at.run()
+            elapsed = time.perf_counter() - started
+            if at.exception:
+                raise RuntimeError(f"{page}: {at.exception[0].value}")
+            if i:  # the first round warms the caches
+                timings[page].append(elapsed)
+    return {page: statistics.median(values) for page, values in timings.items()}
+
+
+def main(runs: int = 5):
+    full = time_runs(AppTest.from_file("app.py", default_timeout=60), runs)
+    fragment = time_runs(AppTest.from_string("import app\napp.dashboard()", default_timeout=60), runs)
+
+    print(f"{'page':<15}{'full rerun':>12}{'fragment':>12}")
+    for page in PAGES:
+        print(f"{page:<15}{full[page] * 1000:>10.1f}ms{fragment[page] * 1000:>10.1f}ms")
+    print(f"{'median':<15}{statistics.median(full.values()) * 1000:>10.1f}ms"
+          f"{statistics.median(fragment.values()) * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,59 @@
+from typing import Optional, Dict, Any, List, Tuple
+
+from resilience import RETRYABLE_ERRORS, FirestoreUnavailable
+
+# Firestore accepts at most 500 writes per batch commit
+BATCH_LIMIT = 500
+
+# Commit errors that are about Firestore, not about the batch's own writes:
+# contention, throttling, outages and an open circuit breaker
+BATCH_INDEPENDENT_ERRORS = RETRYABLE_ERRORS + (FirestoreUnavailable,)
+
+# (operation, document_ref, data): operation is 'set', 'update' or 'delete'
+Operation = Tuple[str, Any, Optional[Dict[str, Any]]]
+
+
+def chunk_operations(operations: List[Operation], batch_size: int) -> List[List[Operation]]:
+    """Split operations into batches of ``batch_size`` (at most BATCH_LIMIT) writes"""
+    batch_size = max(1, min(batch_size, BATCH_LIMIT))
+    return [operations[start:start + batch_size] for start in range(0, len(operations), batch_size)]
+
+
+def new_batch(db, chunk: List[Operation]):
+    """A WriteBatch (sync or async client) holding the chunk's writes"""
+    batch = db.batch()
+    for operation, doc_ref, data in chunk:
+        if operation == 'delete':
+            batch.delete(doc_ref)
+        else:
+            getattr(batch, operation)(doc_ref, data)
+    return batch
+
+
+def needs_isolation(chunk: List[Operation], error: Optional[Exception]) -> bool:
+    """Whether a failed batch should be replayed one write at a time
+
+    Only for errors caused by some write (e.g. updating a missing
+    document), so that just the offending writes are reported as failed.
+    """
+    return error is not None and len(chunk) > 1 and not isinstance(error, BATCH_INDEPENDENT_ERRORS)
+
+
+def write_result(operation: Operation, error: Optional[Exception]) -> Dict[str, Any]:
+    return {
+        'id': operation[1].id,
+        'operation': operation[0],
+        'success': error is None,
+        'error': str(error) if error is not None else None,
+    }
+
+
+def bulk_report(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """{'succeeded', 'failed', 'results'} for the per-operation results, printed as a summary"""
+    succeeded = sum(1 for result in results if result['success'])
+    failed = len(results) - succeeded
+    if failed:
+        print(f"❌ Bulk write: {succeeded} succeeded, {failed} failed")
+    else:
+        print(f"✅ Bulk write: {succeeded} documents written successfully!")
+    return {'succeeded': succeeded, 'failed': failed, 'results': results}
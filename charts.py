@@ -0,0 +1,146 @@
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Sequence, Tuple
+
+import plotly.express as px
+import plotly.graph_objects as go
+
+# Look shared by every dashboard chart. It is applied as layout values rather
+# than as a Plotly template because Streamlit's chart theme replaces the
+# template's layout settings.
+CHART_LAYOUT = go.Layout(
+    plot_bgcolor='rgba(0,0,0,0)',
+    paper_bgcolor='rgba(0,0,0,0)',
+    font=dict(size=14),
+    margin=dict(l=20, r=20, t=40, b=20),
+)
+
+# Built figures kept in memory; one per distinct chart and set of counts
+FIGURE_CACHE_SIZE = 64
+
+
+class ChartSpec(NamedTuple):
+    """One answer-count chart of the dashboard and its empty state"""
+    column: str
+    kind: str  # 'bar', 'hbar' (horizontal bar) or 'pie'
+    heading: str
+    title: str
+    colors: Tuple[str, ...]
+    empty_icon: str
+    empty_text: str
+    x_title: str = ""
+    y_title: str = ""
+    limit: Optional[int] = None  # only chart the most common answers
+
+
+# Charts of single-choice questions, by column
+CHART_SPECS: Dict[str, ChartSpec] = {spec.column: spec for spec in (
+    ChartSpec('year', 'bar', "🎓 Year-wise Breakdown", "📊 Student Distribution by Academic Year",
+              ('#e91e63',), "📊", "No year data available yet",
+              "Academic Year", "Number of Students"),
+    ChartSpec('course', 'hbar', "📚 Course Analysis", "📚 Top 10 Courses by Student Count",
+              ('#ff6b9d',), "📚", "No course data available yet",
+              "Number of Students", "Course/Program", limit=10),
+    ChartSpec('judged', 'pie', "🤔 Ever Felt Judged in Tech Spaces?", "🤔 Experience of Judgment in Tech Spaces",
+              ('#e91e63', '#ff6b9d', '#9c27b0', '#673ab7'), "🤔", "No judgment data available yet"),
+    ChartSpec('voice', 'bar', "🎙️ Voice in Group Projects", "🎙️ Comfort Level Speaking Up in Group Projects",
+              ('#e91e63',), "🎙️", "No voice data available yet",
+              "Response Category", "Number of Students"),
+    ChartSpec('stepped-back', 'pie', "🚶‍♀️ Stepped Back from Tech?",
+              "🚶‍♀️ Experience of Stepping Back from Tech Opportunities",
+              ('#ff6b9d', '#e91e63', '#9c27b0', '#673ab7'), "🚶‍♀️", "No stepped back data available yet"),
+    ChartSpec('curfews', 'bar', "🕒 Hostel Curfews Impacting Participation?",
+              "🕒 Impact of Hostel Curfews on Tech Participation",
+              ('#9c27b0',), "🕒", "No curfew data available yet",
+              "Response Category", "Number of Students"),
+)}
+
+
+def spec_chart(spec: ChartSpec, counts) -> go.Figure:
+    """Figure for ``spec`` from its answer counts (a value_counts Series, not empty)"""
+    if spec.limit:
+        counts = counts.head(spec.limit)
+    if spec.kind == 'pie':
+        return pie_chart(counts.values, counts.index, spec.title, spec.colors)
+    if spec.kind == 'hbar':
+        return bar_chart(counts.values, counts.index, spec.title, spec.colors[0],
+                         spec.x_title, spec.y_title, orientation='h')
+    return bar_chart(counts.index, counts.values, spec.title, spec.colors[0], spec.x_title, spec.y_title)
+
+
+@lru_cache(maxsize=None)
+def section_html(spec: ChartSpec, empty: bool = False) -> str:
+    """Heading of the chart's section, followed by the empty-state card when there is no data
+
+    One string, so the section costs a single st.markdown call.
+    """
+    html = f'<h2 class="section-title">{spec.heading}</h2>'
+    if empty:
+        html += (
+            '\n<div class="metric-card animated-bg tc p-2">'
+            f'<div class="fs-2 mb-1">{spec.empty_icon}</div>'
+            f'<p class="text-light">{spec.empty_text}</p></div>'
+        )
+    return html
+
+
+def bar_chart(x: Sequence, y: Sequence, title: str, color: str, x_title: str, y_title: str,
+              orientation: str = 'v') -> go.Figure:
+    """Themed bar chart, built once per distinct data and styling
+
+    The figure is shared between callers (and sessions), so treat it as
+    read-only.
+    """
+    return _bar_chart(tuple(x), tuple(y), title, color, x_title, y_title, orientation)
+
+
+def pie_chart(values: Sequence, names: Sequence, title: str, colors: Sequence[str]) -> go.Figure:
+    """Themed pie chart, built once per distinct data and styling (read-only, see bar_chart)"""
+    return _pie_chart(tuple(values), tuple(names), title, tuple(colors))
+
+
+def radar_chart(r: Sequence[float], theta: Sequence[str], color: str, fill_color: str,
+                radial_range: Tuple[float, float] = (0, 5)) -> go.Figure:
+    """Themed filled radar chart, built once per distinct data and styling (read-only, see bar_chart)"""
+    return _radar_chart(tuple(r), tuple(theta), color, fill_color, tuple(radial_range))
+
+
+@lru_cache(maxsize=FIGURE_CACHE_SIZE)
+def _bar_chart(x, y, title, color, x_title, y_title, orientation) -> go.Figure:
+    fig = px.bar(x=list(x), y=list(y), orientation=orientation, title=title, color_discrete_sequence=[color])
+    fig.update_layout(CHART_LAYOUT, xaxis_title=x_title, yaxis_title=y_title)
+    return fig
+
+
+@lru_cache(maxsize=FIGURE_CACHE_SIZE)
+def _pie_chart(values, names, title, colors) -> go.Figure:
+    fig = px.pie(values=list(values), names=list(names), title=title, color_discrete_sequence=list(colors))
+    fig.update_layout(CHART_LAYOUT)
+    return fig
+
+
+@lru_cache(maxsize=FIGURE_CACHE_SIZE)
+def _radar_chart(r, theta, color, fill_color, radial_range) -> go.Figure:
+    fig = go.Figure()
+    fig.add_trace(go.Scatterpolar(
+        r=list(r),
+        theta=list(theta),
+        fill='toself',
+        name='Average Response',
+        line_color=color,
+        fillcolor=fill_color
+    ))
+    fig.update_layout(
+        CHART_LAYOUT,
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=list(radial_range),
+                tickfont=dict(size=12)
+            ),
+            angularaxis=dict(
+                tickfont=dict(size=11)
+            )
+        ),
+        showlegend=False
+    )
+    return fig
@@ -0,0 +1,30 @@
+from typing import Dict, List
+
+from survey_schema import CHOICE_QUESTIONS, FREE_CATEGORY_QUESTIONS, SCALE_QUESTIONS
+
+# Long free-text answers; the bulk of every document's payload
+TEXT_QUESTIONS = ['held-back-report', 'one-change', 'advice']
+
+# Fields downloaded and cached together. Every group also carries the
+# watermark timestamps (see ResponseSync).
+COLUMN_GROUPS: Dict[str, List[str]] = {
+    'answers': list(CHOICE_QUESTIONS) + FREE_CATEGORY_QUESTIONS + SCALE_QUESTIONS + ['help'],
+    'text': TEXT_QUESTIONS,
+}
+
+# Columns each dashboard page reads. Pages get every column of the groups
+# these fall in, so get_aggregates() always sees the whole 'answers' group.
+PAGE_COLUMNS: Dict[str, List[str]] = {
+    # Also offers the CSV export of every answer
+    'overview': COLUMN_GROUPS['answers'] + TEXT_QUESTIONS,
+    'who-are-you': ['year', 'course', 'judged'],
+    'real-talk': ['voice', 'stepped-back', 'curfews', 'year'],
+    'mood-check': SCALE_QUESTIONS,
+    'say-it': ['held-back-report', 'one-change'],
+    'quick-picks': ['help', 'voice'],
+    'parting-words': ['advice'],
+}
+
+def groups_for(columns: List[str]) -> List[str]:
+    """Column groups needed to provide ``columns``, in COLUMN_GROUPS order"""
+    return [group for group, fields in COLUMN_GROUPS.items() if any(column in fields for column in columns)]
@@ -0,0 +1,173 @@
+import threading
+import time
+from datetime import datetime
+from typing import Optional, Dict, Any, Callable, Tuple
+
+import pandas as pd
+
+# Copy-on-Write is always on from pandas 3.0; before that the app turns it on
+# at startup (see app.py)
+PANDAS_COPY_ON_WRITE = int(pd.__version__.split('.')[0]) >= 3
+
+
+class DatasetStore:
+    """Process-wide holder of the current responses DataFrame
+
+    Every caller gets a shallow, Copy-on-Write view of the same resident
+    frame, so concurrent sessions do not each hold a copy. Without
+    Copy-on-Write (pandas < 3 with ``mode.copy_on_write`` off) callers get a
+    deep copy instead. ``refresh`` is
+    called at most once per ``refresh_interval`` seconds (or after
+    ``invalidate``) and returns the latest frame with its version; a new view
+    is only published when the version changes.
+
+    Only the first ``get`` waits for ``refresh``. After that the store is
+    stale-while-revalidate: a due refresh runs on a background thread, at most
+    one at a time however many callers arrive, while callers keep getting the
+    current frame until the new one is swapped in.
+
+    Once published, a frame keeps being served while refreshes fail. Before
+    that, ``fallback`` may return a (frame, version) to serve instead, e.g.
+    a local snapshot, or None to let the error through.
+
+    Views carry ``attrs['dataset_version']`` and ``attrs['as_of']``, the time
+    of the last successful refresh (None while serving the fallback).
+    """
+
+    def __init__(self, refresh: Callable[[], Tuple[pd.DataFrame, int]], refresh_interval: float = 30,
+                 fallback: Optional[Callable[[], Optional[Tuple[pd.DataFrame, int]]]] = None):
+        self.refresh = refresh
+        self.refresh_interval = refresh_interval
+        self.fallback = fallback
+        self.version: Optional[int] = None
+        self.published_at: Optional[datetime] = None
+        self.refreshed_at: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.refreshes = 0
+        self._df: Optional[pd.DataFrame] = None
+        self._checked_at = 0.0
+        self._refresh_thread: Optional[threading.Thread] = None
+        # Re-entrant: refresh may trigger listener callbacks that invalidate()
+        # on the same thread while the first get() holds the lock
+        self._lock = threading.RLock()
+
+    def get(self) -> pd.DataFrame:
+        """Return a read-only view of the current dataset, starting a refresh if one is due"""
+        with self._lock:
+            if self._df is None:
+                # Nothing to serve yet; concurrent first callers wait on the lock
+                self.misses += 1
+                self._apply(*self._load())
+                return self._view()
+
+            if time.monotonic() - self._checked_at >= self.refresh_interval:
+                self._start_refresh()
+            if self.is_refreshing:
+                self.stale_hits += 1
+            else:
+                self.hits += 1
+            return self._view()
+
+    @property
+    def is_refreshing(self) -> bool:
+        """Whether a background refresh is running"""
+        thread = self._refresh_thread
+        return thread is not None and thread.is_alive()
+
+    def invalidate(self):
+        """Make the next get() ask for fresh data regardless of the refresh interval"""
+        # Listener callbacks call this after their sync has released its own
+        # lock, so waiting here for a running refresh cannot deadlock
+        # (and the lock is re-entrant for callbacks the refresh itself fires)
+        with self._lock:
+            self._checked_at = 0.0
+
+    def wait(self, timeout: Optional[float] = None):
+        """Block until the running background refresh (if any) has finished"""
+        thread = self._refresh_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and the size of the resident dataset"""
+        with self._lock:
+            df = self._df
+            lookups = self.hits + self.stale_hits + self.misses
+            return {
+                'version': self.version,
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'hit_rate': (self.hits + self.stale_hits) / lookups if lookups else 0,
+                'refreshes': self.refreshes,
+                'refreshing': self.is_refreshing,
+                'rows': len(df) if df is not None else 0,
+                'bytes': int(df.memory_usage(deep=False).sum()) if df is not None else 0,
+                'published_at': self.published_at,
+                'refreshed_at': self.refreshed_at,
+                'last_error': self.last_error,
+            }
+
+    def _start_refresh(self):
+        # Called with the lock held, so only one refresh thread is ever started
+        if self.is_refreshing:
+            return
+        self._checked_at = time.monotonic()
+        self._refresh_thread = threading.Thread(target=self._refresh_in_background, name="dataset-refresh", daemon=True)
+        self._refresh_thread.start()
+
+    def _refresh_in_background(self):
+        result = self._load()
+        with self._lock:
+            self._apply(*result)
+
+    def _load(self) -> Tuple[Optional[Tuple[pd.DataFrame, int]], Optional[Exception]]:
+        """Call refresh without touching the published state"""
+        self.refreshes += 1
+        try:
+            return self.refresh(), None
+        except Exception as e:
+            return None, e
+
+    def _apply(self, result: Optional[Tuple[pd.DataFrame, int]], error: Optional[Exception]):
+        """Publish a refresh result (called with the lock held)"""
+        self._checked_at = time.monotonic()
+        if error is None:
+            df, version = result
+            self.last_error = None
+            self.refreshed_at = datetime.now()
+            if self._df is None or version != self.version:
+                self._publish(df, version)
+            return
+
+        self.last_error = str(error)
+        if self._df is not None:
+            # Keep serving what we have
+            print(f"❌ Dataset refresh failed, serving version {self.version}: {self.last_error}")
+            return
+        fallback = self.fallback() if self.fallback is not None else None
+        if fallback is None:
+            raise error
+        print(f"❌ Dataset refresh failed, serving the fallback data: {self.last_error}")
+        self._publish(*fallback)
+
+    def _publish(self, df: pd.DataFrame, version: int):
+        # Swapping the reference is atomic: readers see the old frame or the new one
+        self._df = df.copy(deep=False)
+        self._df.attrs['dataset_version'] = version
+        self.version = version
+        self.published_at = datetime.now()
+
+    def _view(self) -> pd.DataFrame:
+        # Shallow copy: shares the column data, and Copy-on-Write keeps the
+        # resident frame untouched if a page writes to its view
+        view = self._df.copy(deep=not _copy_on_write())
+        view.attrs['as_of'] = self.refreshed_at
+        return view
+
+
+def _copy_on_write() -> bool:
+    return PANDAS_COPY_ON_WRITE or pd.get_option('mode.copy_on_write') is True
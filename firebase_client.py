@@ -0,0 +1,186 @@
+import threading
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any
+
+import firebase_admin
+from firebase_admin import firestore
+import grpc
+from google.auth.transport.requests import Request
+from google.cloud.firestore_v1.services.firestore import client as firestore_client
+from google.cloud.firestore_v1.services.firestore.transports import grpc as firestore_grpc_transport
+
+# gRPC channel settings for the shared Firestore client. Keepalive pings stop
+# idle connections (e.g. between dashboard reruns) from being silently
+# dropped by proxies and load balancers, so the next read does not stall on
+# a dead connection.
+CHANNEL_OPTIONS: Dict[str, Any] = {
+    'grpc.keepalive_time_ms': 30000,
+    'grpc.keepalive_timeout_ms': 10000,
+    'grpc.keepalive_permit_without_calls': 1,
+    'grpc.http2.max_pings_without_data': 0,
+    'grpc.max_send_message_length': -1,
+    'grpc.max_receive_message_length': -1,
+}
+
+# Attributes of firestore.Client that _install_channel reads (the first five)
+# or replaces (the last). The client has no public way to pass channel
+# options, so these are private; google-cloud-firestore is pinned in
+# requirements.txt and test_firebase_client.py fails if any of them goes.
+CLIENT_INTERNALS = ('_target', '_credentials', '_client_options', '_client_info', '_emulator_host',
+                    '_firestore_api_internal')
+
+# Refresh the OAuth token this many seconds before it expires
+TOKEN_REFRESH_MARGIN = 300
+
+# Retry interval when a token refresh fails or the expiry is unknown
+TOKEN_RETRY_INTERVAL = 60
+
+# Never refresh more often than this, even for short-lived tokens
+TOKEN_MIN_REFRESH_INTERVAL = 30
+
+
+class FirestoreClientFactory:
+    """Process-wide Firestore client with a pre-warmed channel and token
+
+    ``client()`` initializes the Firebase Admin app and the Firestore client
+    once per process; later calls return the same client. The first call
+    starts a background thread that fetches the OAuth token and opens the
+    gRPC channel, then keeps refreshing the token ``token_refresh_margin``
+    seconds before it expires, so requests never wait on either.
+    """
+
+    def __init__(self, channel_options: Optional[Dict[str, Any]] = None,
+                 token_refresh_margin: float = TOKEN_REFRESH_MARGIN, warm_up_timeout: float = 10):
+        self.channel_options = dict(CHANNEL_OPTIONS if channel_options is None else channel_options)
+        self.token_refresh_margin = token_refresh_margin
+        self.warm_up_timeout = warm_up_timeout
+        self.token_expiry: Optional[datetime] = None
+        self.token_refreshes = 0
+        self.channel_ready = False
+        self.last_error: Optional[str] = None
+        self._client = None
+        self._channel = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    def client(self, credential=None, options: Optional[Dict[str, Any]] = None, warm_up: bool = True):
+        """Return the shared Firestore client, initializing Firebase on first use
+
+        ``credential`` and ``options`` are passed to ``firebase_admin.initialize_app``
+        when no app exists yet and are ignored afterwards.
+        """
+        with self._lock:
+            if self._client is None:
+                if not firebase_admin._apps:
+                    firebase_admin.initialize_app(credential, options)
+                client = firestore.client()
+                self._install_channel(client)
+                self._client = client
+            if warm_up and self._worker is None and isinstance(self._client, firestore.Client):
+                self._worker = threading.Thread(target=self._keep_warm, name="firestore-warm-up", daemon=True)
+                self._worker.start()
+            return self._client
+
+    def refresh_token(self) -> Optional[datetime]:
+        """Fetch a new OAuth token for the client's credentials, returning its expiry"""
+        credentials = getattr(self._client, '_credentials', None)
+        if credentials is None or not hasattr(credentials, 'refresh'):
+            return None
+        credentials.refresh(Request())
+        self.token_expiry = _as_utc(getattr(credentials, 'expiry', None))
+        self.token_refreshes += 1
+        return self.token_expiry
+
+    def next_refresh_in(self, now: Optional[datetime] = None) -> float:
+        """Seconds until the token should be refreshed again"""
+        if self.token_expiry is None:
+            return TOKEN_RETRY_INTERVAL
+        now = now or datetime.now(timezone.utc)
+        remaining = (self.token_expiry - now).total_seconds() - self.token_refresh_margin
+        return max(remaining, TOKEN_MIN_REFRESH_INTERVAL)
+
+    def stats(self) -> Dict[str, Any]:
+        """Initialization, channel and token state"""
+        return {
+            'initialized': self._client is not None,
+            'channel_ready': self.channel_ready,
+            'token_expiry': self.token_expiry,
+            'token_refreshes': self.token_refreshes,
+            'channel_options': dict(self.channel_options),
+            'last_error': self.last_error,
+        }
+
+    def close(self):
+        """Stop the background refresher and close the channel"""
+        self._stop.set()
+        if self._channel is not None:
+            self._channel.close()
+
+    def _install_channel(self, client):
+        """Give the client a gRPC channel built with ``channel_options``
+
+        The Firestore client creates its channel lazily with fixed options;
+        handing it a GAPIC client built on our own channel lets the settings
+        be configured and the channel be connected before the first request.
+        If the client's internals (CLIENT_INTERNALS) have changed, it keeps
+        its default channel.
+        """
+        if not isinstance(client, firestore.Client):
+            return
+        missing = [name for name in CLIENT_INTERNALS if not hasattr(client, name)]
+        if missing:
+            print(f"⚠️  Firestore client internals changed ({', '.join(missing)}), using its default channel")
+            return
+        if client._emulator_host is not None:
+            return
+        transport_class = firestore_grpc_transport.FirestoreGrpcTransport
+        self._channel = transport_class.create_channel(
+            client._target,
+            credentials=client._credentials,
+            options=list(self.channel_options.items()),
+        )
+        transport = transport_class(host=client._target, channel=self._channel, client_info=client._client_info)
+        client._firestore_api_internal = firestore_client.FirestoreClient(
+            transport=transport, client_options=client._client_options
+        )
+
+    def _warm_up(self):
+        """Fetch the first token and connect the channel"""
+        self.refresh_token()
+        if self._channel is not None:
+            grpc.channel_ready_future(self._channel).result(timeout=self.warm_up_timeout)
+            self.channel_ready = True
+        print("✅ Firestore client warmed up")
+
+    def _keep_warm(self):
+        try:
+            self._warm_up()
+            self.last_error = None
+        except Exception as e:
+            self.last_error = str(e)
+            print(f"❌ Firestore warm-up failed: {self.last_error}")
+
+        while not self._stop.wait(self.next_refresh_in() if self.last_error is None else TOKEN_RETRY_INTERVAL):
+            try:
+                self.refresh_token()
+                self.last_error = None
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"❌ Firebase token refresh failed: {self.last_error}")
+
+
+def _as_utc(expiry: Optional[datetime]) -> Optional[datetime]:
+    # google-auth reports expiry as a naive UTC datetime
+    if expiry is not None and expiry.tzinfo is None:
+        return expiry.replace(tzinfo=timezone.utc)
+    return expiry
+
+
+# Shared by every module in the process
+client_factory = FirestoreClientFactory()
+
+
+def get_firestore_client(credential=None, options: Optional[Dict[str, Any]] = None):
+    """Return the process-wide Firestore client (see FirestoreClientFactory.client)"""
+    return client_factory.client(credential, options)
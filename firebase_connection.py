@@ -1,23 +1,64 @@
 import firebase_admin
-from firebase_admin import credentials, firestore
+from firebase_admin import credentials
 import os
+import copy
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import json
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Iterator, Union
+
+import pandas as pd
+from google.api_core import exceptions as google_exceptions
+
+from bulk_writes import BATCH_LIMIT, bulk_report, chunk_operations, needs_isolation, new_batch, write_result
+from firebase_client import get_firestore_client
+from query_builder import DOCUMENT_ID_FIELD, DocumentQuery, iter_query_pages, quote_field
+from resilience import CircuitBreaker, RetryPolicy
+from response_sync import ResponseSync
+from ttl_cache import TTLCache
+
+# Aggregations FirebaseConnection.aggregate() can run server-side
+AGGREGATION_KINDS = ('count', 'sum', 'avg')
+
+# Page formats FirebaseConnection.iter_pages() can yield
+PAGE_FORMATS = ('dicts', 'pandas', 'arrow')
+
+# Document references per BatchGetDocuments call in get_documents()
+GET_ALL_CHUNK_SIZE = 100
+
+# Aggregation results older than aggregate_cache_ttl are kept this long to be
+# served when the server-side aggregation fails
+AGGREGATE_STALE_TTL = 600
 
 class FirebaseConnection:
     """Firebase connection manager with support for environment variables and service account keys"""
     
-    def __init__(self):
+    def __init__(self, aggregate_cache_ttl: float = 60, aggregate_cache_size: int = 128, document_cache_ttl: float = 60,
+                 document_cache_size: int = 256, document_cache_bytes: int = 8 * 1024 * 1024,
+                 query_cache_ttl: float = 60, query_cache_size: int = 128, query_cache_bytes: int = 16 * 1024 * 1024,
+                 retry_policy: Optional[RetryPolicy] = None):
         self.db = None
         self.is_initialized = False
+        # Retries, deadlines and the circuit breaker applied to every read and write
+        self.retry_policy = retry_policy or RetryPolicy(breaker=CircuitBreaker())
+        self.aggregate_cache_ttl = aggregate_cache_ttl
+        # aggregate() results as (computed_at, result), keyed by (collection, aggregations and filters)
+        self._aggregate_cache = TTLCache(max(aggregate_cache_ttl, AGGREGATE_STALE_TTL), aggregate_cache_size)
+        # Read-through cache of documents keyed by (collection, document_id);
+        # document_cache_size=0 turns it off
+        self.document_cache = TTLCache(document_cache_ttl, document_cache_size, document_cache_bytes)
+        # query_documents() results keyed by the normalized (collection, field, operator, value)
+        self.query_cache = TTLCache(query_cache_ttl, query_cache_size, query_cache_bytes)
+        # Collections kept fully in memory, used to answer queries locally
+        self.resident_datasets: Dict[str, ResponseSync] = {}
         
     def initialize_with_env_vars(self) -> bool:
         """Initialize Firebase using environment variables"""
         try:
             # Check if Firebase is already initialized
             if firebase_admin._apps:
-                self.db = firestore.client()
+                self.db = get_firestore_client()
                 self.is_initialized = True
                 return True
             
@@ -52,9 +93,7 @@ class FirebaseConnection:
             
             # Initialize Firebase
             cred = credentials.Certificate(cred_dict)
-            firebase_admin.initialize_app(cred)
-            
-            self.db = firestore.client()
+            self.db = get_firestore_client(cred)
             self.is_initialized = True
             print("✅ Firebase initialized successfully with environment variables!")
             return True
@@ -68,7 +107,7 @@ class FirebaseConnection:
         try:
             # Check if Firebase is already initialized
             if firebase_admin._apps:
-                self.db = firestore.client()
+                self.db = get_firestore_client()
                 self.is_initialized = True
                 return True
             
@@ -79,9 +118,7 @@ class FirebaseConnection:
             
             # Initialize Firebase with service account
             cred = credentials.Certificate(service_account_path)
-            firebase_admin.initialize_app(cred)
-            
-            self.db = firestore.client()
+            self.db = get_firestore_client(cred)
             self.is_initialized = True
             print(f"✅ Firebase initialized successfully with service account: {service_account_path}")
             return True
@@ -95,7 +132,7 @@ class FirebaseConnection:
         try:
             # Check if Firebase is already initialized
             if firebase_admin._apps:
-                self.db = firestore.client()
+                self.db = get_firestore_client()
                 self.is_initialized = True
                 return True
             
@@ -105,9 +142,7 @@ class FirebaseConnection:
             if project_id:
                 config['projectId'] = project_id
             
-            firebase_admin.initialize_app(cred, config)
-            
-            self.db = firestore.client()
+            self.db = get_firestore_client(cred, config)
             self.is_initialized = True
             print("✅ Firebase initialized successfully with default credentials!")
             return True
@@ -124,7 +159,8 @@ class FirebaseConnection:
                 return False
             
             # Try to read from a test document
-            test_doc = self.db.collection('test').document('connection_test').get()
+            doc_ref = self.db.collection('test').document('connection_test')
+            self.retry_policy.run(lambda timeout: doc_ref.get(timeout=timeout))
             print("✅ Firebase connection successful!")
             return True
             
@@ -139,20 +175,17 @@ class FirebaseConnection:
                 print("❌ Firebase not initialized")
                 return None
             
-            collection_ref = self.db.collection(collection_name)
-            
+            query = self.db.collection(collection_name)
             if limit:
-                docs = collection_ref.limit(limit).stream()
-            else:
-                docs = collection_ref.stream()
-            
-            data = []
-            for doc in docs:
-                doc_data = doc.to_dict()
-                doc_data['id'] = doc.id
-                data.append(doc_data)
-            
-            return data
+                query = query.limit(limit)
+            
+            try:
+                return self._stream(query)
+            except Exception as e:
+                data = self._resident_fallback(self.query(collection_name).limit(limit) if limit else self.query(collection_name), e)
+                if data is None:
+                    raise
+                return data
             
         except Exception as e:
             print(f"❌ Error fetching data from {collection_name}: {str(e)}")
@@ -165,12 +198,17 @@ class FirebaseConnection:
                 print("❌ Firebase not initialized")
                 return None
             
+            cached = self._cached_document(collection_name, document_id)
+            if cached is not None:
+                return cached
+
             doc_ref = self.db.collection(collection_name).document(document_id)
-            doc = doc_ref.get()
+            doc = self.retry_policy.run(lambda timeout: doc_ref.get(timeout=timeout))
             
             if doc.exists:
                 data = doc.to_dict()
                 data['id'] = doc.id
+                self._cache_document(collection_name, doc.id, data)
                 return data
             else:
                 print(f"❌ Document {document_id} not found in collection {collection_name}")
@@ -190,11 +228,13 @@ class FirebaseConnection:
             # Add timestamp
             data['createdAt'] = datetime.now()
             
-            # Add document
-            doc_ref = self.db.collection(collection_name).add(data)
+            # The ID is picked before writing, so a retried set() cannot add a duplicate
+            doc_ref = self.db.collection(collection_name).document()
+            self.retry_policy.run(lambda timeout: doc_ref.set(data, timeout=timeout))
+            self._forget_queries(collection_name)
             
-            print(f"✅ Document added successfully! ID: {doc_ref[1].id}")
-            return doc_ref[1].id
+            print(f"✅ Document added successfully! ID: {doc_ref.id}")
+            return doc_ref.id
             
         except Exception as e:
             print(f"❌ Error adding document: {str(e)}")
@@ -210,8 +250,10 @@ class FirebaseConnection:
             # Add update timestamp
             data['updatedAt'] = datetime.now()
             
-            # Update document
-            self.db.collection(collection_name).document(document_id).update(data)
+            # Update document; the same fields and timestamp on every attempt
+            doc_ref = self.db.collection(collection_name).document(document_id)
+            self.retry_policy.run(lambda timeout: doc_ref.update(data, timeout=timeout))
+            self._forget_document(collection_name, document_id)
             
             print(f"✅ Document {document_id} updated successfully!")
             return True
@@ -227,8 +269,10 @@ class FirebaseConnection:
                 print("❌ Firebase not initialized")
                 return False
             
-            # Delete document
-            self.db.collection(collection_name).document(document_id).delete()
+            # Delete document (deleting it again on a retry is a no-op)
+            doc_ref = self.db.collection(collection_name).document(document_id)
+            self.retry_policy.run(lambda timeout: doc_ref.delete(timeout=timeout))
+            self._forget_document(collection_name, document_id)
             
             print(f"✅ Document {document_id} deleted successfully!")
             return True
@@ -237,27 +281,435 @@ class FirebaseConnection:
             print(f"❌ Error deleting document {document_id}: {str(e)}")
             return False
     
+    def bulk_add(self, collection_name: str, items: List[Dict[str, Any]], **options) -> Optional[Dict[str, Any]]:
+        """Add many documents with batched writes; returns a per-item report (see bulk_write)"""
+        if not self.is_initialized or not self.db:
+            print("❌ Firebase not initialized")
+            return None
+        collection_ref = self.db.collection(collection_name)
+        now = datetime.now()
+        # IDs are generated client-side and written with set(), so retrying a
+        # batch that did commit before timing out cannot create duplicates.
+        # An item's own createdAt (e.g. from an imported survey wave) is kept.
+        operations = [('set', collection_ref.document(), {'createdAt': now, **item}) for item in items]
+        report = self.bulk_write(operations, **options)
+        self._forget_queries(collection_name)
+        return report
+
+    def bulk_update(self, collection_name: str, updates: Dict[str, Dict[str, Any]], **options) -> Optional[Dict[str, Any]]:
+        """Update many documents ({document_id: fields}) with batched writes"""
+        if not self.is_initialized or not self.db:
+            print("❌ Firebase not initialized")
+            return None
+        collection_ref = self.db.collection(collection_name)
+        now = datetime.now()
+        operations = [
+            ('update', collection_ref.document(document_id), {**data, 'updatedAt': now})
+            for document_id, data in updates.items()
+        ]
+        report = self.bulk_write(operations, **options)
+        for document_id in updates:
+            self._forget_document(collection_name, document_id)
+        return report
+
+    def bulk_delete(self, collection_name: str, document_ids: List[str], **options) -> Optional[Dict[str, Any]]:
+        """Delete many documents with batched writes"""
+        if not self.is_initialized or not self.db:
+            print("❌ Firebase not initialized")
+            return None
+        collection_ref = self.db.collection(collection_name)
+        operations = [('delete', collection_ref.document(document_id), None) for document_id in document_ids]
+        report = self.bulk_write(operations, **options)
+        for document_id in document_ids:
+            self._forget_document(collection_name, document_id)
+        return report
+
+    def bulk_write(self, operations: List[Tuple[str, Any, Optional[Dict[str, Any]]]], batch_size: int = BATCH_LIMIT,
+                   max_in_flight: int = 4) -> Optional[Dict[str, Any]]:
+        """Commit (operation, document_ref, data) writes in batches
+
+        Operations are grouped into WriteBatches of up to ``batch_size``
+        (at most the 500-write Firestore limit) and up to ``max_in_flight``
+        batches are committed in parallel. Every commit runs under the
+        connection's retry_policy, so contention and transient errors are
+        retried with backoff and the circuit breaker sees the outcome.
+        A batch failing for any other reason (e.g. updating a missing
+        document) is replayed one write at a time, so only the offending
+        items are reported as failed.
+
+        Returns {'succeeded': int, 'failed': int, 'results': [...]} with one
+        {'id', 'operation', 'success', 'error'} entry per operation, in order,
+        or None if Firebase is not initialized.
+        """
+        if not self.is_initialized or not self.db:
+            print("❌ Firebase not initialized")
+            return None
+        results: List[Dict[str, Any]] = []
+        with ThreadPoolExecutor(max_workers=max(1, max_in_flight)) as executor:
+            chunks = chunk_operations(operations, batch_size)
+            for chunk_results in executor.map(self._commit_chunk, chunks):
+                results.extend(chunk_results)
+        return bulk_report(results)
+
+    def _commit_chunk(self, chunk) -> List[Dict[str, Any]]:
+        error = self._commit(chunk)
+        if not needs_isolation(chunk, error):
+            return [write_result(operation, error) for operation in chunk]
+        # Isolate the writes that broke the batch
+        return [write_result(operation, self._commit([operation])) for operation in chunk]
+
+    def _commit(self, chunk) -> Optional[Exception]:
+        """Commit one batch under the retry policy, returning the final error or None on success"""
+        try:
+            self.retry_policy.run(lambda timeout: new_batch(self.db, chunk).commit(timeout=timeout))
+            return None
+        except Exception as e:
+            return e
+
     def query_documents(self, collection_name: str, field: str, operator: str, value: Any) -> Optional[List[Dict[str, Any]]]:
         """Query documents with a specific condition"""
+        return self.query(collection_name).where(field, operator, value).get()
+
+    def query(self, collection_name: str) -> DocumentQuery:
+        """Start a compound query: chain where/order_by/limit/select, then call get() or count()"""
+        return DocumentQuery(self, collection_name)
+
+    def run_query(self, query: DocumentQuery) -> Optional[List[Dict[str, Any]]]:
+        """Run a DocumentQuery from the resident dataset, the query cache or Firestore"""
         try:
             if not self.is_initialized or not self.db:
                 print("❌ Firebase not initialized")
                 return None
-            
-            docs = self.db.collection(collection_name).where(field, operator, value).stream()
-            
-            data = []
-            for doc in docs:
-                doc_data = doc.to_dict()
-                doc_data['id'] = doc.id
-                data.append(doc_data)
-            
+
+            resident = self._resident_for(query)
+            if resident is not None and resident.mirrors_firestore:
+                return resident.query(list(query.filters), list(query.orders), query.limit_count,
+                                      list(query.fields) if query.fields is not None else None)
+
+            cache_key = query.cache_key()
+            cached = self.query_cache.get(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+
+            try:
+                data = self._stream(query.to_firestore(self.db.collection(query.collection_name)))
+            except Exception as e:
+                stale = self._resident_fallback(query, e)
+                if stale is None:
+                    raise
+                return stale
+            
+            self.query_cache.put(cache_key, copy.deepcopy(data))
             return data
             
         except Exception as e:
             print(f"❌ Error querying documents: {str(e)}")
             return None
 
+    def get_documents(self, collection_name: str, document_ids: List[str],
+                      chunk_size: int = GET_ALL_CHUNK_SIZE) -> Optional[Dict[str, Any]]:
+        """Fetch many documents by ID with multi-get calls
+
+        IDs are looked up in the document cache first; the rest are fetched
+        with ``get_all`` in chunks of ``chunk_size`` references, one round
+        trip per chunk. Returns {'found': {id: data}, 'missing': [ids]}, both
+        in the order the IDs were given.
+        """
+        try:
+            if not self.is_initialized or not self.db:
+                print("❌ Firebase not initialized")
+                return None
+
+            document_ids = list(dict.fromkeys(document_ids))
+            found: Dict[str, Dict[str, Any]] = {}
+            to_fetch = []
+            for document_id in document_ids:
+                cached = self._cached_document(collection_name, document_id)
+                if cached is not None:
+                    found[document_id] = cached
+                else:
+                    to_fetch.append(document_id)
+
+            collection_ref = self.db.collection(collection_name)
+            for start in range(0, len(to_fetch), chunk_size):
+                refs = [collection_ref.document(document_id) for document_id in to_fetch[start:start + chunk_size]]
+                for doc in self.retry_policy.run(lambda timeout: list(self.db.get_all(refs, timeout=timeout))):
+                    if doc.exists:
+                        data = doc.to_dict()
+                        data['id'] = doc.id
+                        self._cache_document(collection_name, doc.id, data)
+                        found[doc.id] = data
+
+            missing = [document_id for document_id in document_ids if document_id not in found]
+            if missing:
+                print(f"❌ {len(missing)} of {len(document_ids)} documents not found in collection {collection_name}")
+            return {
+                'found': {document_id: found[document_id] for document_id in document_ids if document_id in found},
+                'missing': missing,
+            }
+
+        except Exception as e:
+            print(f"❌ Error fetching documents from {collection_name}: {str(e)}")
+            return None
+
+    def _cached_document(self, collection_name: str, document_id: str) -> Optional[Dict[str, Any]]:
+        data = self.document_cache.get((collection_name, document_id))
+        # Callers may modify what they get back
+        return copy.deepcopy(data) if data is not None else None
+
+    def _cache_document(self, collection_name: str, document_id: str, data: Dict[str, Any]):
+        self.document_cache.put((collection_name, document_id), copy.deepcopy(data))
+
+    def _forget_document(self, collection_name: str, document_id: str):
+        self.document_cache.invalidate((collection_name, document_id))
+        self._forget_queries(collection_name)
+
+    def _forget_queries(self, collection_name: str):
+        self.query_cache.invalidate_where(lambda key: key[0] == collection_name)
+        self._aggregate_cache.invalidate_where(lambda key: key[0] == collection_name)
+
+    def use_resident_dataset(self, collection_name: str, response_sync: ResponseSync):
+        """Answer query_documents() for a collection from a fully loaded ResponseSync
+
+        Queries go to the resident documents instead of Firestore while
+        ``response_sync.mirrors_firestore`` is true, so results are as fresh as
+        the sync (e.g. kept current by a ResponseListener).
+        """
+        self.resident_datasets[collection_name] = response_sync
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit rate and size of the document, query and aggregation caches"""
+        return {'documents': self.document_cache.stats(), 'queries': self.query_cache.stats(),
+                'aggregates': self._aggregate_cache.stats()}
+
+    def _stream(self, query) -> List[Dict[str, Any]]:
+        """Download a query's documents as dicts with an 'id' key, under the retry policy"""
+        docs = self.retry_policy.run(lambda timeout: list(query.stream(timeout=timeout)))
+        return self._to_page(docs, 'dicts')
+
+    def _resident_for(self, query: DocumentQuery) -> Optional[ResponseSync]:
+        """The resident dataset able to answer a query, if any"""
+        resident = self.resident_datasets.get(query.collection_name)
+        if resident is None or not query.runs_locally:
+            return None
+        used = [field for field, _, _ in query.filters] + [field for field, _ in query.orders]
+        if not resident.covers(used) or not resident.covers(query.fields):
+            return None
+        return resident
+
+    def _resident_fallback(self, query: DocumentQuery, error: Exception) -> Optional[List[Dict[str, Any]]]:
+        """Answer a query from the resident dataset's last good copy when Firestore fails"""
+        resident = self._resident_for(query)
+        if resident is None:
+            return None
+        print(f"⚠️  Firestore unavailable, serving resident {query.collection_name} data: {str(error)}")
+        return resident.query(list(query.filters), list(query.orders), query.limit_count,
+                              list(query.fields) if query.fields is not None else None)
+
+    def iter_pages(self, collection_name: str, page_size: int = 500, order_by: Optional[str] = 'createdAt',
+                   start_after: Union[str, Any, None] = None, filters: Optional[List[Tuple[str, str, Any]]] = None,
+                   page_format: str = 'dicts') -> Iterator[Any]:
+        """Read a collection one page at a time using query cursors
+
+        Only one page is held in memory, and the first page is available
+        after a single round trip. A page that cannot be read (after the
+        retry policy gives up) raises the error, so a partial read is never
+        mistaken for the whole collection. Pages are ordered on ``order_by`` and the
+        document ID. Documents without the ``order_by`` field are skipped by
+        Firestore, so pass ``order_by=None`` to walk every document in ID
+        order.
+
+        Args:
+            page_size: documents per request
+            start_after: document ID (or snapshot) to resume after, e.g. the
+                'id' of the last document of a previous read
+            filters: optional (field, operator, value) conditions, as in query_documents
+            page_format: 'dicts' for lists of dicts with an 'id' key, 'pandas'
+                for DataFrames, 'arrow' for pyarrow Tables (columns Arrow cannot
+                type are JSON strings, listed in the b'json_columns' schema metadata)
+        """
+        if page_format not in PAGE_FORMATS:
+            print(f"❌ Unknown page format: {page_format}")
+            return
+        if not self.is_initialized or not self.db:
+            print("❌ Firebase not initialized")
+            return
+
+        try:
+            collection_ref = self.db.collection(collection_name)
+            query = collection_ref
+            for field, operator, value in filters or []:
+                query = query.where(quote_field(field), operator, value)
+            if order_by:
+                query = query.order_by(quote_field(order_by))
+            # Tie-break on the document ID so cursors are stable
+            query = query.order_by(DOCUMENT_ID_FIELD)
+
+            cursor = start_after
+            if isinstance(cursor, str):
+                cursor_ref = collection_ref.document(cursor)
+                cursor = self.retry_policy.run(lambda timeout: cursor_ref.get(timeout=timeout))
+                if not cursor.exists:
+                    print(f"❌ Document {start_after} not found in collection {collection_name}")
+                    return
+
+            for docs in iter_query_pages(query, page_size, self.retry_policy, cursor):
+                yield self._to_page(docs, page_format)
+
+        except Exception as e:
+            # Raise rather than end the iteration early: a caller writing an
+            # export must not mistake a failed read for the end of the data
+            print(f"❌ Error reading {collection_name}: {str(e)}")
+            raise
+
+    def iter_documents(self, collection_name: str, page_size: int = 500, order_by: Optional[str] = 'createdAt',
+                       start_after: Union[str, Any, None] = None,
+                       filters: Optional[List[Tuple[str, str, Any]]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield documents one at a time, fetched page by page (see iter_pages)"""
+        for page in self.iter_pages(collection_name, page_size, order_by, start_after, filters):
+            yield from page
+
+    @staticmethod
+    def _to_page(docs: List[Any], page_format: str) -> Any:
+        rows = []
+        for doc in docs:
+            doc_data = doc.to_dict()
+            doc_data['id'] = doc.id
+            rows.append(doc_data)
+        if page_format == 'dicts':
+            return rows
+
+        df = pd.DataFrame(rows)
+        if page_format == 'pandas':
+            return df
+
+        from snapshot_store import to_arrow_table
+        table, json_columns = to_arrow_table(df)
+        return table.replace_schema_metadata({b'json_columns': json.dumps(json_columns).encode()})
+
+    def aggregate(self, collection_name: str, aggregations: List[Tuple[str, Optional[str]]],
+                  filters: Optional[List[Tuple[str, str, Any]]] = None) -> Optional[Dict[str, Any]]:
+        """Run count/sum/avg aggregations on a collection without downloading its documents
+
+        Args:
+            aggregations: (kind, field) pairs, e.g. [('count', None), ('avg', 'rating')]
+            filters: optional (field, operator, value) conditions, as in query_documents
+
+        Returns a dict keyed 'count', 'sum_<field>' and 'avg_<field>'. Results
+        are cached for ``aggregate_cache_ttl`` seconds. If the server cannot run
+        the aggregation (older SDK or emulator), the last cached result is
+        served, or the value is computed by streaming the matching documents.
+        """
+        try:
+            if not self.is_initialized or not self.db:
+                print("❌ Firebase not initialized")
+                return None
+
+            for kind, field in aggregations:
+                if kind not in AGGREGATION_KINDS:
+                    print(f"❌ Unknown aggregation: {kind}")
+                    return None
+                if kind != 'count' and not field:
+                    print(f"❌ Aggregation {kind} needs a field")
+                    return None
+
+            cache_key = (collection_name, repr((list(aggregations), filters or [])))
+            cached = self._aggregate_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < self.aggregate_cache_ttl:
+                return cached[1]
+
+            query = self.db.collection(collection_name)
+            for field, operator, value in filters or []:
+                query = query.where(quote_field(field), operator, value)
+
+            try:
+                result = self._server_aggregate(query, aggregations)
+            except Exception as e:
+                if cached:
+                    print(f"⚠️  Server-side aggregation failed, serving cached result: {str(e)}")
+                    return cached[1]
+                print(f"⚠️  Server-side aggregation unavailable, counting documents instead: {str(e)}")
+                result = self._stream_aggregate(query, aggregations)
+
+            self._aggregate_cache.put(cache_key, (time.monotonic(), result))
+            return result
+
+        except Exception as e:
+            print(f"❌ Error aggregating {collection_name}: {str(e)}")
+            return None
+
+    def count_documents(self, collection_name: str, filters: Optional[List[Tuple[str, str, Any]]] = None) -> Optional[int]:
+        """Count documents in a collection (optionally filtered) with a server-side count"""
+        result = self.aggregate(collection_name, [('count', None)], filters)
+        return result['count'] if result is not None else None
+
+    def sum_field(self, collection_name: str, field: str, filters: Optional[List[Tuple[str, str, Any]]] = None) -> Optional[float]:
+        """Sum a numeric field server-side; non-numeric values are ignored"""
+        result = self.aggregate(collection_name, [('sum', field)], filters)
+        return result[f'sum_{field}'] if result is not None else None
+
+    def average_field(self, collection_name: str, field: str, filters: Optional[List[Tuple[str, str, Any]]] = None) -> Optional[float]:
+        """Average a numeric field server-side; None if no document has a number there"""
+        result = self.aggregate(collection_name, [('avg', field)], filters)
+        return result[f'avg_{field}'] if result is not None else None
+
+    def clear_aggregate_cache(self):
+        """Forget cached aggregation results"""
+        self._aggregate_cache.clear()
+
+    @staticmethod
+    def _aggregate_key(kind: str, field: Optional[str]) -> str:
+        return kind if kind == 'count' else f'{kind}_{field}'
+
+    def _server_aggregate(self, query, aggregations: List[Tuple[str, Optional[str]]]) -> Dict[str, Any]:
+        """One RunAggregationQuery round trip for all aggregations"""
+        aggregation_query = None
+        aliases = {}
+        for index, (kind, field) in enumerate(aggregations):
+            # Positional aliases: survey field names such as 'boys-club' are not valid aliases
+            alias = f'a{index}'
+            aliases[alias] = self._aggregate_key(kind, field)
+            target = aggregation_query if aggregation_query is not None else query
+            if kind == 'count':
+                aggregation_query = target.count(alias=alias)
+            else:
+                aggregation_query = getattr(target, kind)(quote_field(field), alias=alias)
+
+        result = {}
+        for results in self.retry_policy.run(lambda timeout: aggregation_query.get(timeout=timeout)):
+            for aggregation in results:
+                result[aliases[aggregation.alias]] = aggregation.value
+        return result
+
+    def _stream_aggregate(self, query, aggregations: List[Tuple[str, Optional[str]]]) -> Dict[str, Any]:
+        """Client-side fallback with the same semantics as the server aggregations"""
+        fields = sorted({field for _, field in aggregations if field})
+        count = 0
+        totals = {field: 0 for field in fields}
+        numbers = {field: 0 for field in fields}
+        # select() keeps the download down to the aggregated fields
+        selected = query.select([quote_field(field) for field in fields])
+        for doc in self.retry_policy.run(lambda timeout: list(selected.stream(timeout=timeout))):
+            count += 1
+            data = doc.to_dict() or {}
+            for field in fields:
+                value = data.get(field)
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    totals[field] += value
+                    numbers[field] += 1
+
+        result = {}
+        for kind, field in aggregations:
+            key = self._aggregate_key(kind, field)
+            if kind == 'count':
+                result[key] = count
+            elif kind == 'sum':
+                result[key] = totals[field]
+            else:
+                # Like the server, None (null) when there is nothing to average
+                result[key] = totals[field] / numbers[field] if numbers[field] else None
+        return result
+
 # Global Firebase connection instance
 firebase_conn = FirebaseConnection()
 
@@ -297,10 +749,14 @@ def add_survey_response(data: Dict[str, Any]):
     """Add a new survey response"""
     return firebase_conn.add_document('responses', data)
 
+def add_survey_responses(items: List[Dict[str, Any]]):
+    """Add many survey responses with batched writes (e.g. importing a past survey wave)"""
+    return firebase_conn.bulk_add('responses', items)
+
 def get_response_count():
     """Get total number of responses"""
-    responses = firebase_conn.get_collection_data('responses')
-    return len(responses) if responses else 0
+    count = firebase_conn.count_documents('responses')
+    return count if count is not None else 0
 
 if __name__ == "__main__":
     # Example usage
@@ -0,0 +1,251 @@
+import asyncio
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple
+
+from firebase_admin import firestore_async
+
+from bulk_writes import BATCH_LIMIT, bulk_report, chunk_operations, needs_isolation, new_batch, write_result
+from firebase_connection import initialize_firebase
+from query_builder import DocumentQuery
+from resilience import CircuitBreaker, RetryPolicy
+
+
+class AsyncFirebaseConnection:
+    """asyncio counterpart of FirebaseConnection, built on the Firestore AsyncClient
+
+    Offers the same methods as coroutines, so independent reads can run
+    concurrently with ``asyncio.gather``. Every call waits on a shared
+    limiter, so at most ``max_concurrency`` requests are in flight at once.
+    Reads and writes run under ``retry_policy`` like FirebaseConnection's.
+    """
+
+    def __init__(self, max_concurrency: int = 10, retry_policy: Optional[RetryPolicy] = None):
+        self.db = None
+        self.is_initialized = False
+        self.max_concurrency = max_concurrency
+        self.limiter = asyncio.Semaphore(max_concurrency)
+        self.retry_policy = retry_policy or RetryPolicy(breaker=CircuitBreaker())
+
+    def initialize(self, method: str = "env", **kwargs) -> bool:
+        """Initialize the Firebase app (same methods as initialize_firebase) and open an async client"""
+        if not initialize_firebase(method, **kwargs):
+            return False
+        try:
+            self.db = firestore_async.client()
+            self.is_initialized = True
+            return True
+        except Exception as e:
+            print(f"❌ Firebase async client error: {str(e)}")
+            return False
+
+    async def test_connection(self) -> bool:
+        """Test Firebase connection"""
+        try:
+            if not self.is_initialized or not self.db:
+                print("❌ Firebase not initialized")
+                return False
+
+            doc_ref = self.db.collection('test').document('connection_test')
+            await self._run(lambda timeout: doc_ref.get(timeout=timeout))
+            print("✅ Firebase connection successful!")
+            return True
+
+        except Exception as e:
+            print(f"❌ Firebase connection failed: {str(e)}")
+            return False
+
+    async def get_collection_data(self, collection_name: str, limit: int = None) -> Optional[List[Dict[str, Any]]]:
+        """Get data from a specific collection"""
+        try:
+            if not self.is_initialized or not self.db:
+                print("❌ Firebase not initialized")
+                return None
+
+            query = self.db.collection(collection_name)
+            if limit:
+                query = query.limit(limit)
+            return await self._stream(query)
+
+        except Exception as e:
+            print(f"❌ Error fetching data from {collection_name}: {str(e)}")
+            return None
+
+    async def get_document_data(self, collection_name: str, document_id: str) -> Optional[Dict[str, Any]]:
+        """Get data from a specific document"""
+        try:
+            if not self.is_initialized or not self.db:
+                print("❌ Firebase not initialized")
+                return None
+
+            doc_ref = self.db.collection(collection_name).document(document_id)
+            doc = await self._run(lambda timeout: doc_ref.get(timeout=timeout))
+
+            if doc.exists:
+                data = doc.to_dict()
+                data['id'] = doc.id
+                return data
+            else:
+                print(f"❌ Document {document_id} not found in collection {collection_name}")
+                return None
+
+        except Exception as e:
+            print(f"❌ Error fetching document {document_id}: {str(e)}")
+            return None
+
+    async def get_documents_data(self, collection_name: str, document_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Fetch several documents concurrently; missing or failed ones map to None"""
+        results = await asyncio.gather(
+            *(self.get_document_data(collection_name, document_id) for document_id in document_ids)
+        )
+        return dict(zip(document_ids, results))
+
+    async def query_documents(self, collection_name: str, field: str, operator: str, value: Any) -> Optional[List[Dict[str, Any]]]:
+        """Query documents with a specific condition"""
+        try:
+            if not self.is_initialized or not self.db:
+                print("❌ Firebase not initialized")
+                return None
+
+            # Same translation as FirebaseConnection, which quotes fields such as 'boys-club'
+            query = DocumentQuery(self, collection_name).where(field, operator, value)
+            return await self._stream(query.to_firestore(self.db.collection(collection_name)))
+
+        except Exception as e:
+            print(f"❌ Error querying documents: {str(e)}")
+            return None
+
+    async def add_document(self, collection_name: str, data: Dict[str, Any]) -> Optional[str]:
+        """Add a new document to a collection"""
+        try:
+            if not self.is_initialized or not self.db:
+                print("❌ Firebase not initialized")
+                return None
+
+            data['createdAt'] = datetime.now()
+            # The ID is picked before writing, so a retried set() cannot add a duplicate
+            doc_ref = self.db.collection(collection_name).document()
+            await self._run(lambda timeout: doc_ref.set(data, timeout=timeout))
+
+            print(f"✅ Document added successfully! ID: {doc_ref.id}")
+            return doc_ref.id
+
+        except Exception as e:
+            print(f"❌ Error adding document: {str(e)}")
+            return None
+
+    async def update_document(self, collection_name: str, document_id: str, data: Dict[str, Any]) -> bool:
+        """Update an existing document"""
+        try:
+            if not self.is_initialized or not self.db:
+                print("❌ Firebase not initialized")
+                return False
+
+            data['updatedAt'] = datetime.now()
+            doc_ref = self.db.collection(collection_name).document(document_id)
+            await self._run(lambda timeout: doc_ref.update(data, timeout=timeout))
+
+            print(f"✅ Document {document_id} updated successfully!")
+            return True
+
+        except Exception as e:
+            print(f"❌ Error updating document {document_id}: {str(e)}")
+            return False
+
+    async def delete_document(self, collection_name: str, document_id: str) -> bool:
+        """Delete a document"""
+        try:
+            if not self.is_initialized or not self.db:
+                print("❌ Firebase not initialized")
+                return False
+
+            doc_ref = self.db.collection(collection_name).document(document_id)
+            await self._run(lambda timeout: doc_ref.delete(timeout=timeout))
+
+            print(f"✅ Document {document_id} deleted successfully!")
+            return True
+
+        except Exception as e:
+            print(f"❌ Error deleting document {document_id}: {str(e)}")
+            return False
+
+    async def bulk_add(self, collection_name: str, items: List[Dict[str, Any]], **options) -> Optional[Dict[str, Any]]:
+        """Add many documents with batched writes (see FirebaseConnection.bulk_add)"""
+        if not self.is_initialized or not self.db:
+            print("❌ Firebase not initialized")
+            return None
+        collection_ref = self.db.collection(collection_name)
+        now = datetime.now()
+        operations = [('set', collection_ref.document(), {'createdAt': now, **item}) for item in items]
+        return await self.bulk_write(operations, **options)
+
+    async def bulk_update(self, collection_name: str, updates: Dict[str, Dict[str, Any]], **options) -> Optional[Dict[str, Any]]:
+        """Update many documents ({document_id: fields}) with batched writes"""
+        if not self.is_initialized or not self.db:
+            print("❌ Firebase not initialized")
+            return None
+        collection_ref = self.db.collection(collection_name)
+        now = datetime.now()
+        operations = [
+            ('update', collection_ref.document(document_id), {**data, 'updatedAt': now})
+            for document_id, data in updates.items()
+        ]
+        return await self.bulk_write(operations, **options)
+
+    async def bulk_delete(self, collection_name: str, document_ids: List[str], **options) -> Optional[Dict[str, Any]]:
+        """Delete many documents with batched writes"""
+        if not self.is_initialized or not self.db:
+            print("❌ Firebase not initialized")
+            return None
+        collection_ref = self.db.collection(collection_name)
+        operations = [('delete', collection_ref.document(document_id), None) for document_id in document_ids]
+        return await self.bulk_write(operations, **options)
+
+    async def bulk_write(self, operations: List[Tuple[str, Any, Optional[Dict[str, Any]]]], batch_size: int = BATCH_LIMIT
+                         ) -> Optional[Dict[str, Any]]:
+        """Commit (operation, document_ref, data) writes in concurrent batches
+
+        Same batching, retry and per-item report as FirebaseConnection.bulk_write;
+        the number of batches in flight is bounded by the connection's limiter.
+        """
+        if not self.is_initialized or not self.db:
+            print("❌ Firebase not initialized")
+            return None
+        chunks = chunk_operations(operations, batch_size)
+        chunk_results = await asyncio.gather(*(self._commit_chunk(chunk) for chunk in chunks))
+        return bulk_report([result for chunk in chunk_results for result in chunk])
+
+    async def _commit_chunk(self, chunk) -> List[Dict[str, Any]]:
+        error = await self._commit(chunk)
+        if not needs_isolation(chunk, error):
+            return [write_result(operation, error) for operation in chunk]
+        # Isolate the writes that broke the batch
+        return [write_result(operation, await self._commit([operation])) for operation in chunk]
+
+    async def _commit(self, chunk) -> Optional[Exception]:
+        """Commit one batch under the retry policy, returning the final error or None on success"""
+        try:
+            await self._run(lambda timeout: new_batch(self.db, chunk).commit(timeout=timeout))
+            return None
+        except Exception as e:
+            return e
+
+    async def _run(self, call):
+        """Run a Firestore coroutine under the retry policy, holding a limiter slot per attempt"""
+        async def attempt(timeout):
+            # Back off between attempts without holding a slot
+            async with self.limiter:
+                return await call(timeout)
+        return await self.retry_policy.run_async(attempt)
+
+    async def _stream(self, query) -> List[Dict[str, Any]]:
+        """Download a query's documents as dicts with an 'id' key, under the retry policy"""
+        async def download(timeout):
+            # A retry starts over, so a failure part way leaves no duplicates
+            return [doc async for doc in query.stream(timeout=timeout)]
+
+        data = []
+        for doc in await self._run(download):
+            doc_data = doc.to_dict()
+            doc_data['id'] = doc.id
+            data.append(doc_data)
+        return data
@@ -4,6 +4,8 @@ import streamlit as st
 import os
 from datetime import datetime
 
+from firebase_client import get_firestore_client
+
 # Initialize Firebase Admin SDK
 db = None
 
@@ -16,11 +18,11 @@ def initialize_firebase():
             # Your Firebase project configuration
             # You can either use a service account key file or initialize with project ID
             cred = credentials.ApplicationDefault()
-            firebase_admin.initialize_app(cred, {
+            get_firestore_client(cred, {
                 'projectId': 'she-speaks-2025'
             })
         
-        db = firestore.client()
+        db = get_firestore_client()
         return True
     except Exception as e:
         st.error(f"Firebase initialization error: {str(e)}")
@@ -58,6 +60,7 @@ def add_survey_response(data):
         
         # Add to Firestore
         doc_ref = db.collection('responses').add(data)
+        _query_responses_by_field.clear()
         
         return True, f"Response added successfully! ID: {doc_ref[1].id}"
     except Exception as e:
@@ -88,29 +91,39 @@ def get_response_count():
         if not db:
             return 0
         
-        # Get count of documents in responses collection
-        docs = db.collection('responses').stream()
-        count = sum(1 for _ in docs)
-        return count
+        # Server-side count: one aggregation query instead of reading every document
+        try:
+            result = db.collection('responses').count().get()
+            return int(result[0][0].value)
+        except Exception:
+            # Fall back for SDKs/emulators without aggregation queries;
+            # select([]) downloads document names only
+            docs = db.collection('responses').select([]).stream()
+            return sum(1 for _ in docs)
     except Exception as e:
         st.error(f"Error counting responses: {str(e)}")
         return 0
 
+@st.cache_data(ttl=60, max_entries=128, show_spinner=False)
+def _query_responses_by_field(field_name, field_value):
+    """Run the where() query; memoized per (field, value) for a minute"""
+    responses = []
+    docs = db.collection('responses').where(field_name, '==', field_value).stream()
+    
+    for doc in docs:
+        response_data = doc.to_dict()
+        response_data['id'] = doc.id
+        responses.append(response_data)
+    
+    return responses
+
 def get_responses_by_field(field_name, field_value):
     """Get responses filtered by a specific field"""
     try:
         if not db:
             return None
         
-        responses = []
-        docs = db.collection('responses').where(field_name, '==', field_value).stream()
-        
-        for doc in docs:
-            response_data = doc.to_dict()
-            response_data['id'] = doc.id
-            responses.append(response_data)
-        
-        return responses
+        return _query_responses_by_field(field_name, field_value)
     except Exception as e:
         st.error(f"Error fetching filtered responses: {str(e)}")
         return None
@@ -0,0 +1,127 @@
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple, Iterable
+
+# where() operators that can be evaluated against documents held in memory
+LOCAL_OPERATORS = ('==', '!=', '<', '<=', '>', '>=', 'in', 'not-in', 'array_contains', 'array_contains_any')
+
+# Rank of each value type in Firestore's cross-type ordering
+_TYPE_ORDER = {type(None): 0, bool: 1, float: 2, datetime: 3, str: 4, bytes: 5, list: 8, dict: 9}
+
+_MISSING = object()
+
+
+def match_record(record: Dict[str, Any], field: str, operator: str, value: Any) -> bool:
+    """Whether a raw document matches ``where(field, operator, value)`` the way Firestore would
+
+    Values only compare with values of the same kind (numbers with numbers,
+    strings with strings, ...), and documents without the field never match.
+    Raises ValueError for operators Firestore-side evaluation is needed for.
+    """
+    if operator not in LOCAL_OPERATORS:
+        raise ValueError(f"Operator {operator!r} cannot be evaluated locally")
+
+    actual = _lookup(record, field)
+    if actual is _MISSING:
+        return False
+
+    if operator == '==':
+        return _equal(actual, value)
+    if operator == '!=':
+        return actual is not None and not _equal(actual, value)
+    if operator == 'in':
+        return any(_equal(actual, item) for item in value)
+    if operator == 'not-in':
+        return actual is not None and not any(_equal(actual, item) for item in value)
+    if operator == 'array_contains':
+        return isinstance(actual, list) and any(_equal(element, value) for element in actual)
+    if operator == 'array_contains_any':
+        return isinstance(actual, list) and any(_equal(element, item) for element in actual for item in value)
+
+    if not _same_kind(actual, value):
+        return False
+    if operator == '<':
+        return actual < value
+    if operator == '<=':
+        return actual <= value
+    if operator == '>':
+        return actual > value
+    return actual >= value
+
+
+def run_query(records: Iterable[Tuple[str, Dict[str, Any]]], filters: List[Tuple[str, str, Any]],
+              orders: List[Tuple[str, bool]] = (), limit: Optional[int] = None,
+              fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """Evaluate a whole query (filters, order_by, limit, select) over (id, document) pairs
+
+    Mirrors Firestore: documents missing an order_by field are left out, ties
+    are broken by document ID, and ``fields`` keeps only the selected fields.
+    Returned dicts carry an 'id' key and share nested values with ``records``.
+    """
+    matches = [
+        (doc_id, record) for doc_id, record in records
+        if all(match_record(record, field, operator, value) for field, operator, value in filters)
+    ]
+    order_fields = [field for field, _ in orders]
+    matches = [(doc_id, record) for doc_id, record in matches
+               if all(_lookup(record, field) is not _MISSING for field in order_fields)]
+
+    # Stable sorts, least significant key first; the ID tie-break follows
+    # the direction of the last order_by like Firestore's implicit __name__ order
+    matches.sort(key=lambda item: item[0], reverse=bool(orders) and orders[-1][1])
+    for field, descending in reversed(list(orders)):
+        matches.sort(key=lambda item: sort_key(_lookup(item[1], field)), reverse=descending)
+
+    if limit is not None:
+        matches = matches[:limit]
+    return [dict(_project(record, fields), id=doc_id) for doc_id, record in matches]
+
+
+def sort_key(value: Any) -> Tuple[int, Any]:
+    """Key ordering values of mixed types the way Firestore does (arrays and maps approximately)"""
+    rank = _TYPE_ORDER.get(_kind(value), 6)
+    return (rank, value if 1 <= rank <= 5 else repr(value))
+
+
+def _project(record: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    if fields is None:
+        return record
+    projected: Dict[str, Any] = {}
+    for field in fields:
+        value = _lookup(record, field)
+        if value is _MISSING:
+            continue
+        target = projected
+        *parents, leaf = field.split('.')
+        for part in parents:
+            target = target.setdefault(part, {})
+        target[leaf] = value
+    return projected
+
+
+def _lookup(record: Dict[str, Any], field: str) -> Any:
+    """Follow a dotted field path into nested maps"""
+    value: Any = record
+    for part in field.split('.'):
+        if not isinstance(value, dict) or part not in value:
+            return _MISSING
+        value = value[part]
+    return value
+
+
+def _kind(value: Any) -> type:
+    if isinstance(value, bool):
+        return bool
+    if isinstance(value, (int, float)):
+        return float
+    if isinstance(value, datetime):
+        return datetime
+    return type(value)
+
+
+def _same_kind(left: Any, right: Any) -> bool:
+    return _kind(left) is _kind(right)
+
+
+def _equal(left: Any, right: Any) -> bool:
+    # Keeps True from matching 1 and '3' from matching 3
+    return _same_kind(left, right) and left == right
@@ -0,0 +1,147 @@
+import re
+from typing import Optional, Dict, Any, List, Tuple, Iterator
+
+from firebase_admin import firestore
+from google.cloud.firestore_v1.field_path import FieldPath
+
+from local_query import LOCAL_OPERATORS
+
+# Operators whose value is a list of alternatives (order does not matter)
+LIST_OPERATORS = ('in', 'not-in', 'array_contains_any')
+
+# Field path Firestore uses for the document ID (FieldPath.document_id())
+DOCUMENT_ID_FIELD = '__name__'
+
+_SIMPLE_FIELD = re.compile(r'^[_a-zA-Z][_a-zA-Z0-9]*$')
+
+
+def quote_field(field: str) -> str:
+    """Field path for the Firestore client, backtick-quoting names such as 'boys-club'
+
+    Dotted paths into maps are left as they are.
+    """
+    if '.' in field or field.startswith('`') or _SIMPLE_FIELD.match(field):
+        return field
+    return FieldPath(field).to_api_repr()
+
+
+class DocumentQuery:
+    """Composable Firestore query run through a FirebaseConnection
+
+    Build it with ``firebase_conn.query('responses')`` and chain ``where``,
+    ``order_by``, ``limit`` and ``select``; every call returns a new query.
+    Filtering, ordering, limiting and projection all happen server-side,
+    so only the matching documents and selected fields are downloaded::
+
+        firebase_conn.query('responses') \\
+            .where('year', '==', 'Final') \\
+            .where('curfews', 'in', ['all-the-time', 'sometimes']) \\
+            .order_by('createdAt', descending=True) \\
+            .limit(50) \\
+            .select(['year', 'curfews']) \\
+            .get()
+    """
+
+    def __init__(self, connection, collection_name: str, filters: Tuple[Tuple[str, str, Any], ...] = (),
+                 orders: Tuple[Tuple[str, bool], ...] = (), limit_count: Optional[int] = None,
+                 fields: Optional[Tuple[str, ...]] = None):
+        self.connection = connection
+        self.collection_name = collection_name
+        self.filters = filters
+        self.orders = orders
+        self.limit_count = limit_count
+        self.fields = fields
+
+    def where(self, field: str, operator: str, value: Any) -> 'DocumentQuery':
+        """Add a condition; all conditions must match"""
+        return self._copy(filters=self.filters + ((field, operator, value),))
+
+    def order_by(self, field: str, descending: bool = False) -> 'DocumentQuery':
+        """Sort on a field; documents without the field are left out, as in Firestore"""
+        return self._copy(orders=self.orders + ((field, descending),))
+
+    def limit(self, count: int) -> 'DocumentQuery':
+        """Return at most ``count`` documents"""
+        return self._copy(limit_count=count)
+
+    def select(self, fields: List[str]) -> 'DocumentQuery':
+        """Only download these fields (the 'id' key is always present)"""
+        return self._copy(fields=tuple(fields))
+
+    def get(self) -> Optional[List[Dict[str, Any]]]:
+        """Run the query, returning a list of dicts with an 'id' key (None on error)"""
+        return self.connection.run_query(self)
+
+    def count(self) -> Optional[int]:
+        """Count matching documents with a server-side aggregation (ordering and limit are ignored)"""
+        return self.connection.count_documents(self.collection_name, list(self.filters))
+
+    @property
+    def runs_locally(self) -> bool:
+        """Whether every condition can be evaluated against resident documents"""
+        return all(operator in LOCAL_OPERATORS for _, operator, _ in self.filters)
+
+    def cache_key(self) -> Tuple:
+        """Hashable key; the order of 'in'-style value lists does not matter"""
+        filters = tuple(
+            (field, operator, _freeze(value, unordered=operator in LIST_OPERATORS))
+            for field, operator, value in self.filters
+        )
+        return (self.collection_name, filters, self.orders, self.limit_count, self.fields)
+
+    def to_firestore(self, collection_ref):
+        """Translate into a Firestore query on ``collection_ref``"""
+        query = collection_ref
+        for field, operator, value in self.filters:
+            query = query.where(quote_field(field), operator, value)
+        for field, descending in self.orders:
+            direction = firestore.Query.DESCENDING if descending else firestore.Query.ASCENDING
+            query = query.order_by(quote_field(field), direction=direction)
+        if self.limit_count is not None:
+            query = query.limit(self.limit_count)
+        if self.fields is not None:
+            query = query.select([quote_field(field) for field in self.fields])
+        return query
+
+    def _copy(self, **changes) -> 'DocumentQuery':
+        state = {
+            'filters': self.filters,
+            'orders': self.orders,
+            'limit_count': self.limit_count,
+            'fields': self.fields,
+        }
+        state.update(changes)
+        return DocumentQuery(self.connection, self.collection_name, **state)
+
+
+def iter_query_pages(query, page_size: int, retry_policy=None, start_after: Any = None) -> Iterator[List[Any]]:
+    """Stream a Firestore query one page of snapshots at a time using query cursors
+
+    ``query`` must end with an order on DOCUMENT_ID_FIELD so the cursors are
+    stable. Each page is one request (run under ``retry_policy`` if given),
+    and only one page is held at a time. Errors are raised to the caller.
+    """
+    cursor = start_after
+    while True:
+        page_query = query.limit(page_size)
+        if cursor is not None:
+            page_query = page_query.start_after(cursor)
+        if retry_policy is None:
+            docs = list(page_query.stream())
+        else:
+            docs = retry_policy.run(lambda timeout: list(page_query.stream(timeout=timeout)))
+        if not docs:
+            return
+        cursor = docs[-1]
+        yield docs
+        if len(docs) < page_size:
+            return
+
+
+def _freeze(value: Any, unordered: bool = False) -> Any:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        items = tuple(_freeze(item) for item in value)
+        return tuple(sorted(set(items), key=repr)) if unordered else items
+    return value
@@ -0,0 +1,197 @@
+import asyncio
+import random
+import threading
+import time
+from typing import Optional, Dict, Any, Awaitable, Callable, TypeVar
+
+from google.api_core import exceptions as google_exceptions
+from google.auth import exceptions as auth_exceptions
+
+T = TypeVar('T')
+
+# Errors worth retrying: contention, throttling and transient outages.
+# Anything else (bad arguments, missing permissions, ...) fails immediately.
+RETRYABLE_ERRORS = (
+    google_exceptions.Aborted,
+    google_exceptions.DeadlineExceeded,
+    google_exceptions.ResourceExhausted,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.InternalServerError,
+    google_exceptions.GatewayTimeout,
+    google_exceptions.RetryError,
+    # Network errors while fetching an OAuth token
+    auth_exceptions.TransportError,
+)
+
+
+class FirestoreUnavailable(Exception):
+    """Raised instead of calling Firestore while the circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """Stops calling Firestore after repeated transient failures
+
+    After ``failure_threshold`` consecutive retryable failures the breaker
+    opens and calls are refused for ``reset_timeout`` seconds. Then one trial
+    call is let through (half-open): success closes the breaker, failure
+    opens it again.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trips = 0
+        self.rejected = 0
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def allow(self) -> bool:
+        """Whether a call may go ahead now"""
+        with self._lock:
+            state = self._state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        """Firestore answered; close the breaker"""
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_running = False
+
+    def record_inconclusive(self):
+        """A call failed without telling anything about Firestore; let another trial through if this was one"""
+        with self._lock:
+            self._trial_running = False
+
+    def record_failure(self):
+        """A call failed with a transient error"""
+        with self._lock:
+            self.failures += 1
+            if self._trial_running or (self.opened_at is None and self.failures >= self.failure_threshold):
+                self.opened_at = self.clock()
+                self.trips += 1
+            self._trial_running = False
+
+    def stats(self) -> Dict[str, Any]:
+        """Current state and counters"""
+        with self._lock:
+            return {
+                'state': self._state(),
+                'failures': self.failures,
+                'trips': self.trips,
+                'rejected': self.rejected,
+            }
+
+    def _state(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if self.clock() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+
+class RetryPolicy:
+    """Runs Firestore calls with retries, exponential backoff and an overall deadline
+
+    The call is a function taking the seconds left before the deadline,
+    to be passed on as the Firestore ``timeout``::
+
+        policy.run(lambda timeout: doc_ref.get(timeout=timeout))
+
+    Retryable errors are retried up to ``max_retries`` times, waiting
+    ``backoff * 2**attempt`` seconds (capped at ``max_backoff``) plus random
+    jitter. With a ``breaker``, failures are reported to it and calls fail
+    fast with FirestoreUnavailable while it is open. Only Firestore answers
+    (GoogleAPICallError) count as successes; other errors leave it as is.
+    """
+
+    def __init__(self, max_retries: int = 3, backoff: float = 0.5, max_backoff: float = 8,
+                 deadline: float = 20, breaker: Optional[CircuitBreaker] = None,
+                 sleep: Callable[[float], None] = time.sleep, clock: Callable[[], float] = time.monotonic):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.breaker = breaker
+        self.sleep = sleep
+        self.clock = clock
+
+    def run(self, call: Callable[[float], T]) -> T:
+        """Run ``call`` until it succeeds, fails for good or runs out of time"""
+        started = self.clock()
+        for attempt in range(self.max_retries + 1):
+            timeout = self._start_attempt(started)
+            try:
+                result = call(timeout)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt, started)
+                if delay is None:
+                    raise
+                self.sleep(delay)
+            else:
+                self._record_success()
+                return result
+
+    async def run_async(self, call: Callable[[float], Awaitable[T]]) -> T:
+        """run() for a coroutine function, e.g. an AsyncClient call; waits with asyncio.sleep"""
+        started = self.clock()
+        for attempt in range(self.max_retries + 1):
+            timeout = self._start_attempt(started)
+            try:
+                result = await call(timeout)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt, started)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+            else:
+                self._record_success()
+                return result
+
+    def _start_attempt(self, started: float) -> float:
+        """Check the breaker and return the seconds left before the deadline"""
+        if self.breaker is not None and not self.breaker.allow():
+            raise FirestoreUnavailable("Firestore is unavailable (circuit breaker open)")
+        return self.deadline - (self.clock() - started)
+
+    def _retry_delay(self, error: Exception, attempt: int, started: float) -> Optional[float]:
+        """Report a failed attempt to the breaker; seconds to wait before the next one, or None to give up"""
+        if not isinstance(error, RETRYABLE_ERRORS):
+            if self.breaker is not None:
+                if isinstance(error, google_exceptions.GoogleAPICallError):
+                    # Firestore answered, just not the way we wanted
+                    self.breaker.record_success()
+                else:
+                    # Never reached Firestore (or a bug in the call): says nothing about it
+                    self.breaker.record_inconclusive()
+            return None
+        if self.breaker is not None:
+            self.breaker.record_failure()
+        delay = min(self.backoff * 2 ** attempt, self.max_backoff)
+        delay += random.uniform(0, delay)
+        if attempt == self.max_retries or self.clock() - started + delay >= self.deadline:
+            return None
+        return delay
+
+    def _record_success(self):
+        if self.breaker is not None:
+            self.breaker.record_success()
@@ -0,0 +1,172 @@
+from datetime import datetime, timezone
+import threading
+from typing import Optional, Dict, Any, Callable, List, Tuple
+
+from response_sync import ResponseSync
+
+
+class ResponseListener:
+    """Pushes Firestore changes of a collection into ResponseSyncs as they happen
+
+    Wraps ``on_snapshot``. Once the subscribed syncs have watermarks (after
+    their first sync or a snapshot seed), it watches one query per watermark
+    field, ``where(field, '>=', mark)``, so the first snapshot only delivers
+    documents at the sync's boundary rather than the whole collection.
+    Without watermarks it watches the whole collection. Either way the first
+    snapshot's ADDED documents are deduplicated against the resident data,
+    so only real changes bump the dataset version.
+
+    A scoped watch does not see older documents that are deleted or edited
+    without a new timestamp; a full reload of the sync (``reset``) does.
+
+    Several syncs can share one listener through ``subscribe``, and several
+    callbacks one sync (e.g. the dataset store of each column group it
+    serves); a sync's callbacks are called after each batch that changed it.
+    """
+
+    def __init__(self, collection_ref, response_sync: Optional[ResponseSync] = None,
+                 on_change: Optional[Callable[[], None]] = None):
+        self.collection_ref = collection_ref
+        self.subscribers: List[Tuple[ResponseSync, Tuple[Callable[[], None], ...]]] = []
+        if response_sync is not None:
+            self.subscribe(response_sync, on_change)
+        self.started_at: Optional[datetime] = None
+        self.last_event_at: Optional[datetime] = None
+        self.last_read_time: Optional[datetime] = None
+        self.lag_seconds: Optional[float] = None
+        self.snapshots = 0
+        self.changes_applied = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+        # Field -> lower bound of each scoped watch; empty for the whole collection
+        self.scope: Dict[str, datetime] = {}
+        self._watches: List[Any] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, response_sync: ResponseSync, on_change: Optional[Callable[[], None]] = None):
+        """Also apply pushed changes to ``response_sync`` from the next snapshot on
+
+        Subscribing a sync again only adds ``on_change``; its changes are
+        still applied once.
+        """
+        callbacks = (on_change,) if on_change is not None else ()
+        subscribers = []
+        for subscribed, subscribed_callbacks in self.subscribers:
+            if subscribed is response_sync:
+                subscribed_callbacks += callbacks
+                callbacks = None
+            subscribers.append((subscribed, subscribed_callbacks))
+        if callbacks is not None:
+            subscribers.append((response_sync, callbacks))
+        # Replace rather than modify: the callback thread may be iterating the list
+        self.subscribers = subscribers
+
+    def start(self) -> bool:
+        """Start listening (again, if a watch has closed); returns False if it could not be attached"""
+        with self._lock:
+            if self._watches:
+                if self.is_running:
+                    return True
+                # A watch closed itself after a stream error: start over from the current marks
+                self._unsubscribe()
+            try:
+                self.scope = self._listen_marks()
+                queries = [self.collection_ref.where(field, '>=', mark) for field, mark in self.scope.items()]
+                for query in queries or [self.collection_ref]:
+                    self._watches.append(query.on_snapshot(self._on_snapshot))
+                self.started_at = datetime.now(timezone.utc)
+                print("✅ Listening for response updates")
+                return True
+            except Exception as e:
+                self._unsubscribe()
+                self.errors += 1
+                self.last_error = str(e)
+                print(f"❌ Could not start response listener: {str(e)}")
+                return False
+
+    def stop(self):
+        """Detach from Firestore"""
+        with self._lock:
+            self._unsubscribe()
+
+    @property
+    def is_running(self) -> bool:
+        # A Watch closes itself on unrecoverable stream errors
+        watches = self._watches
+        return bool(watches) and all(getattr(watch, 'is_active', True) for watch in watches)
+
+    def is_healthy(self) -> bool:
+        """Running, has delivered its first snapshot and the last batch applied cleanly"""
+        return self.is_running and self.last_event_at is not None and self.last_error is None
+
+    def health(self) -> Dict[str, Any]:
+        """Listener status for display or logging"""
+        return {
+            'running': self.is_running,
+            'scope': sorted(self.scope) or 'collection',
+            'healthy': self.is_healthy(),
+            'started_at': self.started_at,
+            'last_event_at': self.last_event_at,
+            'last_read_time': self.last_read_time,
+            'lag_seconds': self.lag_seconds,
+            'snapshots': self.snapshots,
+            'changes_applied': self.changes_applied,
+            'errors': self.errors,
+            'last_error': self.last_error,
+        }
+
+    def _listen_marks(self) -> Dict[str, datetime]:
+        """Lower bound per watermark field that covers every subscribed sync (see ResponseSync.delta_marks)"""
+        marks: Dict[str, datetime] = {}
+        for response_sync, _ in self.subscribers:
+            sync_marks = response_sync.delta_marks()
+            if not sync_marks:
+                # Some sync has nothing to scope by
+                return {}
+            for field, mark in sync_marks.items():
+                marks[field] = min(marks[field], mark) if field in marks else mark
+        return marks
+
+    def _unsubscribe(self):
+        for watch in self._watches:
+            try:
+                watch.unsubscribe()
+            except Exception as e:
+                print(f"❌ Error stopping response listener: {str(e)}")
+        self._watches = []
+        self.last_event_at = None
+
+    def _on_snapshot(self, docs, changes, read_time):
+        """Firestore callback, runs on the listener's background thread"""
+        try:
+            upserts = []
+            removed_ids = []
+            for change in changes:
+                if change.type.name == 'REMOVED':
+                    removed_ids.append(change.document.id)
+                else:
+                    upserts.append(change.document)
+
+            changed = 0
+            notify = []
+            for response_sync, callbacks in self.subscribers:
+                sync_changed = response_sync.apply_changes(upserts, removed_ids)
+                if sync_changed:
+                    notify.extend(callbacks)
+                changed += sync_changed
+
+            now = datetime.now(timezone.utc)
+            self.snapshots += 1
+            self.last_event_at = now
+            if read_time is not None:
+                self.last_read_time = read_time
+                self.lag_seconds = max((now - read_time).total_seconds(), 0.0)
+            self.last_error = None
+            self.changes_applied += changed
+            for on_change in notify:
+                on_change()
+
+        except Exception as e:
+            self.errors += 1
+            self.last_error = str(e)
+            print(f"❌ Error applying response changes: {str(e)}")
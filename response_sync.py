@@ -0,0 +1,354 @@
+import copy
+from datetime import datetime
+import itertools
+import threading
+from typing import Optional, Dict, Any, List, Iterable, Iterator, Callable, Tuple
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from local_query import run_query
+from query_builder import DOCUMENT_ID_FIELD, iter_query_pages, quote_field
+from resilience import RetryPolicy
+
+# Timestamp fields used as high-water marks. The survey form stamps
+# `submittedAt` with a server timestamp, documents written through
+# FirebaseConnection carry `createdAt`, and edits carry `updatedAt`.
+WATERMARK_FIELDS = ('createdAt', 'submittedAt', 'updatedAt')
+
+# Documents per request when streaming the collection or a delta
+SYNC_PAGE_SIZE = 500
+
+
+class ResponseSync:
+    """Incremental sync of a Firestore collection into a resident DataFrame
+
+    The first call to ``sync`` streams the whole collection. Every later call
+    only queries documents whose watermark fields are at or after the newest
+    value seen so far (see ``delta_marks``), and merges them into the
+    resident DataFrame by id. Documents that carry none of the watermark
+    fields as timestamps are only picked up by a full load (see ``reset``).
+
+    ``normalize`` is applied once to every batch of incoming rows and returns
+    the converted frame plus a {column: {value: count}} report of rejected
+    values, which is accumulated in ``validation_report``. Only values the
+    sync has not held before are counted, so re-normalized rows (after
+    ``require`` or an edit elsewhere in the document) are not counted twice.
+
+    With ``fields``, only those fields (plus the watermark fields) are
+    downloaded, using ``select`` queries, and kept; documents pushed in
+    whole (e.g. by a listener) are trimmed to the same fields. ``require``
+    widens the projection later: the next sync downloads just the new fields
+    of every document once, and from then on the deltas carry them too.
+    So one sync can serve several column groups with a single set of
+    watermarks and delta queries.
+
+    Downloads are read ``page_size`` documents at a time with query cursors.
+    With ``retry_policy``, each page is retried and bounded by its deadline
+    and circuit breaker. A download that fails part way leaves the resident
+    data as it was.
+    """
+
+    def __init__(self, collection_ref, watermark_fields: Iterable[str] = WATERMARK_FIELDS,
+                 normalize: Optional[Callable[[pd.DataFrame], Tuple[pd.DataFrame, Dict[str, Dict[Any, int]]]]] = None,
+                 fields: Optional[Iterable[str]] = None, retry_policy: Optional[RetryPolicy] = None,
+                 page_size: int = SYNC_PAGE_SIZE):
+        self.collection_ref = collection_ref
+        self.page_size = page_size
+        self.watermark_fields = tuple(watermark_fields)
+        self.normalize = normalize
+        self.retry_policy = retry_policy
+        self.fields = tuple(dict.fromkeys(list(fields) + list(self.watermark_fields))) if fields is not None else None
+        # Fields required since the last sync, downloaded by the next one
+        self.pending_fields: Tuple[str, ...] = ()
+        self.validation_report: Dict[str, Dict[Any, int]] = {}
+        self.high_water_marks: Dict[str, Optional[datetime]] = {field: None for field in self.watermark_fields}
+        self.version = 0
+        self.last_synced_at: Optional[datetime] = None
+        self.last_delta_size = 0
+        self._records: Dict[str, Dict[str, Any]] = {}
+        # Records rebuilt from a seeded frame rather than read from Firestore
+        self._seeded_ids = set()
+        self._df = pd.DataFrame()
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """Current resident DataFrame (one row per document)"""
+        return self._df
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the initial full load has happened"""
+        return self._loaded
+
+    @property
+    def mirrors_firestore(self) -> bool:
+        """Whether every resident document is held exactly as Firestore returned it
+
+        False after ``seed`` until each seeded document has been re-read,
+        since seeded records come from the normalized frame.
+        """
+        return self._loaded and not self._seeded_ids
+
+    def state(self) -> Tuple[pd.DataFrame, Dict[str, Optional[datetime]], int, Optional[Tuple[str, ...]]]:
+        """(df, high_water_marks, version, fields) taken together, e.g. to save a snapshot"""
+        with self._lock:
+            return self._df, dict(self.high_water_marks), self.version, self.fields
+
+    def reset(self):
+        """Drop the resident data so the next sync does a full load"""
+        with self._lock:
+            self.high_water_marks = {field: None for field in self.watermark_fields}
+            self.validation_report = {}
+            self._records = {}
+            self._seeded_ids = set()
+            self._df = pd.DataFrame()
+            self._loaded = False
+            self.version += 1
+
+    def require(self, fields: Iterable[str]):
+        """Add fields to the projection; the next sync downloads them for every document"""
+        with self._lock:
+            if self.fields is None:
+                return
+            missing = [field for field in fields if field not in self.fields and field not in self.pending_fields]
+            self.pending_fields += tuple(dict.fromkeys(missing))
+
+    def seed(self, df: pd.DataFrame, high_water_marks: Dict[str, Optional[datetime]], version: int = 0,
+             fields: Optional[Iterable[str]] = None):
+        """Start from previously synced data (e.g. a disk snapshot) so the next sync is a delta
+
+        ``fields`` is the projection the data was synced with. Fields of the
+        current projection that it lacks are downloaded by the next sync.
+        """
+        with self._lock:
+            if self.fields is not None and fields is not None:
+                loaded = tuple(dict.fromkeys(list(fields) + list(self.watermark_fields)))
+                missing = [field for field in self.fields + self.pending_fields if field not in loaded]
+                self.fields = loaded
+                self.pending_fields = tuple(dict.fromkeys(missing))
+            self._df = self._normalize(df.reset_index(drop=True))
+            self._records = {}
+            if 'id' in df.columns:
+                for row in df.to_dict('records'):
+                    doc_id = row.pop('id')
+                    self._records[doc_id] = {
+                        key: value for key, value in row.items()
+                        if isinstance(value, (list, dict)) or not pd.isna(value)
+                    }
+            self._seeded_ids = set(self._records)
+            self.high_water_marks = {field: high_water_marks.get(field) for field in self.watermark_fields}
+            self.version = max(self.version, version)
+            self._loaded = True
+
+    def sync(self, max_age: Optional[float] = None) -> int:
+        """Pull new and changed documents, returning how many rows changed
+
+        With ``max_age``, a sync that ran less than that many seconds ago
+        (and left no required fields to download) is not repeated, e.g. when
+        several column groups refresh from the same sync.
+        """
+        with self._lock:
+            if (max_age is not None and self._loaded and not self.pending_fields
+                    and self.last_synced_at is not None
+                    and (datetime.now() - self.last_synced_at).total_seconds() < max_age):
+                return 0
+
+            if not self._loaded:
+                if self.pending_fields:
+                    self.fields += self.pending_fields
+                    self.pending_fields = ()
+                changed = self._merge(self._stream(self.collection_ref))
+                self._loaded = True
+            else:
+                # A document found by several fields' queries is merged once
+                changed = self._merge(itertools.chain.from_iterable(
+                    self._stream(self._delta_query(field, mark)) for field, mark in self.delta_marks().items()
+                ))
+                if self.pending_fields:
+                    # After the delta, so its marks are not moved past changes
+                    # to the other fields; the next delta brings the new
+                    # fields of documents changed in between
+                    pending = self.pending_fields
+                    changed += self._merge(self._stream(self.collection_ref, pending), pending)
+                    self.fields += pending
+                    self.pending_fields = ()
+
+            self.last_synced_at = datetime.now()
+            self.last_delta_size = changed
+            return changed
+
+    def apply_changes(self, upserts: Iterable[Any] = (), removed_ids: Iterable[str] = ()) -> int:
+        """Apply pushed document changes (e.g. from a snapshot listener), returning how many rows changed"""
+        with self._lock:
+            changed = self._merge(upserts)
+            removed = [doc_id for doc_id in removed_ids if doc_id in self._records]
+            if removed:
+                for doc_id in removed:
+                    del self._records[doc_id]
+                    self._seeded_ids.discard(doc_id)
+                self._df = self._df[~self._df['id'].isin(removed)].reset_index(drop=True)
+                self.version += 1
+            return changed + len(removed)
+
+    def query(self, filters: List[Tuple[str, str, Any]], orders: List[Tuple[str, bool]] = (),
+              limit: Optional[int] = None, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Answer a Firestore query from the resident documents (see local_query.run_query)
+
+        Runs against the documents as stored in Firestore (before
+        ``normalize``), so results match what the server query returns.
+        Raises ValueError for operators that cannot be evaluated locally.
+        """
+        with self._lock:
+            return copy.deepcopy(run_query(self._records.items(), filters, orders, limit, fields))
+
+    def delta_marks(self) -> Dict[str, datetime]:
+        """Lower bound of each watermark field for the next delta
+
+        A field without a mark of its own (nothing carried it as a timestamp
+        yet, e.g. ``updatedAt`` before the first edit) borrows the newest
+        mark of the other fields: a document stamped with it from now on is
+        stamped later than that. Empty when no field has a mark, e.g. when
+        every document stores its timestamps as strings; then deltas find
+        nothing and changes arrive through a listener or a ``reset``.
+        """
+        marks = {field: mark for field, mark in self.high_water_marks.items() if mark is not None}
+        if not marks:
+            return {}
+        newest = max(marks.values())
+        return {field: marks.get(field, newest) for field in self.watermark_fields}
+
+    def covers(self, fields: Optional[Iterable[str]]) -> bool:
+        """Whether the resident documents hold these fields (None means every field)"""
+        if self.fields is None:
+            return True
+        return fields is not None and all(field.split('.')[0] in self.fields for field in fields)
+
+    def _project(self, query, fields: Optional[Tuple[str, ...]] = None):
+        """Only download the synced fields (or ``fields``)"""
+        fields = fields or self.fields
+        if fields is None:
+            return query
+        return query.select([quote_field(field) for field in fields])
+
+    def _stream(self, query, fields: Optional[Tuple[str, ...]] = None) -> Iterator[Any]:
+        """Download the synced fields (or ``fields``) of a query's documents page by page (see iter_query_pages)"""
+        query = self._project(query, fields).order_by(DOCUMENT_ID_FIELD)
+        for docs in iter_query_pages(query, self.page_size, self.retry_policy):
+            yield from docs
+
+    def _delta_query(self, field: str, mark: datetime):
+        """Query for documents stamped at or after ``mark`` in a field (see delta_marks)"""
+        # >= rather than > so writes sharing the boundary timestamp are not
+        # lost; re-read boundary documents are dropped as unchanged in _merge.
+        # Firestore wants the range field ordered first.
+        return self.collection_ref.where(field, '>=', mark).order_by(field)
+
+    def _merge(self, docs: Iterable[Any], fields: Optional[Tuple[str, ...]] = None) -> int:
+        """Upsert documents into the resident DataFrame
+
+        With ``fields``, the documents only carry those fields: they replace
+        just those fields of each record, and the marks are left alone.
+        Nothing changes until ``docs`` is exhausted, so a download failing
+        part way leaves the records, marks and frame as they were.
+        """
+        changed: Dict[str, Dict[str, Any]] = {}
+        seen = set()
+        marks = dict(self.high_water_marks)
+        projection = fields or self.fields
+        for doc in docs:
+            entry = doc.to_dict() or {}
+            if projection is not None:
+                entry = {field: entry[field] for field in projection if field in entry}
+            if fields is not None:
+                kept = {key: value for key, value in self._records.get(doc.id, {}).items() if key not in fields}
+                entry = {**kept, **entry}
+            else:
+                self._advance_marks(marks, entry)
+                seen.add(doc.id)
+            if self._records.get(doc.id) == entry:
+                changed.pop(doc.id, None)
+                continue
+            changed[doc.id] = entry
+
+        self.high_water_marks = marks
+        self._seeded_ids -= seen
+        previous = {doc_id: self._records.get(doc_id, {}) for doc_id in changed}
+        self._records.update(changed)
+        if not changed:
+            return 0
+
+        rows = [self._to_row(doc_id, entry) for doc_id, entry in changed.items()]
+
+        # Whole rows are normalized again, but only values that are new (new
+        # documents, newly downloaded fields, edits) count towards the report
+        report_df = None
+        if any(previous.values()):
+            report_df = pd.DataFrame([
+                {**{key: value for key, value in entry.items()
+                    if key not in previous[doc_id] or previous[doc_id][key] != value}, 'id': doc_id}
+                for doc_id, entry in changed.items()
+            ])
+        delta_df = self._normalize(pd.DataFrame(rows), report_df)
+        if self._df.empty:
+            self._df = delta_df
+        else:
+            kept = self._df[~self._df['id'].isin(delta_df['id'])]
+            self._df = self._concat(kept, delta_df)
+        self.version += 1
+        return len(rows)
+
+    def _normalize(self, df: pd.DataFrame, report_df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """Apply ``normalize``, adding its report on ``report_df`` (default: ``df``) to validation_report"""
+        if self.normalize is None or df.empty:
+            return df
+        df, report = self.normalize(df)
+        if report_df is not None:
+            report = self.normalize(report_df)[1]
+        if report:
+            print(f"ℹ️  Out-of-schema answers in {len(df)} incoming responses: {report}")
+        for column, counts in report.items():
+            column_report = self.validation_report.setdefault(column, {})
+            for value, count in counts.items():
+                column_report[value] = column_report.get(value, 0) + count
+        return df
+
+    @staticmethod
+    def _concat(kept: pd.DataFrame, delta_df: pd.DataFrame) -> pd.DataFrame:
+        """Append new rows, keeping categorical columns categorical when the categories differ"""
+        merged = pd.concat([kept, delta_df], ignore_index=True)
+        for column in delta_df.columns:
+            if (column in kept.columns
+                    and isinstance(kept[column].dtype, pd.CategoricalDtype)
+                    and isinstance(delta_df[column].dtype, pd.CategoricalDtype)
+                    and not isinstance(merged[column].dtype, pd.CategoricalDtype)):
+                parts = [kept[column], delta_df[column]]
+                if parts[0].cat.categories.dtype != parts[1].cat.categories.dtype:
+                    # e.g. a batch where the column is all missing has empty object categories
+                    parts = [part.cat.set_categories(part.cat.categories.astype(object)) for part in parts]
+                merged[column] = union_categoricals(parts, ignore_order=True)
+        return merged
+
+    def _advance_marks(self, marks: Dict[str, Optional[datetime]], entry: Dict[str, Any]):
+        """Move the high-water marks in ``marks`` forward using the raw document fields"""
+        for field in self.watermark_fields:
+            value = entry.get(field)
+            # Only real timestamps can be compared server-side; values such as
+            # ISO strings written by the sample seeder are ignored here
+            if not isinstance(value, datetime):
+                continue
+            mark = marks[field]
+            if mark is None or value > mark:
+                marks[field] = value
+
+    @staticmethod
+    def _to_row(doc_id: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a DataFrame row from a document"""
+        row = dict(entry)
+        row['id'] = doc_id
+        # Add timestamp if not present
+        if 'createdAt' not in row:
+            row['createdAt'] = datetime.now()
+        return row
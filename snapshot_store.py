@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+On-disk columnar snapshot of the responses collection
+The dashboard loads it at startup so the first paint does not wait on Firestore
+"""
+
+import argparse
+from datetime import datetime
+import json
+import os
+import tempfile
+from typing import Optional, Dict, Any, List, NamedTuple, Tuple
+
+import pandas as pd
+import pyarrow as pa
+
+from column_groups import COLUMN_GROUPS
+
+# Bump whenever the on-disk layout changes; older snapshots are ignored
+SNAPSHOT_SCHEMA_VERSION = 2
+SNAPSHOT_METADATA_KEY = b'shespeaks.snapshot'
+DEFAULT_SNAPSHOT_PATH = os.getenv('SNAPSHOT_PATH', os.path.join('.cache', 'responses.arrow'))
+
+
+class Snapshot(NamedTuple):
+    df: pd.DataFrame
+    high_water_marks: Dict[str, Optional[datetime]]
+    version: int
+    saved_at: Optional[datetime]
+    # Projection the data was synced with (None: every field)
+    fields: Optional[List[str]] = None
+
+
+def _encode_value(value: Any) -> Any:
+    """Tag values that JSON cannot represent so they survive a round trip"""
+    if isinstance(value, datetime):
+        return {'$dt': value.isoformat()}
+    if isinstance(value, (list, tuple)):
+        return [_encode_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _encode_value(item) for key, item in value.items()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if set(value) == {'$dt'}:
+            return datetime.fromisoformat(value['$dt'])
+        return {key: _decode_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode_value(item) for item in value]
+    return value
+
+
+class SnapshotStore:
+    """Reads and atomically writes an Arrow IPC snapshot of a DataFrame"""
+
+    def __init__(self, path: str = DEFAULT_SNAPSHOT_PATH):
+        self.path = path
+        # Dataset version last written to or read from disk
+        self.saved_version: Optional[int] = None
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def save(self, df: pd.DataFrame, high_water_marks: Dict[str, Optional[datetime]], version: int,
+             fields: Optional[List[str]] = None) -> bool:
+        """Write the snapshot to a temp file and swap it into place"""
+        try:
+            table, json_columns = to_arrow_table(df)
+            metadata = {
+                'schema_version': SNAPSHOT_SCHEMA_VERSION,
+                'version': version,
+                'saved_at': datetime.now().isoformat(),
+                'json_columns': json_columns,
+                'fields': list(fields) if fields is not None else None,
+                'high_water_marks': {
+                    field: mark.isoformat() if mark else None
+                    for field, mark in high_water_marks.items()
+                },
+            }
+            table = table.replace_schema_metadata({SNAPSHOT_METADATA_KEY: json.dumps(metadata).encode()})
+
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as sink:
+                    with pa.ipc.new_file(sink, table.schema) as writer:
+                        writer.write_table(table)
+                    sink.flush()
+                    os.fsync(sink.fileno())
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            self.saved_version = version
+            return True
+
+        except Exception as e:
+            print(f"❌ Error writing snapshot {self.path}: {str(e)}")
+            return False
+
+    def load(self) -> Optional[Snapshot]:
+        """Memory-map the snapshot, returning None if it is missing or outdated"""
+        if not self.exists():
+            return None
+        try:
+            with pa.memory_map(self.path, 'r') as source:
+                table = pa.ipc.open_file(source).read_all()
+
+            raw_metadata = (table.schema.metadata or {}).get(SNAPSHOT_METADATA_KEY)
+            metadata = json.loads(raw_metadata) if raw_metadata else {}
+            if metadata.get('schema_version') != SNAPSHOT_SCHEMA_VERSION:
+                print(f"ℹ️  Ignoring snapshot {self.path} with schema version {metadata.get('schema_version')}")
+                return None
+
+            df = table.to_pandas()
+            for column in metadata.get('json_columns', []):
+                df[column] = df[column].map(lambda raw: _decode_value(json.loads(raw)) if isinstance(raw, str) else None)
+
+            high_water_marks = {
+                field: datetime.fromisoformat(mark) if mark else None
+                for field, mark in metadata.get('high_water_marks', {}).items()
+            }
+            saved_at = metadata.get('saved_at')
+            self.saved_version = metadata.get('version', 0)
+            return Snapshot(
+                df=df,
+                high_water_marks=high_water_marks,
+                version=metadata.get('version', 0),
+                saved_at=datetime.fromisoformat(saved_at) if saved_at else None,
+                fields=metadata.get('fields'),
+            )
+
+        except Exception as e:
+            print(f"❌ Error reading snapshot {self.path}: {str(e)}")
+            return None
+
+    def clear(self):
+        """Delete the snapshot file"""
+        if self.exists():
+            os.remove(self.path)
+
+
+def to_arrow_table(df: pd.DataFrame) -> Tuple[pa.Table, List[str]]:
+    """Convert to Arrow, JSON-encoding columns Arrow cannot type (e.g. mixed list/str answers)"""
+    columns = {}
+    json_columns: List[str] = []
+    for column in df.columns:
+        series = df[column]
+        # Arrow would hand list answers back as numpy arrays, so nested
+        # values always take the JSON path
+        if not series.map(lambda value: isinstance(value, (list, tuple, dict))).any():
+            try:
+                columns[column] = pa.array(series, from_pandas=True)
+                continue
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                pass
+        json_columns.append(column)
+        columns[column] = pa.array(
+            [None if _is_missing(value) else json.dumps(_encode_value(value)) for value in series],
+            type=pa.string(),
+        )
+    return pa.table(columns), json_columns
+
+
+def _is_missing(value: Any) -> bool:
+    if isinstance(value, (list, tuple, dict)):
+        return False
+    try:
+        return bool(pd.isna(value))
+    except (TypeError, ValueError):
+        return False
+
+
+def rebuild_snapshot(store: SnapshotStore, fields: Optional[List[str]] = None) -> bool:
+    """Stream the responses collection (optionally only ``fields``) from Firestore and write a fresh snapshot"""
+    from firebase_connection import firebase_conn, initialize_firebase
+    from response_sync import ResponseSync
+
+    if not initialize_firebase("env"):
+        print("Trying default credentials...")
+        if not initialize_firebase("default", project_id="she-speaks-2025"):
+            return False
+
+    response_sync = ResponseSync(firebase_conn.db.collection('responses'), fields=fields)
+    response_sync.sync()
+    if not store.save(response_sync.df, response_sync.high_water_marks, response_sync.version, response_sync.fields):
+        return False
+    print(f"✅ Snapshot rebuilt with {len(response_sync.df)} responses: {store.path}")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the local responses snapshot")
+    parser.add_argument('command', choices=['rebuild', 'info', 'clear'])
+    parser.add_argument('--path', default=DEFAULT_SNAPSHOT_PATH, help="Snapshot file location")
+    parser.add_argument('--group', choices=list(COLUMN_GROUPS), action='append',
+                        help="Only rebuild with this column group (repeatable; default: all)")
+    args = parser.parse_args()
+
+    store = SnapshotStore(args.path)
+    if args.command == 'rebuild':
+        try:
+            from dotenv import load_dotenv
+            load_dotenv()
+        except ImportError:
+            pass
+        fields = [field for group in args.group or list(COLUMN_GROUPS) for field in COLUMN_GROUPS[group]]
+        raise SystemExit(0 if rebuild_snapshot(store, fields) else 1)
+    elif args.command == 'info':
+        snapshot = store.load()
+        if snapshot is None:
+            print(f"No usable snapshot at {store.path}")
+            raise SystemExit(1)
+        print(f"Snapshot: {store.path}")
+        print(f"  rows: {len(snapshot.df)}")
+        print(f"  version: {snapshot.version}")
+        print(f"  saved at: {snapshot.saved_at}")
+        groups = [group for group, fields in COLUMN_GROUPS.items()
+                  if snapshot.fields is None or all(field in snapshot.fields for field in fields)]
+        print(f"  column groups: {', '.join(groups) or 'none'}")
+        for field, mark in snapshot.high_water_marks.items():
+            print(f"  {field} high-water mark: {mark}")
+    elif args.command == 'clear':
+        store.clear()
+        print(f"Removed {store.path}")
+
+
+if __name__ == "__main__":
+    main()
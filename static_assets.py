@@ -0,0 +1,67 @@
+import hashlib
+import os
+from functools import lru_cache
+from urllib.parse import urljoin
+
+# Served by Streamlit at app/static/<name> when server.enableStaticServing is on
+# (see .streamlit/config.toml)
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+STATIC_URL = "app/static"
+
+# Files up to this size are versioned by a hash of their content; larger ones
+# (the intro video) by their modification time and size, to avoid reading them
+HASHED_ASSET_MAX_BYTES = 1 << 20
+
+
+def asset_path(name: str) -> str:
+    """Path of a file in the static directory"""
+    return os.path.join(STATIC_DIR, name)
+
+
+def asset_exists(name: str) -> bool:
+    """Whether the static directory has this file"""
+    return os.path.isfile(asset_path(name))
+
+
+def asset_url(name: str) -> str:
+    """URL of a static file, versioned by its content (or, for large files, mtime and size)
+
+    The version changes whenever the file does, so browsers can keep the
+    file cached and still pick up a new one after a deploy.
+    """
+    path = asset_path(name)
+    stat = os.stat(path)
+    if stat.st_size > HASHED_ASSET_MAX_BYTES:
+        version = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+    else:
+        version = _content_hash(path, stat.st_mtime_ns)
+    return f"{STATIC_URL}/{name}?v={version}"
+
+
+def absolute_asset_url(app_url: str, name: str) -> str:
+    """asset_url made absolute against the app's URL (as in ``st.context.url``)
+
+    For elements like st.video that only pass full URLs through to the
+    browser and treat anything else as a local file to load.
+    """
+    if not app_url.endswith("/"):
+        app_url += "/"
+    return urljoin(app_url, asset_url(name))
+
+
+def read_asset(name: str) -> str:
+    """Content of a static text file (cached until the file changes)"""
+    path = asset_path(name)
+    return _read(path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _content_hash(path: str, mtime_ns: int) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+
+@lru_cache(maxsize=32)
+def _read(path: str, mtime_ns: int) -> str:
+    with open(path, encoding="utf-8") as f:
+        return f.read()
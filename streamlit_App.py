@@ -1,15 +1,17 @@
 import streamlit as st
 import firebase_admin
-from firebase_admin import credentials, firestore
+from firebase_admin import credentials
 import pandas as pd
 
+from firebase_client import get_firestore_client
+
 # Initialize Firebase (only once)
 if not firebase_admin._apps:
     cred = credentials.Certificate("firebase_key.json")  # Make sure this file is in your project directory
-    firebase_admin.initialize_app(cred)
+    get_firestore_client(cred)
 
 # Firestore DB
-db = firestore.client()
+db = get_firestore_client()
 
 # Streamlit UI
 st.set_page_config(page_title="She Speaks 2025 Responses", layout="wide")
@@ -0,0 +1,125 @@
+from typing import Dict, Any
+
+import numpy as np
+import pandas as pd
+
+from survey_schema import SCALE_QUESTIONS, CHOICE_QUESTIONS, FREE_CATEGORY_QUESTIONS
+
+# 1-5 scale questions shown on the Mood Check page
+MOOD_QUESTIONS = SCALE_QUESTIONS
+
+# Single-choice questions charted or summarised on the dashboard pages
+CATEGORICAL_QUESTIONS = list(CHOICE_QUESTIONS) + FREE_CATEGORY_QUESTIONS
+
+# Answers to "Ever felt judged?" counted as having felt judged
+JUDGED_ANSWERS = ['multiple', 'sometimes']
+
+
+def compute_aggregates(df: pd.DataFrame) -> Dict[str, Any]:
+    """Compute every metric the dashboard pages need in one pass over the responses"""
+    aggregates: Dict[str, Any] = {'total_responses': len(df)}
+
+    # Mood means: coerce all scale columns at once and take column means.
+    # Questions with no numeric answers are left out of mood_means.
+    mood_columns = [q for q in MOOD_QUESTIONS if q in df.columns]
+    if mood_columns:
+        numeric = df[mood_columns].apply(pd.to_numeric, errors='coerce')
+        means = numeric.mean()
+        aggregates['mood_means'] = {q: float(means[q]) for q in mood_columns if numeric[q].notna().any()}
+    else:
+        aggregates['mood_means'] = {}
+    aggregates['mood_questions'] = mood_columns
+    aggregates['avg_mood'] = float(np.mean(list(aggregates['mood_means'].values()))) if aggregates['mood_means'] else 0
+
+    # value_counts of the single-choice questions (missing columns get an empty Series)
+    value_counts = {}
+    for column in CATEGORICAL_QUESTIONS:
+        if column in df.columns:
+            value_counts[column] = _answer_counts(df[column])
+        else:
+            value_counts[column] = pd.Series(dtype='int64')
+    aggregates['value_counts'] = value_counts
+
+    # Curfew answers of final year students vs everyone else
+    if 'year' in df.columns and 'curfews' in df.columns:
+        is_final = df['year'] == 'Final'
+        aggregates['final_year_curfews'] = _answer_counts(df.loc[is_final, 'curfews'])
+        aggregates['other_years_curfews'] = _answer_counts(df.loc[~is_final, 'curfews'])
+    else:
+        aggregates['final_year_curfews'] = pd.Series(dtype='int64')
+        aggregates['other_years_curfews'] = pd.Series(dtype='int64')
+    aggregates['unique_courses'] = len(value_counts['course'])
+    aggregates['unique_years'] = len(value_counts['year'])
+
+    judged_counts = value_counts['judged']
+    judged_total = judged_counts.sum()
+    aggregates['judged_pct'] = (
+        float(judged_counts[judged_counts.index.isin(JUDGED_ANSWERS)].sum() / judged_total * 100)
+        if judged_total > 0 else 0
+    )
+
+    # Multi-select "what would help" answers
+    selections = explode_help(df)
+    help_counts = selections['option'].value_counts()
+    aggregates['help_counts'] = help_counts
+    aggregates['help_percentages'] = help_counts / len(df) * 100 if len(df) else help_counts.astype('float64')
+    aggregates['help_answered'] = int(df['help'].notna().sum()) if 'help' in df.columns else 0
+    aggregates['top_help'] = help_counts.index[0] if len(help_counts) else None
+    if 'voice' in df.columns and len(selections):
+        # Respondents picking each option per voice answer; no voice answer drops out
+        aggregates['help_by_voice'] = help_indicators(df, selections).groupby(df['voice'], observed=True).sum()
+    else:
+        aggregates['help_by_voice'] = pd.DataFrame()
+
+    # Submissions over the three most recent days with responses
+    aggregates['recent_activity'] = 0
+    if 'createdAt' in df.columns and not df['createdAt'].isna().all():
+        try:
+            dates = pd.to_datetime(df['createdAt']).dt.date
+            aggregates['recent_activity'] = int(dates.value_counts().sort_index().tail(3).sum())
+        except Exception:
+            pass
+
+    return aggregates
+
+
+def _answer_counts(series: pd.Series) -> pd.Series:
+    """value_counts without the declared-but-unpicked categories of Categorical columns"""
+    counts = series.dropna().value_counts()
+    return counts[counts > 0]
+
+
+def explode_help(df: pd.DataFrame) -> pd.DataFrame:
+    """Long-format table of "what would help" selections, one row per (response, option)
+
+    The form stores the answer as a list, older/sample data as a comma
+    separated string; both are split, stripped and blank options dropped.
+    ``response`` is the index label of the response in ``df``.
+    """
+    empty = pd.DataFrame({'response': pd.Series(dtype=df.index.dtype), 'option': pd.Series(dtype='object')})
+    if 'help' not in df.columns:
+        return empty
+
+    answers = df['help'].dropna().astype(object)
+    try:
+        # .str.split only applies to strings; lists come back as NaN and are kept as-is
+        split = answers.str.split(',')
+        options = split.where(split.notna(), answers).explode()
+        # Anything that is not a string (numbers, empty lists) has no .str.len()
+        options = options[options.str.len().notna()].str.strip()
+    except AttributeError:
+        # .str refuses a column with no string values at all
+        return empty
+    options = options[options.str.len() > 0]
+    return pd.DataFrame({'response': options.index, 'option': options.values})
+
+
+def help_indicators(df: pd.DataFrame, selections: pd.DataFrame = None) -> pd.DataFrame:
+    """One-hot matrix with a boolean column per help option and a row per response"""
+    if selections is None:
+        selections = explode_help(df)
+    if selections.empty:
+        return pd.DataFrame(index=df.index)
+    indicators = pd.crosstab(selections['response'], selections['option']) > 0
+    indicators.columns.name = None
+    return indicators.reindex(df.index, fill_value=False)
@@ -0,0 +1,66 @@
+from typing import Dict, Any, List, Tuple
+
+import pandas as pd
+
+# Single-choice questions and the answer values the survey form can submit
+CHOICE_QUESTIONS: Dict[str, List[str]] = {
+    'year': ['1st', '2nd', '3rd', 'Final'],
+    'judged': ['multiple', 'sometimes', 'not-really', 'cant-say'],
+    'voice': ['heard', 'ignored', 'talked-over', 'depends'],
+    'stepped-back': ['yes', 'no', 'sometimes', 'still-show-up'],
+    'curfews': ['all-the-time', 'sometimes', 'rarely', 'never'],
+}
+
+# Free-text answers with few distinct values, stored as categories built from the data
+FREE_CATEGORY_QUESTIONS = ['course']
+
+# 1-5 scale questions (range inputs, submitted as strings)
+SCALE_QUESTIONS = ['boys-club', 'equal-chances', 'safe-supported', 'held-back', 'women-mentors']
+SCALE_RANGE = (1, 5)
+
+
+def normalize_responses(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Dict[Any, int]]]:
+    """Coerce survey answers to compact dtypes
+
+    Choice questions become Categoricals with the declared answers as
+    categories. Values outside the schema are kept as extra categories so
+    nothing disappears from the charts, and they are counted in the returned
+    report ({column: {value: count}}). Scale answers become nullable Int8;
+    anything that is not a whole number in SCALE_RANGE is reported and set
+    to missing.
+    """
+    df = df.copy()
+    report: Dict[str, Dict[Any, int]] = {}
+
+    for column, allowed in CHOICE_QUESTIONS.items():
+        if column not in df.columns:
+            continue
+        values = _clean_text(df[column])
+        unknown = values[values.notna() & ~values.isin(allowed)]
+        if len(unknown):
+            report[column] = unknown.value_counts().to_dict()
+        df[column] = pd.Categorical(values, categories=allowed + sorted(unknown.unique()))
+
+    for column in FREE_CATEGORY_QUESTIONS:
+        if column in df.columns:
+            df[column] = _clean_text(df[column]).astype('category')
+
+    low, high = SCALE_RANGE
+    for column in SCALE_QUESTIONS:
+        if column not in df.columns:
+            continue
+        numeric = pd.to_numeric(df[column], errors='coerce')
+        valid = numeric.between(low, high) & (numeric % 1 == 0)
+        invalid = df[column][df[column].notna() & ~valid]
+        if len(invalid):
+            report[column] = invalid.astype(str).value_counts().to_dict()
+        df[column] = numeric.where(valid).astype('Int8')
+
+    return df, report
+
+
+def _clean_text(series: pd.Series) -> pd.Series:
+    """Strip answers and treat blanks as missing"""
+    values = series.astype('string').str.strip()
+    values = values.mask(values == '')
+    return values.astype(object).where(values.notna(), None)
@@ -0,0 +1,31 @@
+import pandas as pd
+
+from charts import CHART_LAYOUT, CHART_SPECS, bar_chart, pie_chart, section_html, spec_chart
+
+
+def test_figures_are_built_once_per_distinct_data():
+    counts = pd.Series(['Final', '2nd', 'Final']).value_counts()
+    fig = bar_chart(counts.index, counts.values, "Years", '#e91e63', "Year", "Students")
+
+    assert bar_chart(list(counts.index), list(counts.values), "Years", '#e91e63', "Year", "Students") is fig
+    assert list(fig.data[0].x) == ['Final', '2nd'] and list(fig.data[0].y) == [2, 1]
+
+    counts = pd.Series(['Final', '2nd', '2nd', 'Final']).value_counts()
+    assert bar_chart(counts.index, counts.values, "Years", '#e91e63', "Year", "Students") is not fig
+
+
+def test_charts_share_the_dashboard_layout():
+    fig = pie_chart([3, 1], ['Yes', 'No'], "Judged", ['#e91e63', '#ff6b9d'])
+    assert fig.layout.paper_bgcolor == CHART_LAYOUT.paper_bgcolor
+    assert fig.layout.margin == CHART_LAYOUT.margin and fig.layout.font.size == 14
+    assert fig.layout.title.text == "Judged"
+
+
+def test_registered_specs_render_charts_and_empty_states():
+    courses = pd.Series([f'course-{i}' for i in range(12) for _ in range(i + 1)]).value_counts()
+    fig = spec_chart(CHART_SPECS['course'], courses)
+    assert fig.data[0].orientation == 'h' and len(fig.data[0].y) == 10
+
+    assert spec_chart(CHART_SPECS['judged'], pd.Series({'never': 2})).data[0].type == 'pie'
+    assert 'metric-card' not in section_html(CHART_SPECS['curfews'])
+    assert 'No curfew data available yet' in section_html(CHART_SPECS['curfews'], empty=True)
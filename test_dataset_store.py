@@ -0,0 +1,80 @@
+import threading
+
+import pandas as pd
+
+from dataset_store import DatasetStore
+
+
+class SlowSource:
+    """refresh() callable that blocks until released, counting its calls"""
+
+    def __init__(self):
+        self.version = 1
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+        self.error = None
+
+    def __call__(self):
+        self.calls += 1
+        self.release.wait(5)
+        if self.error:
+            raise self.error
+        return pd.DataFrame({'id': [f'r{i}' for i in range(self.version)]}), self.version
+
+
+def test_stale_data_is_served_while_one_background_refresh_runs():
+    source = SlowSource()
+    store = DatasetStore(source, refresh_interval=30)
+    assert store.get().attrs['dataset_version'] == 1
+    assert store.get().attrs['as_of'] is not None
+
+    source.version = 2
+    source.release.clear()
+    store.invalidate()
+    views = [store.get() for _ in range(5)]
+    threads = [threading.Thread(target=store.get) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Every caller got the old frame at once, and only one refresh was started
+    assert [view.attrs['dataset_version'] for view in views] == [1] * 5
+    assert store.is_refreshing and source.calls == 2
+
+    source.release.set()
+    store.wait()
+    assert len(store.get()) == 2
+    assert store.stats()['stale_hits'] >= 5
+
+
+def test_failed_background_refresh_keeps_the_current_frame():
+    source = SlowSource()
+    store = DatasetStore(source, refresh_interval=0)
+    store.get()
+    as_of = store.refreshed_at
+
+    source.error = RuntimeError('Firestore unavailable')
+    store.get()
+    store.wait()
+
+    view = store.get()
+    assert view.attrs['dataset_version'] == 1 and view.attrs['as_of'] == as_of
+    assert store.last_error == 'Firestore unavailable'
+
+
+def test_refresh_can_invalidate_its_own_store():
+    calls = []
+
+    def refresh():
+        # e.g. a listener delivering its first snapshot on the calling thread
+        calls.append(True)
+        store.invalidate()
+        return pd.DataFrame({'id': ['r0']}), 1
+
+    store = DatasetStore(refresh, refresh_interval=30)
+    thread = threading.Thread(target=store.get, daemon=True)
+    thread.start()
+    thread.join(5)
+    assert not thread.is_alive() and calls == [True]
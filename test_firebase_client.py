@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta, timezone
+
+import firebase_admin
+from firebase_admin import credentials
+from google.auth.credentials import AnonymousCredentials
+
+from firebase_client import CLIENT_INTERNALS, FirestoreClientFactory
+
+
+class FakeCredential(credentials.Base):
+    def __init__(self):
+        self.google_credential = AnonymousCredentials()
+
+    def get_credential(self):
+        return self.google_credential
+
+
+def test_client_is_created_once_with_the_configured_channel(monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', {})
+    factory = FirestoreClientFactory(channel_options={'grpc.keepalive_time_ms': 15000})
+
+    client = factory.client(FakeCredential(), {'projectId': 'she-speaks-test'}, warm_up=False)
+
+    assert factory.client(warm_up=False) is client
+    assert client._firestore_api._transport.grpc_channel is factory._channel
+    assert factory.stats()['initialized']
+    factory.close()
+
+
+def test_firestore_client_still_has_the_internals_the_channel_relies_on(monkeypatch):
+    # Guards the google-cloud-firestore pin in requirements.txt: if an upgrade
+    # renames these, _install_channel silently falls back to the default channel
+    monkeypatch.setattr(firebase_admin, '_apps', {})
+    factory = FirestoreClientFactory()
+    client = factory.client(FakeCredential(), {'projectId': 'she-speaks-test'}, warm_up=False)
+
+    assert [name for name in CLIENT_INTERNALS if not hasattr(client, name)] == []
+    assert client._firestore_api_internal is not None  # replaced before first use
+    assert client._firestore_api._transport.grpc_channel is factory._channel
+    factory.close()
+
+
+def test_token_is_refreshed_ahead_of_expiry():
+    factory = FirestoreClientFactory(token_refresh_margin=300)
+    now = datetime(2025, 3, 8, 12, 0, tzinfo=timezone.utc)
+
+    assert factory.next_refresh_in(now) == 60  # expiry not known yet
+    factory.token_expiry = now + timedelta(hours=1)
+    assert factory.next_refresh_in(now) == 3300
+    factory.token_expiry = now + timedelta(seconds=10)
+    assert factory.next_refresh_in(now) == 30
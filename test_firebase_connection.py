@@ -0,0 +1,552 @@
+import itertools
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from google.api_core import exceptions as google_exceptions
+
+from firebase_connection import FirebaseConnection
+from resilience import CircuitBreaker, RetryPolicy
+
+
+class FakeAggregationQuery:
+    def __init__(self, query):
+        self.query = query
+        self.aggregations = []
+
+    def count(self, alias=None):
+        self.aggregations.append((alias, 'count', None))
+        return self
+
+    def sum(self, field, alias=None):
+        self.aggregations.append((alias, 'sum', field))
+        return self
+
+    def avg(self, field, alias=None):
+        self.aggregations.append((alias, 'avg', field))
+        return self
+
+    def get(self, timeout=None):
+        self.query.collection.aggregation_calls += 1
+        docs = self.query.matching()
+        results = []
+        for alias, kind, field in self.aggregations:
+            values = [doc[field] for doc in docs
+                      if isinstance(doc.get(field), (int, float)) and not isinstance(doc[field], bool)] if field else []
+            if kind == 'count':
+                value = len(docs)
+            elif kind == 'sum':
+                value = sum(values)
+            else:
+                # Firestore returns null when no document has a number to average
+                value = sum(values) / len(values) if values else None
+            results.append(SimpleNamespace(alias=alias, value=value))
+        return [results]
+
+
+class FakeQuery:
+    def __init__(self, collection, filters=()):
+        self.collection = collection
+        self.filters = list(filters)
+
+    def where(self, field, operator, value):
+        assert operator == '=='
+        return FakeQuery(self.collection, self.filters + [(field, value)])
+
+    def matching(self):
+        return [doc for doc in self.collection.docs if all(doc.get(f) == v for f, v in self.filters)]
+
+    def select(self, fields):
+        return self
+
+    def stream(self, timeout=None):
+        self.collection.streamed += 1
+        return [SimpleNamespace(to_dict=lambda doc=doc: dict(doc)) for doc in self.matching()]
+
+    def aggregation(self):
+        if not self.collection.supports_aggregation:
+            raise AttributeError("'Query' object has no attribute 'count'")
+        return FakeAggregationQuery(self)
+
+    def count(self, alias=None):
+        return self.aggregation().count(alias)
+
+    def sum(self, field, alias=None):
+        return self.aggregation().sum(field, alias)
+
+    def avg(self, field, alias=None):
+        return self.aggregation().avg(field, alias)
+
+
+class FakeCollection(FakeQuery):
+    def __init__(self, docs, supports_aggregation=True):
+        super().__init__(self)
+        self.docs = docs
+        self.supports_aggregation = supports_aggregation
+        self.aggregation_calls = 0
+        self.streamed = 0
+
+    def document(self):
+        return SimpleNamespace(id='new', set=lambda data, timeout=None: self.docs.append(data))
+
+
+def make_connection(collection):
+    connection = FirebaseConnection()
+    connection.db = SimpleNamespace(collection=lambda name: collection)
+    connection.is_initialized = True
+    return connection
+
+
+DOCS = [
+    {'year': 'Final', 'rating': 4},
+    {'year': 'Final', 'rating': 2},
+    {'year': '1st', 'rating': '5'},
+]
+
+
+def test_aggregate_runs_server_side_and_caches():
+    collection = FakeCollection(DOCS)
+    connection = make_connection(collection)
+
+    result = connection.aggregate('responses', [('count', None), ('sum', 'rating'), ('avg', 'rating')])
+    assert result == {'count': 3, 'sum_rating': 6, 'avg_rating': 3.0}
+    assert connection.count_documents('responses', [('year', '==', 'Final')]) == 2
+    assert collection.streamed == 0
+
+    connection.aggregate('responses', [('count', None), ('sum', 'rating'), ('avg', 'rating')])
+    assert collection.aggregation_calls == 2
+
+
+def test_aggregate_cache_is_bounded_and_cleared_by_writes():
+    collection = FakeCollection(list(DOCS))
+    connection = make_connection(collection)
+    connection._aggregate_cache.max_entries = 2
+
+    for year in ['Final', '1st', '2nd']:
+        connection.count_documents('responses', [('year', '==', year)])
+    assert connection.cache_stats()['aggregates']['entries'] == 2
+    assert connection.cache_stats()['aggregates']['evictions'] == 1
+
+    assert connection.count_documents('responses') == 3
+    connection.add_document('responses', {'year': 'Final', 'rating': 5})
+    assert connection.count_documents('responses') == 4
+    assert collection.aggregation_calls == 5
+
+
+def test_aggregate_falls_back_to_streaming():
+    collection = FakeCollection(DOCS, supports_aggregation=False)
+    connection = make_connection(collection)
+
+    assert connection.count_documents('responses') == 3
+    assert connection.average_field('responses', 'rating', [('year', '==', '1st')]) is None
+    assert connection.sum_field('responses', 'rating') == 6
+    assert collection.streamed == 3
+
+
+def test_streamed_aggregates_match_the_server():
+    docs = DOCS + [{'year': '2nd', 'rating': 3.5}, {'year': '2nd', 'rating': True}, {'year': '3rd'}]
+    aggregations = [('count', None), ('sum', 'rating'), ('avg', 'rating')]
+    server = make_connection(FakeCollection(docs))
+    fallback = make_connection(FakeCollection(docs, supports_aggregation=False))
+
+    for year in [None, 'Final', '1st', '2nd', '3rd', 'none']:
+        filters = [('year', '==', year)] if year else None
+        assert fallback.aggregate('responses', aggregations, filters) == server.aggregate('responses', aggregations, filters)
+    assert fallback.aggregate('responses', aggregations, [('year', '==', '3rd')]) == {
+        'count': 1, 'sum_rating': 0, 'avg_rating': None}
+
+
+class FakeSnapshot:
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self.exists = data is not None
+        self.data = data
+
+    def to_dict(self):
+        return dict(self.data)
+
+
+class FakePagedQuery:
+    def __init__(self, collection, orders=(), page_limit=None, cursor=None):
+        self.collection = collection
+        self.orders = list(orders)
+        self.page_limit = page_limit
+        self.cursor = cursor
+
+    def order_by(self, field):
+        return FakePagedQuery(self.collection, self.orders + [field], self.page_limit, self.cursor)
+
+    def limit(self, count):
+        return FakePagedQuery(self.collection, self.orders, count, self.cursor)
+
+    def start_after(self, snapshot):
+        return FakePagedQuery(self.collection, self.orders, self.page_limit, snapshot)
+
+    def key(self, snapshot):
+        return tuple(snapshot.id if field == '__name__' else snapshot.data[field] for field in self.orders)
+
+    def stream(self, timeout=None):
+        self.collection.pages_read += 1
+        snapshots = [
+            FakeSnapshot(doc_id, data) for doc_id, data in self.collection.docs.items()
+            if all(field == '__name__' or field in data for field in self.orders)
+        ]
+        snapshots.sort(key=self.key)
+        if self.cursor is not None:
+            snapshots = [snapshot for snapshot in snapshots if self.key(snapshot) > self.key(self.cursor)]
+        return snapshots[:self.page_limit]
+
+
+class FakePagedCollection(FakePagedQuery):
+    def __init__(self, docs):
+        super().__init__(self)
+        self.docs = docs
+        self.pages_read = 0
+
+    def document(self, doc_id):
+        return SimpleNamespace(get=lambda timeout=None: FakeSnapshot(doc_id, self.docs.get(doc_id)))
+
+
+def make_paged_connection():
+    docs = {f'doc{i}': {'createdAt': i // 2, 'help': ['mentors', 'events'] if i % 2 else 'mentors'} for i in range(7)}
+    docs['no-timestamp'] = {'help': 'events'}
+    collection = FakePagedCollection(docs)
+    return make_connection(collection), collection
+
+
+def test_iter_pages_walks_the_collection_with_cursors():
+    connection, collection = make_paged_connection()
+
+    pages = list(connection.iter_pages('responses', page_size=3))
+    assert [[doc['id'] for doc in page] for page in pages] == [
+        ['doc0', 'doc1', 'doc2'], ['doc3', 'doc4', 'doc5'], ['doc6'],
+    ]
+    assert collection.pages_read == 3
+
+    resumed = [doc['id'] for doc in connection.iter_documents('responses', page_size=3, start_after='doc3')]
+    assert resumed == ['doc4', 'doc5', 'doc6']
+
+    every_doc = [doc['id'] for doc in connection.iter_documents('responses', page_size=3, order_by=None)]
+    assert len(every_doc) == 8 and 'no-timestamp' in every_doc
+
+
+def test_iter_pages_raises_when_a_page_fails(monkeypatch):
+    connection, collection = make_paged_connection()
+    read_page = FakePagedQuery.stream
+
+    def stream(query, timeout=None):
+        if query.cursor is not None:
+            raise google_exceptions.PermissionDenied('Missing or insufficient permissions')
+        return read_page(query, timeout)
+
+    monkeypatch.setattr(FakePagedQuery, 'stream', stream)
+    pages = connection.iter_pages('responses', page_size=3)
+    assert len(next(pages)) == 3
+    with pytest.raises(google_exceptions.PermissionDenied):
+        next(pages)
+
+
+def test_iter_pages_yields_dataframes_and_arrow_tables():
+    connection, _ = make_paged_connection()
+
+    frames = list(connection.iter_pages('responses', page_size=4, page_format='pandas'))
+    assert [len(frame) for frame in frames] == [4, 3]
+    assert list(frames[0]['id']) == ['doc0', 'doc1', 'doc2', 'doc3']
+
+    tables = list(connection.iter_pages('responses', page_size=4, page_format='arrow'))
+    assert sum(table.num_rows for table in tables) == 7
+    assert tables[0].schema.metadata[b'json_columns'] == b'["help"]'
+
+
+class FakeBatch:
+    def __init__(self, store):
+        self.store = store
+        self.writes = []
+
+    def set(self, doc_ref, data):
+        self.writes.append(('set', doc_ref.id, data))
+
+    def update(self, doc_ref, data):
+        self.writes.append(('update', doc_ref.id, data))
+
+    def delete(self, doc_ref):
+        self.writes.append(('delete', doc_ref.id, None))
+
+    def commit(self, timeout=None):
+        self.store.commits.append(len(self.writes))
+        if self.store.contention:
+            self.store.contention -= 1
+            raise google_exceptions.Aborted('Too much contention on these documents')
+        for operation, doc_id, _ in self.writes:
+            if operation == 'update' and doc_id not in self.store.docs:
+                raise google_exceptions.NotFound(f'No document to update: {doc_id}')
+        for operation, doc_id, data in self.writes:
+            if operation == 'delete':
+                self.store.docs.pop(doc_id, None)
+            else:
+                self.store.docs[doc_id] = {**self.store.docs.get(doc_id, {}), **data}
+
+
+class FakeWriteStore:
+    def __init__(self, docs=None, contention=0):
+        self.docs = dict(docs or {})
+        self.contention = contention
+        self.commits = []
+        self.ids = itertools.count()
+
+    def collection(self, name):
+        return SimpleNamespace(document=self.document)
+
+    def document(self, doc_id=None):
+        return SimpleNamespace(id=doc_id if doc_id is not None else f'auto{next(self.ids)}')
+
+    def batch(self):
+        return FakeBatch(self)
+
+
+def make_write_connection(store):
+    connection = FirebaseConnection(retry_policy=RetryPolicy(breaker=CircuitBreaker(), sleep=lambda seconds: None))
+    connection.db = store
+    connection.is_initialized = True
+    return connection
+
+
+def test_bulk_add_splits_into_batches_and_retries_contention():
+    store = FakeWriteStore(contention=2)
+    connection = make_write_connection(store)
+
+    report = connection.bulk_add('responses', [{'year': 'Final'}] * 1200, max_in_flight=1)
+
+    assert report['succeeded'] == 1200 and report['failed'] == 0
+    assert len(store.docs) == 1200
+    assert store.commits == [500, 500, 500, 500, 200]
+    assert all('createdAt' in doc for doc in store.docs.values())
+
+
+def test_bulk_add_keeps_the_items_own_created_at():
+    store = FakeWriteStore()
+    connection = make_write_connection(store)
+    submitted = datetime(2025, 3, 8)
+
+    connection.bulk_add('responses', [{'year': 'Final', 'createdAt': submitted}, {'year': '1st'}])
+
+    assert store.docs['auto0']['createdAt'] == submitted
+    assert store.docs['auto1']['createdAt'] > submitted
+
+    connection.is_initialized = False
+    assert connection.bulk_write([('delete', store.document('auto0'), None)]) is None
+    assert len(store.docs) == 2
+
+
+def test_bulk_update_reports_failures_per_item():
+    store = FakeWriteStore({'a': {'year': '1st'}, 'c': {'year': '2nd'}})
+    connection = make_write_connection(store)
+
+    report = connection.bulk_update('responses', {'a': {'year': '2nd'}, 'b': {'year': '3rd'}, 'c': {'year': '3rd'}})
+
+    assert [(result['id'], result['success']) for result in report['results']] == [('a', True), ('b', False), ('c', True)]
+    assert 'No document to update' in report['results'][1]['error']
+    assert store.docs['a']['year'] == '2nd' and store.docs['c']['year'] == '3rd'
+
+    report = connection.bulk_delete('responses', ['a', 'c'])
+    assert report['succeeded'] == 2 and store.docs == {}
+
+
+class FakeMultiGetStore:
+    def __init__(self, docs):
+        self.docs = docs
+        self.get_all_calls = []
+
+    def collection(self, name):
+        return SimpleNamespace(document=lambda doc_id: SimpleNamespace(id=doc_id, update=lambda data, timeout=None: None))
+
+    def get_all(self, refs, timeout=None):
+        self.get_all_calls.append([ref.id for ref in refs])
+        # Firestore returns snapshots in no particular order
+        return [FakeSnapshot(ref.id, self.docs.get(ref.id)) for ref in reversed(refs)]
+
+
+def test_get_documents_batches_lookups_and_reports_missing_ids():
+    store = FakeMultiGetStore({f'doc{i}': {'year': 'Final'} for i in range(5)})
+    connection = make_write_connection(store)
+
+    result = connection.get_documents('responses', ['doc3', 'gone', 'doc0', 'doc1', 'doc3'], chunk_size=2)
+
+    assert list(result['found']) == ['doc3', 'doc0', 'doc1']
+    assert result['found']['doc0'] == {'year': 'Final', 'id': 'doc0'}
+    assert result['missing'] == ['gone']
+    assert store.get_all_calls == [['doc3', 'gone'], ['doc0', 'doc1']]
+
+    # Cached documents are not fetched again, until they are updated
+    connection.update_document('responses', 'doc0', {'year': '3rd'})
+    result = connection.get_documents('responses', ['doc0', 'doc1', 'doc4'])
+    assert list(result['found']) == ['doc0', 'doc1', 'doc4']
+    assert store.get_all_calls[2:] == [['doc0', 'doc4']]
+
+
+def test_get_document_data_is_served_from_the_cache_until_deleted():
+    store = FakeMultiGetStore({'doc0': {'year': 'Final'}})
+    reads = []
+    store.collection = lambda name: SimpleNamespace(document=lambda doc_id: SimpleNamespace(
+        get=lambda timeout=None: reads.append(doc_id) or FakeSnapshot(doc_id, store.docs.get(doc_id)),
+        delete=lambda timeout=None: store.docs.pop(doc_id),
+    ))
+    connection = make_write_connection(store)
+
+    first = connection.get_document_data('responses', 'doc0')
+    first['year'] = 'changed by caller'
+    assert connection.get_document_data('responses', 'doc0') == {'year': 'Final', 'id': 'doc0'}
+    assert reads == ['doc0']
+
+    connection.delete_document('responses', 'doc0')
+    assert connection.get_document_data('responses', 'doc0') is None
+    assert reads == ['doc0', 'doc0']
+    assert connection.cache_stats()['documents']['hits'] == 1
+
+
+def test_add_document_retries_with_the_same_id():
+    written = {}
+    attempts = []
+
+    def set_document(doc_id, data, timeout=None):
+        written[doc_id] = data
+        attempts.append(doc_id)
+        if len(attempts) == 1:
+            # Committed, but the answer was lost
+            raise google_exceptions.DeadlineExceeded('timed out')
+
+    store = SimpleNamespace(collection=lambda name: SimpleNamespace(document=lambda: SimpleNamespace(
+        id='picked', set=lambda data, timeout=None: set_document('picked', data, timeout))))
+    connection = make_write_connection(store)
+
+    assert connection.add_document('responses', {'year': 'Final'}) == 'picked'
+    assert attempts == ['picked', 'picked'] and list(written) == ['picked']
+
+
+class FakeWhereStore:
+    def __init__(self, docs):
+        self.docs = docs
+        self.queries = 0
+
+    def collection(self, name):
+        return SimpleNamespace(where=self.where, document=lambda: SimpleNamespace(
+            id='new', set=lambda data, timeout=None: self.docs.update(new=data)))
+
+    def where(self, field, operator, value):
+        assert operator == 'in'
+        self.queries += 1
+        return SimpleNamespace(stream=lambda timeout=None: [
+            FakeSnapshot(doc_id, data) for doc_id, data in self.docs.items() if data.get(field) in value
+        ])
+
+
+def test_query_documents_is_memoized_until_the_collection_changes():
+    store = FakeWhereStore({'a': {'year': 'Final'}, 'b': {'year': '1st'}})
+    connection = make_write_connection(store)
+
+    assert [doc['id'] for doc in connection.query_documents('responses', 'year', 'in', ['Final', '1st'])] == ['a', 'b']
+    assert len(connection.query_documents('responses', 'year', 'in', ['1st', 'Final'])) == 2
+    assert store.queries == 1
+
+    connection.add_document('responses', {'year': 'Final'})
+    assert len(connection.query_documents('responses', 'year', 'in', ['Final', '1st'])) == 3
+    assert store.queries == 2
+
+
+def test_query_documents_answers_from_the_resident_dataset():
+    from response_sync import ResponseSync
+    from test_response_sync import make_collection
+
+    collection = make_collection(4)
+    collection.docs['r0']['boys-club'] = '3'
+    response_sync = ResponseSync(collection)
+    store = FakeWhereStore({})
+    connection = make_write_connection(store)
+    connection.use_resident_dataset('responses', response_sync)
+
+    # Not loaded yet, so Firestore answers
+    connection.query_documents('responses', 'year', 'in', ['2nd'])
+    assert store.queries == 1
+
+    response_sync.sync()
+    assert [doc['id'] for doc in connection.query_documents('responses', 'year', 'in', ['2nd', 'Final'])] == ['r0', 'r1', 'r2', 'r3']
+    assert connection.query_documents('responses', 'boys-club', '==', 3) == []
+    assert [doc['id'] for doc in connection.query_documents('responses', 'boys-club', '==', '3')] == ['r0']
+    assert store.queries == 1
+
+    # A projected sync only answers queries on, and selecting, the fields it holds
+    projected = ResponseSync(collection, fields=['year'])
+    projected.sync()
+    connection.use_resident_dataset('responses', projected)
+    assert len(connection.query('responses').where('year', 'in', ['2nd']).select(['year']).get()) == 4
+    assert store.queries == 1
+    connection.query_documents('responses', 'boys-club', 'in', ['3'])
+    connection.query('responses').where('year', 'in', ['Final']).get()
+    assert store.queries == 3
+
+
+class RecordingQuery:
+    def __init__(self, calls, docs):
+        self.calls = calls
+        self.docs = docs
+
+    def __getattr__(self, name):
+        def record(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+        return record
+
+    def stream(self, timeout=None):
+        return [FakeSnapshot(doc_id, data) for doc_id, data in self.docs.items()]
+
+
+def test_compound_query_is_built_server_side():
+    calls = []
+    store = SimpleNamespace(collection=lambda name: RecordingQuery(calls, {'a': {'year': 'Final'}}))
+    connection = make_write_connection(store)
+
+    query = (connection.query('responses')
+             .where('year', '==', 'Final')
+             .where('help', 'array_contains_any', ['mentors', 'events'])
+             .order_by('createdAt', descending=True)
+             .limit(10)
+             .select(['year']))
+    assert query.get() == [{'year': 'Final', 'id': 'a'}]
+    assert [(name, args) for name, args, _ in calls] == [
+        ('where', ('year', '==', 'Final')),
+        ('where', ('help', 'array_contains_any', ['mentors', 'events'])),
+        ('order_by', ('createdAt',)),
+        ('limit', (10,)),
+        ('select', (['year'],)),
+    ]
+    assert calls[2][2] == {'direction': 'DESCENDING'}
+
+    # Same query with the 'any' list reordered comes from the cache
+    connection.query('responses').where('year', '==', 'Final') \
+        .where('help', 'array_contains_any', ['events', 'mentors']) \
+        .order_by('createdAt', descending=True).limit(10).select(['year']).get()
+    assert len(calls) == 5
+
+
+def test_compound_query_runs_on_the_resident_dataset():
+    from response_sync import ResponseSync
+    from test_response_sync import make_collection
+
+    collection = make_collection(5)
+    collection.docs['r1']['year'] = 'Final'
+    collection.docs['r3']['help'] = ['mentors']
+    collection.docs['r4']['help'] = ['events', 'mentors']
+    response_sync = ResponseSync(collection)
+    response_sync.sync()
+    connection = make_write_connection(FakeWhereStore({}))
+    connection.use_resident_dataset('responses', response_sync)
+
+    results = (connection.query('responses')
+               .where('year', 'in', ['2nd', '3rd'])
+               .where('help', 'array_contains', 'mentors')
+               .order_by('submittedAt', descending=True)
+               .limit(1)
+               .select(['year'])
+               .get())
+    assert results == [{'year': '2nd', 'id': 'r4'}]
+    assert connection.db.queries == 0
@@ -0,0 +1,119 @@
+import asyncio
+from types import SimpleNamespace
+
+from google.api_core import exceptions as google_exceptions
+
+from firebase_connection_async import AsyncFirebaseConnection
+from resilience import CircuitBreaker, RetryPolicy
+
+
+class FakeAsyncStore:
+    def __init__(self, docs, contention=0, outages=0):
+        self.docs = dict(docs)
+        self.contention = contention
+        self.outages = outages
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def request(self):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+    def collection(self, name):
+        return SimpleNamespace(document=self.document)
+
+    def document(self, doc_id='new'):
+        async def get(timeout=None):
+            await self.request()
+            if self.outages:
+                self.outages -= 1
+                raise google_exceptions.ServiceUnavailable('Firestore is restarting')
+            data = self.docs.get(doc_id)
+            return SimpleNamespace(id=doc_id, exists=data is not None, to_dict=lambda: dict(data))
+        return SimpleNamespace(id=doc_id, get=get)
+
+    def batch(self):
+        store = self
+        writes = []
+
+        async def commit(timeout=None):
+            await store.request()
+            if store.contention:
+                store.contention -= 1
+                raise google_exceptions.Aborted('Too much contention on these documents')
+            for doc_ref, data in writes:
+                store.docs[doc_ref.id] = data
+
+        return SimpleNamespace(set=lambda doc_ref, data: writes.append((doc_ref, data)), commit=commit)
+
+
+def make_connection(store, max_concurrency):
+    connection = AsyncFirebaseConnection(max_concurrency=max_concurrency, retry_policy=RetryPolicy(backoff=0))
+    connection.db = store
+    connection.is_initialized = True
+    return connection
+
+
+def test_get_documents_data_runs_concurrently_within_the_limit():
+    store = FakeAsyncStore({f'doc{i}': {'year': 'Final'} for i in range(10)})
+    connection = make_connection(store, max_concurrency=3)
+
+    results = asyncio.run(connection.get_documents_data('responses', ['doc0', 'doc5', 'missing'] + [f'doc{i}' for i in range(10)]))
+
+    assert results['doc5'] == {'year': 'Final', 'id': 'doc5'}
+    assert results['missing'] is None
+    assert store.max_in_flight == 3
+
+
+def test_bulk_write_retries_contention():
+    store = FakeAsyncStore({}, contention=1)
+    connection = make_connection(store, max_concurrency=2)
+    operations = [('set', SimpleNamespace(id=f'doc{i}'), {'year': '2nd'}) for i in range(5)]
+
+    report = asyncio.run(connection.bulk_write(operations, batch_size=2))
+
+    assert report['succeeded'] == 5 and report['failed'] == 0
+    assert sorted(store.docs) == [f'doc{i}' for i in range(5)]
+    assert store.max_in_flight <= 2
+
+
+def test_reads_are_retried_and_guarded_by_the_breaker():
+    store = FakeAsyncStore({'doc1': {'year': 'Final'}}, outages=2)
+    connection = make_connection(store, max_concurrency=2)
+
+    assert asyncio.run(connection.get_document_data('responses', 'doc1')) == {'year': 'Final', 'id': 'doc1'}
+    assert store.outages == 0
+
+    store.outages = 10
+    connection.retry_policy = RetryPolicy(max_retries=1, backoff=0, breaker=CircuitBreaker(failure_threshold=2))
+    assert asyncio.run(connection.get_document_data('responses', 'doc1')) is None
+    # The breaker is open now, so the next read fails without reaching Firestore
+    assert asyncio.run(connection.test_connection()) is False
+    assert store.outages == 8
+
+
+class FakeAsyncQuery:
+    def __init__(self, docs, wheres):
+        self.docs = docs
+        self.wheres = wheres
+
+    def where(self, field, operator, value):
+        self.wheres.append((field, operator, value))
+        return FakeAsyncQuery({doc_id: data for doc_id, data in self.docs.items() if data.get(field.strip('`')) == value},
+                              self.wheres)
+
+    async def stream(self, timeout=None):
+        for doc_id, data in self.docs.items():
+            yield SimpleNamespace(id=doc_id, to_dict=lambda data=data: dict(data))
+
+
+def test_query_documents_quotes_fields_like_the_sync_connection():
+    wheres = []
+    docs = {'a': {'boys-club': '4'}, 'b': {'boys-club': '2'}}
+    store = SimpleNamespace(collection=lambda name: FakeAsyncQuery(docs, wheres))
+    connection = make_connection(store, max_concurrency=2)
+
+    assert asyncio.run(connection.query_documents('responses', 'boys-club', '==', '4')) == [{'boys-club': '4', 'id': 'a'}]
+    assert wheres == [('`boys-club`', '==', '4')]
@@ -0,0 +1,156 @@
+"""
+Tests for the real-time responses listener, driven by a fake change feed
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from response_listener import ResponseListener
+from response_sync import ResponseSync
+from test_response_sync import FakeCollection, FakeDoc, make_collection, START
+
+
+class FakeChangeType:
+    def __init__(self, name):
+        self.name = name
+
+
+class FakeChange:
+    def __init__(self, name, doc):
+        self.type = FakeChangeType(name)
+        self.document = doc
+
+
+class FakeWatch:
+    def __init__(self):
+        self.is_active = True
+
+    def unsubscribe(self):
+        self.is_active = False
+
+
+class FeedCollection(FakeCollection):
+    """FakeCollection that records on_snapshot callbacks so tests can push changes"""
+
+    def __init__(self):
+        super().__init__()
+        # (scope, callback, watch); scope is (field, mark) or None for the whole collection
+        self.watches = []
+
+    def on_snapshot(self, callback, scope=None):
+        watch = FakeWatch()
+        self.watches.append((scope, callback, watch))
+        return watch
+
+    def where(self, field, operator, value):
+        query = super().where(field, operator, value)
+        query.on_snapshot = lambda callback: self.on_snapshot(callback, (field, value))
+        return query
+
+    def push(self, *changes):
+        """Deliver changes through the first active watch"""
+        callback = next(callback for _, callback, watch in self.watches if watch.is_active)
+        callback([], list(changes), datetime.now(timezone.utc))
+
+
+def start_listener(count=3):
+    collection = FeedCollection()
+    collection.docs = make_collection(count).docs
+    response_sync = ResponseSync(collection)
+    response_sync.sync()
+    notified = []
+    listener = ResponseListener(collection, response_sync, on_change=lambda: notified.append(True))
+    assert listener.start()
+    return collection, response_sync, listener, notified
+
+
+def test_initial_snapshot_of_known_documents_changes_nothing():
+    collection, response_sync, listener, notified = start_listener()
+    version = response_sync.version
+
+    collection.push(*[FakeChange('ADDED', FakeDoc(doc_id, data)) for doc_id, data in collection.docs.items()])
+
+    assert response_sync.version == version
+    assert notified == []
+    assert listener.is_healthy()
+
+
+def test_adds_modifies_and_removes_are_applied():
+    collection, response_sync, listener, notified = start_listener()
+
+    collection.push(
+        FakeChange('ADDED', FakeDoc('new', {'year': 'Final', 'submittedAt': START + timedelta(days=1)})),
+        FakeChange('MODIFIED', FakeDoc('r0', {'year': '3rd', 'submittedAt': START})),
+        FakeChange('REMOVED', FakeDoc('r1', {})),
+    )
+
+    df = response_sync.df
+    assert set(df['id']) == {'r0', 'r2', 'new'}
+    assert df.loc[df['id'] == 'r0', 'year'].item() == '3rd'
+    assert listener.changes_applied == 3
+    assert notified == [True]
+    assert listener.health()['lag_seconds'] is not None
+
+
+def test_errors_mark_the_listener_unhealthy():
+    collection, response_sync, listener, notified = start_listener()
+
+    collection.push(FakeChange('ADDED', None))
+
+    assert listener.errors == 1
+    assert not listener.is_healthy()
+
+    listener.stop()
+    assert not listener.is_running
+
+
+def test_one_listener_feeds_several_syncs():
+    collection, response_sync, listener, notified = start_listener()
+    text_sync = ResponseSync(collection, fields=['advice'])
+    text_sync.sync()
+    text_notified = []
+    listener.subscribe(text_sync, lambda: text_notified.append(True))
+
+    collection.push(FakeChange('ADDED', FakeDoc('new', {'year': 'Final', 'advice': 'Speak up', 'submittedAt': START})))
+
+    assert 'new' in set(response_sync.df['id']) and 'new' in set(text_sync.df['id'])
+    assert 'year' not in text_sync.df.columns
+    assert notified == [True] and text_notified == [True]
+
+
+def test_a_sync_subscribed_twice_is_updated_once_and_notifies_both():
+    collection, response_sync, listener, notified = start_listener()
+    text_notified = []
+    listener.subscribe(response_sync, lambda: text_notified.append(True))
+    version = response_sync.version
+
+    collection.push(FakeChange('ADDED', FakeDoc('new', {'year': 'Final', 'submittedAt': START})))
+
+    assert len(listener.subscribers) == 1
+    assert response_sync.version == version + 1 and listener.changes_applied == 1
+    assert notified == [True] and text_notified == [True]
+
+
+def test_listener_only_watches_documents_from_the_sync_watermarks():
+    collection, response_sync, listener, notified = start_listener(5)
+    newest = START + timedelta(minutes=4)
+
+    # updatedAt has no mark of its own and borrows the newest one
+    assert [scope for scope, _, _ in collection.watches] == [
+        ('createdAt', newest), ('submittedAt', newest), ('updatedAt', newest)]
+    assert listener.health()['scope'] == ['createdAt', 'submittedAt', 'updatedAt']
+
+    # Before the first sync there are no marks: the whole collection is watched
+    unsynced = ResponseListener(collection, ResponseSync(collection))
+    unsynced.start()
+    assert collection.watches[-1][0] is None
+
+
+def test_closed_watches_are_restarted_from_the_current_marks():
+    collection, response_sync, listener, notified = start_listener()
+    collection.push(FakeChange('ADDED', FakeDoc('new', {'year': 'Final', 'submittedAt': START + timedelta(days=1)})))
+    collection.watches[0][2].is_active = False
+    assert not listener.is_healthy()
+
+    assert listener.start()
+    assert len(collection.watches) == 6 and all(not watch.is_active for _, _, watch in collection.watches[:3])
+    assert collection.watches[-2][0] == ('submittedAt', START + timedelta(days=1))
@@ -0,0 +1,251 @@
+"""
+Tests for the incremental responses sync, run against an in-memory fake collection
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from response_sync import ResponseSync
+
+
+class FakeDoc:
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data)
+
+
+class FakeQuery:
+    def __init__(self, collection, predicate=lambda data: True, fields=None, orders=(), page_limit=None, cursor=None):
+        self.collection = collection
+        self.predicate = predicate
+        self.fields = fields
+        self.orders = tuple(orders)
+        self.page_limit = page_limit
+        self.cursor = cursor
+
+    def _copy(self, **changes):
+        state = dict(predicate=self.predicate, fields=self.fields, orders=self.orders,
+                     page_limit=self.page_limit, cursor=self.cursor)
+        state.update(changes)
+        return FakeQuery(self.collection, **state)
+
+    def select(self, fields):
+        self.collection.selected = list(fields)
+        return self._copy(fields=[field.strip('`') for field in fields])
+
+    def where(self, field, operator, value):
+        assert operator == '>='
+        # Like Firestore, a range filter only matches values of the same type
+        return self._copy(predicate=lambda data: self.predicate(data) and field in data
+                          and isinstance(data[field], type(value)) and data[field] >= value)
+
+    def order_by(self, field):
+        # Ordering on a field skips documents without it
+        return self._copy(orders=self.orders + (field,))
+
+    def limit(self, count):
+        return self._copy(page_limit=count)
+
+    def start_after(self, doc):
+        return self._copy(cursor=doc)
+
+    def _key(self, doc_id, data):
+        return tuple(doc_id if field == '__name__' else data[field] for field in self.orders)
+
+    def stream(self, timeout=None):
+        self.collection.streamed += 1
+        if self.collection.fail_after is not None and self.collection.streamed > self.collection.fail_after:
+            raise RuntimeError('stream broke')
+        matches = sorted(
+            (self._key(doc_id, data), doc_id, data) for doc_id, data in list(self.collection.docs.items())
+            if self.predicate(data) and all(field == '__name__' or field in data for field in self.orders)
+        )
+        if self.cursor is not None:
+            cursor_key = self._key(self.cursor.id, self.collection.docs[self.cursor.id])
+            matches = [match for match in matches if match[0] > cursor_key]
+        for _, doc_id, data in matches[:self.page_limit]:
+            self.collection.reads += 1
+            if self.fields is not None:
+                data = {key: value for key, value in data.items() if key in self.fields}
+            yield FakeDoc(doc_id, data)
+
+
+class FakeCollection(FakeQuery):
+    """Just enough of a Firestore CollectionReference for ResponseSync"""
+
+    def __init__(self):
+        super().__init__(self)
+        self.docs = {}
+        self.reads = 0
+        self.streamed = 0
+        self.fail_after = None
+
+
+START = datetime(2025, 8, 1, tzinfo=timezone.utc)
+
+
+def make_collection(count):
+    collection = FakeCollection()
+    for i in range(count):
+        collection.docs[f"r{i}"] = {'year': '2nd', 'submittedAt': START + timedelta(minutes=i)}
+    return collection
+
+
+def test_initial_sync_loads_everything():
+    collection = make_collection(5)
+    response_sync = ResponseSync(collection)
+
+    assert response_sync.sync() == 5
+    assert len(response_sync.df) == 5
+    assert set(response_sync.df['id']) == {f"r{i}" for i in range(5)}
+    assert response_sync.high_water_marks['submittedAt'] == START + timedelta(minutes=4)
+    # Missing createdAt is still filled in for the dashboard
+    assert response_sync.df['createdAt'].notna().all()
+
+
+def test_refresh_only_reads_the_delta():
+    collection = make_collection(100)
+    response_sync = ResponseSync(collection)
+    response_sync.sync()
+    version = response_sync.version
+
+    collection.reads = 0
+    assert response_sync.sync() == 0
+    # Only the boundary document is re-read, and it does not bump the version
+    assert collection.reads == 1
+    assert response_sync.version == version
+
+    collection.docs['new'] = {'year': 'Final', 'submittedAt': START + timedelta(days=1)}
+    collection.reads = 0
+    assert response_sync.sync() == 1
+    assert collection.reads == 2
+    assert len(response_sync.df) == 101
+    assert response_sync.version == version + 1
+
+
+def test_changed_documents_replace_their_row():
+    collection = make_collection(3)
+    response_sync = ResponseSync(collection)
+    response_sync.sync()
+
+    collection.docs['r0'] = dict(collection.docs['r0'], year='Final', updatedAt=START + timedelta(days=2))
+    assert response_sync.sync() == 1
+
+    df = response_sync.df
+    assert len(df) == 3
+    assert df.loc[df['id'] == 'r0', 'year'].item() == 'Final'
+
+
+def test_documents_without_watermarks_need_a_reset():
+    collection = make_collection(2)
+    response_sync = ResponseSync(collection)
+    response_sync.sync()
+
+    collection.docs['legacy'] = {'year': '1st'}
+    assert response_sync.sync() == 0
+
+    response_sync.reset()
+    assert response_sync.sync() == 3
+    assert 'legacy' in set(response_sync.df['id'])
+
+
+def test_string_timestamps_are_not_re_read_on_every_sync():
+    collection = make_collection(0)
+    for i in range(50):
+        collection.docs[f"r{i}"] = {'year': '2nd', 'submittedAt': (START + timedelta(minutes=i)).isoformat()}
+    response_sync = ResponseSync(collection)
+    response_sync.sync()
+    assert response_sync.delta_marks() == {}
+
+    collection.reads = collection.streamed = 0
+    assert response_sync.sync() == 0
+    assert collection.reads == 0 and collection.streamed == 0
+
+
+def test_projected_sync_only_downloads_its_fields():
+    collection = make_collection(3)
+    for data in collection.docs.values():
+        data['held-back-report'] = 'a long story'
+    response_sync = ResponseSync(collection, fields=['year'])
+
+    response_sync.sync()
+    assert collection.selected == ['year', 'createdAt', 'submittedAt', 'updatedAt']
+    assert 'held-back-report' not in response_sync.df.columns
+
+    # Whole documents pushed in (e.g. by a listener) are trimmed too
+    response_sync.apply_changes([FakeDoc('new', {'year': 'Final', 'held-back-report': 'x', 'submittedAt': START})])
+    assert 'held-back-report' not in response_sync.df.columns
+    assert response_sync.covers(['year']) and not response_sync.covers(['held-back-report'])
+
+
+def test_sync_reads_pages_and_keeps_nothing_from_a_failed_download():
+    collection = make_collection(7)
+    response_sync = ResponseSync(collection, page_size=3)
+    collection.fail_after = 2
+
+    try:
+        response_sync.sync()
+    except RuntimeError:
+        pass
+    assert not response_sync.is_loaded and response_sync.df.empty
+    assert response_sync.high_water_marks['submittedAt'] is None
+
+    collection.fail_after = None
+    collection.streamed = 0
+    assert response_sync.sync() == 7
+    assert collection.streamed == 3
+
+
+def test_required_fields_are_downloaded_once_then_share_the_deltas():
+    collection = make_collection(4)
+    for data in collection.docs.values():
+        data['advice'] = 'Speak up'
+    response_sync = ResponseSync(collection, fields=['year'])
+    response_sync.sync()
+    assert 'advice' not in response_sync.df.columns
+
+    response_sync.require(['advice', 'year'])
+    assert response_sync.pending_fields == ('advice',)
+    collection.reads = 0
+    assert response_sync.sync() == 4
+    # The boundary document of the delta, then only the new field of every document
+    assert collection.selected == ['advice'] and collection.reads == 1 + 4
+    assert set(response_sync.df['advice']) == {'Speak up'} and set(response_sync.df['year']) == {'2nd'}
+    assert response_sync.covers(['year', 'advice']) and response_sync.pending_fields == ()
+
+    collection.docs['new'] = {'year': 'Final', 'advice': 'Ask for help', 'submittedAt': START + timedelta(days=1)}
+    collection.reads = 0
+    assert response_sync.sync() == 1
+    assert collection.reads == 2
+    df = response_sync.df
+    assert df.loc[df['id'] == 'new', ['year', 'advice']].values.tolist() == [['Final', 'Ask for help']]
+
+    # A second caller right after does not repeat the delta
+    collection.reads = 0
+    assert response_sync.sync(max_age=60) == 0 and collection.reads == 0
+
+
+def test_validation_report_only_counts_new_values():
+    from survey_schema import normalize_responses
+
+    collection = make_collection(4)
+    for data in collection.docs.values():
+        data['equal-chances'] = '9'
+        data['advice'] = 'Speak up'
+    response_sync = ResponseSync(collection, normalize=normalize_responses, fields=['equal-chances'])
+    response_sync.sync()
+    assert response_sync.validation_report == {'equal-chances': {'9': 4}}
+
+    # Widening the projection re-normalizes the rows without recounting them
+    response_sync.require(['advice'])
+    response_sync.sync()
+    assert set(response_sync.df['advice']) == {'Speak up'}
+    assert response_sync.validation_report == {'equal-chances': {'9': 4}}
+
+    # An edited answer counts, a re-read unchanged one does not
+    collection.docs['r3'].update({'equal-chances': '0', 'submittedAt': START + timedelta(days=1)})
+    collection.docs['r2']['submittedAt'] = START + timedelta(days=1)
+    response_sync.sync()
+    assert response_sync.validation_report == {'equal-chances': {'9': 4, '0': 1}}
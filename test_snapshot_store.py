@@ -0,0 +1,63 @@
+from datetime import datetime, timezone
+import os
+
+import pandas as pd
+import pyarrow as pa
+
+import snapshot_store
+from snapshot_store import SnapshotStore
+
+
+def make_frame():
+    return pd.DataFrame([
+        {'id': 'r1', 'year': 'Final', 'boys-club': 4, 'help': ['women-mentors', 'not-sure'],
+         'submittedAt': datetime(2025, 8, 1, 9, tzinfo=timezone.utc)},
+        {'id': 'r2', 'year': '2nd', 'boys-club': 2, 'help': 'late-night-access',
+         'submittedAt': datetime(2025, 8, 2, 18, tzinfo=timezone.utc)},
+    ])
+
+
+def test_snapshot_round_trip(tmp_path):
+    store = SnapshotStore(str(tmp_path / 'responses.arrow'))
+    df = make_frame()
+    marks = {'submittedAt': datetime(2025, 8, 2, 18, tzinfo=timezone.utc), 'updatedAt': None}
+
+    assert store.save(df, marks, version=7, fields=['year', 'help'])
+    snapshot = SnapshotStore(store.path).load()
+
+    pd.testing.assert_frame_equal(snapshot.df, df)
+    # Mixed list/str answers come back as they went in, not as arrays
+    assert snapshot.df['help'].tolist() == [['women-mentors', 'not-sure'], 'late-night-access']
+    assert snapshot.high_water_marks == marks
+    assert snapshot.version == 7
+    assert snapshot.fields == ['year', 'help']
+    assert snapshot.saved_at is not None
+
+
+def test_snapshot_from_another_schema_version_is_ignored(tmp_path, monkeypatch):
+    store = SnapshotStore(str(tmp_path / 'responses.arrow'))
+    monkeypatch.setattr(snapshot_store, 'SNAPSHOT_SCHEMA_VERSION', snapshot_store.SNAPSHOT_SCHEMA_VERSION - 1)
+    assert store.save(make_frame(), {}, version=3)
+    monkeypatch.undo()
+
+    assert store.exists()
+    assert store.load() is None
+
+
+def test_failed_write_leaves_the_previous_snapshot_in_place(tmp_path, monkeypatch):
+    store = SnapshotStore(str(tmp_path / 'responses.arrow'))
+    assert store.save(make_frame(), {}, version=1)
+
+    def write_half_then_fail(sink, schema):
+        sink.write(b'ARROW1\x00\x00partial')
+        raise OSError("disk full")
+
+    monkeypatch.setattr(pa.ipc, 'new_file', write_half_then_fail)
+    assert not store.save(make_frame().head(1), {}, version=2)
+    monkeypatch.undo()
+    assert store.saved_version == 1
+
+    assert os.listdir(tmp_path) == ['responses.arrow']  # no temp file left behind
+    snapshot = store.load()
+    assert snapshot.version == 1
+    assert len(snapshot.df) == 2
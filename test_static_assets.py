@@ -0,0 +1,39 @@
+import os
+
+import static_assets
+
+
+def test_asset_url_is_versioned_by_content(tmp_path, monkeypatch):
+    monkeypatch.setattr(static_assets, 'STATIC_DIR', str(tmp_path))
+    css = tmp_path / 'dashboard.css'
+    css.write_text('.tc { text-align: center !important; }')
+    url = static_assets.asset_url('dashboard.css')
+    assert url.startswith('app/static/dashboard.css?v=')
+    assert static_assets.asset_url('dashboard.css') == url
+
+    css.write_text('.tc { text-align: left !important; }')
+    os.utime(css, ns=(0, os.stat(css).st_mtime_ns + 1))
+    assert static_assets.asset_url('dashboard.css') != url
+    assert 'left' in static_assets.read_asset('dashboard.css')
+
+
+def test_absolute_asset_url_keeps_the_app_base_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(static_assets, 'STATIC_DIR', str(tmp_path))
+    (tmp_path / 'shespeaks.mp4').write_bytes(b'\x00' * 1024)
+
+    url = static_assets.absolute_asset_url('https://example.com/dashboard', 'shespeaks.mp4')
+    assert url.startswith('https://example.com/dashboard/app/static/shespeaks.mp4?v=')
+    assert static_assets.absolute_asset_url('http://localhost:8501/', 'shespeaks.mp4').startswith(
+        'http://localhost:8501/app/static/shespeaks.mp4?v=')
+
+
+def test_large_assets_are_versioned_without_reading_them(tmp_path, monkeypatch):
+    monkeypatch.setattr(static_assets, 'STATIC_DIR', str(tmp_path))
+    monkeypatch.setattr(static_assets, 'HASHED_ASSET_MAX_BYTES', 512)
+    video = tmp_path / 'shespeaks.mp4'
+    video.write_bytes(b'\x00' * 1024)
+    monkeypatch.setattr(static_assets, '_content_hash', None)  # must not be called
+
+    stat = os.stat(video)
+    assert static_assets.asset_url('shespeaks.mp4') == (
+        f"app/static/shespeaks.mp4?v={stat.st_mtime_ns:x}-{stat.st_size:x}")
@@ -0,0 +1,90 @@
+import pandas as pd
+import pytest
+
+from survey_aggregates import compute_aggregates, explode_help, help_indicators
+from survey_schema import normalize_responses
+
+
+def make_responses():
+    return pd.DataFrame({
+        'year': ['Final', 'Final', '2nd', None],
+        'course': ['CSE', 'CSE', 'IT', None],
+        'judged': ['multiple', 'not-really', 'sometimes', None],
+        'voice': ['heard', 'heard', 'ignored', None],
+        'curfews': ['sometimes', 'never', 'sometimes', 'rarely'],
+        'boys-club': ['4', '2', 'x', None],
+        'help': [['women-mentors', 'late-night-access'], 'women-mentors, anonymous-reporting', None, []],
+        'createdAt': pd.to_datetime(['2025-08-01 10:00', '2025-08-03 09:00', '2025-08-04 12:00', '2025-07-20 08:00']),
+    })
+
+
+def test_compute_aggregates_on_a_small_frame():
+    aggregates = compute_aggregates(make_responses())
+
+    assert aggregates['total_responses'] == 4
+    # 'x' is not a number and missing questions are left out
+    assert aggregates['mood_questions'] == ['boys-club']
+    assert aggregates['mood_means'] == {'boys-club': 3.0}
+    assert aggregates['avg_mood'] == 3.0
+
+    assert aggregates['value_counts']['year'].to_dict() == {'Final': 2, '2nd': 1}
+    assert aggregates['value_counts']['stepped-back'].empty
+    assert aggregates['unique_courses'] == 2 and aggregates['unique_years'] == 2
+    assert aggregates['final_year_curfews'].to_dict() == {'sometimes': 1, 'never': 1}
+    assert aggregates['other_years_curfews'].to_dict() == {'sometimes': 1, 'rarely': 1}
+    assert aggregates['judged_pct'] == pytest.approx(200 / 3)
+
+    assert aggregates['help_counts'].to_dict() == {'women-mentors': 2, 'late-night-access': 1, 'anonymous-reporting': 1}
+    assert aggregates['help_percentages']['women-mentors'] == 50.0
+    assert aggregates['help_answered'] == 3  # the empty list counts as answered
+    assert aggregates['top_help'] == 'women-mentors'
+    assert aggregates['help_by_voice'].loc['heard'].to_dict() == {
+        'anonymous-reporting': 1, 'late-night-access': 1, 'women-mentors': 2,
+    }
+    assert aggregates['help_by_voice'].loc['ignored'].sum() == 0
+    assert aggregates['recent_activity'] == 3  # Aug 1, 3 and 4
+
+
+def test_normalized_and_empty_frames_aggregate_the_same_way():
+    raw = compute_aggregates(make_responses())
+    normalized, _ = normalize_responses(make_responses())
+    aggregates = compute_aggregates(normalized)
+
+    # Declared but unpicked categories ('1st', '3rd') are not counted
+    assert aggregates['value_counts']['year'].to_dict() == raw['value_counts']['year'].to_dict()
+    assert aggregates['mood_means'] == raw['mood_means']
+    assert aggregates['judged_pct'] == raw['judged_pct']
+
+    empty = compute_aggregates(pd.DataFrame())
+    assert empty['total_responses'] == 0
+    assert empty['avg_mood'] == 0 and empty['judged_pct'] == 0
+    assert empty['help_counts'].empty and empty['top_help'] is None
+    assert empty['help_by_voice'].empty
+
+
+def test_explode_help_splits_lists_and_comma_separated_strings():
+    df = pd.DataFrame(
+        {'help': [['women-mentors', ' not-sure '], ' women-mentors , ,late-night-access', None, [], 5, '']},
+        index=['r1', 'r2', 'r3', 'r4', 'r5', 'r6'],
+    )
+
+    selections = explode_help(df)
+    assert list(selections.itertuples(index=False, name=None)) == [
+        ('r1', 'women-mentors'), ('r1', 'not-sure'), ('r2', 'women-mentors'), ('r2', 'late-night-access'),
+    ]
+
+    indicators = help_indicators(df, selections)
+    assert list(indicators.index) == ['r1', 'r2', 'r3', 'r4', 'r5', 'r6']
+    assert sorted(indicators.columns) == ['late-night-access', 'not-sure', 'women-mentors']
+    assert indicators['women-mentors'].tolist() == [True, True, False, False, False, False]
+    assert indicators.dtypes.eq(bool).all()
+    # Built from df when no selections are given
+    assert help_indicators(df).equals(indicators)
+
+
+def test_help_without_any_string_options_is_empty():
+    for df in (pd.DataFrame({'year': ['Final']}), pd.DataFrame({'help': [1, None]}), pd.DataFrame({'help': [[], []]})):
+        selections = explode_help(df)
+        assert selections.empty and list(selections.columns) == ['response', 'option']
+        indicators = help_indicators(df, selections)
+        assert list(indicators.index) == list(df.index) and indicators.columns.empty
@@ -0,0 +1,56 @@
+import pandas as pd
+
+from survey_schema import CHOICE_QUESTIONS, normalize_responses
+
+
+def make_responses():
+    return pd.DataFrame({
+        'id': ['r1', 'r2', 'r3', 'r4'],
+        'year': ['Final', ' 2nd ', '5th', ''],
+        'voice': ['heard', 'heard', 'loud', None],
+        'course': [' CSE', 'CSE', 'IT', None],
+        'boys-club': ['4', 3, '7', '2.5'],
+        'held-back': ['1', 'abc', None, 5.0],
+        'advice': ['a', 'b', 'c', 'd'],
+    })
+
+
+def test_answers_are_coerced_to_compact_dtypes():
+    df = make_responses()
+    normalized, _ = normalize_responses(df)
+
+    assert isinstance(normalized['year'].dtype, pd.CategoricalDtype)
+    assert isinstance(normalized['course'].dtype, pd.CategoricalDtype)
+    assert normalized['boys-club'].dtype == 'Int8'
+    assert normalized['held-back'].dtype == 'Int8'
+    # Columns outside the schema are left alone
+    assert normalized['advice'].tolist() == ['a', 'b', 'c', 'd']
+
+    # Declared answers first, in form order; stripped, with blanks missing
+    assert list(normalized['year'].cat.categories[:4]) == CHOICE_QUESTIONS['year']
+    assert normalized['year'].tolist()[:3] == ['Final', '2nd', '5th']
+    assert pd.isna(normalized['year'][3])
+    assert list(normalized['course'].cat.categories) == ['CSE', 'IT']
+    assert normalized['boys-club'].tolist() == [4, 3, pd.NA, pd.NA]
+    assert normalized['held-back'].tolist() == [1, pd.NA, pd.NA, 5]
+
+    # The input frame is not modified
+    assert df['year'].tolist() == ['Final', ' 2nd ', '5th', '']
+
+
+def test_validation_report_counts_answers_outside_the_schema():
+    normalized, report = normalize_responses(make_responses())
+
+    assert report == {
+        'year': {'5th': 1},
+        'voice': {'loud': 1},
+        'boys-club': {'7': 1, '2.5': 1},
+        'held-back': {'abc': 1},
+    }
+    # Unknown choices stay visible as extra categories; bad scale answers become missing
+    assert list(normalized['voice'].cat.categories) == CHOICE_QUESTIONS['voice'] + ['loud']
+    assert normalized['voice'][2] == 'loud'
+
+    # Only the rows given are reported
+    assert normalize_responses(make_responses().iloc[:2])[1] == {'held-back': {'abc': 1}}
+    assert normalize_responses(pd.DataFrame({'id': ['r1']}))[1] == {}
@@ -0,0 +1,40 @@
+from ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    cache = TTLCache(ttl=60, max_entries=2, max_bytes=100, sizeof=len)
+    cache.put('a', 'x' * 10)
+    cache.put('b', 'x' * 10)
+    assert cache.get('a') == 'x' * 10
+    cache.put('c', 'x' * 10)
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
+
+    cache.put('d', 'x' * 95)
+    assert cache.get('a') is None and cache.get('c') is None
+    assert cache.stats()['bytes'] == 95
+
+    cache.put('too-big', 'x' * 101)
+    assert cache.get('too-big') is None
+
+
+def test_entries_expire_and_hits_are_counted():
+    clock = FakeClock()
+    cache = TTLCache(ttl=10, clock=clock)
+    cache.put(('responses', 'doc1'), {'year': 'Final'})
+    assert cache.get(('responses', 'doc1')) == {'year': 'Final'}
+
+    clock.now = 10
+    assert cache.get(('responses', 'doc1')) is None
+
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['expirations'], stats['entries']) == (1, 1, 1, 0)
+    assert stats['hit_rate'] == 0.5
@@ -0,0 +1,104 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Callable, Hashable, Tuple
+
+
+def json_size(value: Any) -> int:
+    """Approximate in-memory weight of a Firestore-style value by its JSON length"""
+    return len(json.dumps(value, default=str))
+
+
+class TTLCache:
+    """Thread-safe LRU cache with per-entry expiry and entry/byte bounds
+
+    Entries expire ``ttl`` seconds after they were stored. When either
+    ``max_entries`` or ``max_bytes`` (as measured by ``sizeof``) is
+    exceeded, the least recently used entries are evicted. ``max_entries=0``
+    disables the cache. ``None`` cannot be stored; ``get`` returns it for a
+    miss.
+    """
+
+    def __init__(self, ttl: float = 60, max_entries: int = 256, max_bytes: int = 8 * 1024 * 1024,
+                 sizeof: Callable[[Any], int] = json_size, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.bytes = 0
+        # key -> (stored_at, size, value), least recently used first
+        self._entries: 'OrderedDict[Hashable, Tuple[float, int, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if it is missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.clock() - entry[0] >= self.ttl:
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def put(self, key: Hashable, value: Any):
+        """Store a value, evicting least recently used entries to stay within bounds"""
+        if value is None or self.max_entries <= 0:
+            return
+        size = self.sizeof(value)
+        with self._lock:
+            self._remove(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (self.clock(), size, value)
+            self.bytes += size
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable):
+        """Drop one entry"""
+        with self._lock:
+            self._remove(key)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]):
+        """Drop every entry whose key matches"""
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                self._remove(key)
+
+    def clear(self):
+        """Drop every entry (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0,
+                'entries': len(self._entries),
+                'bytes': self.bytes,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+            }
+
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[1]